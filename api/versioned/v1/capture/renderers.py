@@ -0,0 +1,20 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Server-Sent Events 렌더러
+
+    스트림 자체는 StreamingHttpResponse로 반환하며, 이 렌더러는 콘텐츠 협상과
+    오류 응답(권한 없음, 404 등)을 단일 error 이벤트로 렌더링하는 데 사용됩니다.
+    """
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return f"event: error\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8')
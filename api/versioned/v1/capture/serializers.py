@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 
 
@@ -8,4 +9,13 @@ class CaptureSerializer(serializers.Serializer):
         child=serializers.CharField(max_length=50),
         required=False,
         default=list
-    )
\ No newline at end of file
+    )
+
+
+class CaptureBatchSerializer(serializers.Serializer):
+    """웹 페이지 일괄 캡처 시리얼라이저"""
+    urls = serializers.ListField(
+        child=serializers.URLField(),
+        allow_empty=False,
+        max_length=settings.CAPTURE_BATCH_MAX_URLS
+    )
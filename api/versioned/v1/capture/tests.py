@@ -0,0 +1,245 @@
+import tempfile
+from unittest import mock
+
+import numpy as np
+import requests
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api.versioned.v1.utils.embeddings import vector_to_bytes
+from api.versioned.v1.utils.fingerprint import url_key
+from api.versioned.v1.utils.graph_cache import bump_graph_versions
+from api.versioned.v1.utils.graph_engine import GraphEngine
+from api.versioned.v1.utils.vector_index import VectorIndex
+from article.models import AnalysisJob, Article, ArticleConcept, ArticleProgress, ArticleRelationship
+from concept.models import Concept, ConceptRelationship
+
+
+def offline_neo4j():
+    """Neo4j를 쓸 수 없는 상태의 클라이언트 (조회는 프로세스 내 그래프 엔진으로 대체)"""
+    return mock.patch('api.versioned.v1.capture.views.get_neo4j_client', return_value=mock.Mock(graph=None))
+
+
+class ArticleGraphCacheTests(TestCase):
+    """기사 지식 그래프의 ETag/304 응답과 그래프 버전 무효화"""
+
+    def setUp(self):
+        caches['graph'].clear()
+        self.user = get_user_model().objects.create_user(username='graph-cache')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.ai = Concept.objects.create(name='인공지능')
+
+        self.engine = GraphEngine(refresh_interval=0, rebuild_interval=3600, snapshot_path='')
+        patches = [offline_neo4j(), mock.patch('api.versioned.v1.capture.views.get_graph_engine', return_value=self.engine)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def capture(self, number, concepts):
+        """분석이 끝난 기사처럼 개념을 연결하고 그래프 버전을 올림"""
+        article = Article.objects.create(user=self.user, title=f't{number}', url=f'https://example.com/{number}',
+                                         content='c')
+        ArticleConcept.objects.bulk_create([ArticleConcept(article=article, concept=concept) for concept in concepts])
+        bump_graph_versions([article.id])
+        self.engine.rebuild()
+        return article
+
+    def get_graph(self, article, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(f'/api/v1/capture/capture/{article.id}/knowledge_graph/', **headers)
+
+    def test_unchanged_graph_returns_304(self):
+        article = self.capture(1, [self.ai])
+        etag = self.get_graph(article)['ETag']
+
+        response = self.get_graph(article, etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_relationship_added_by_another_article_changes_etag(self):
+        article = self.capture(1, [self.ai])
+        first = self.get_graph(article)
+        self.assertEqual(len(first.data['nodes']), 2)
+
+        # 다른 기사 분석이 공유 개념에서 나가는 관계를 추가 (기사 그래프의 2단계 이웃이 바뀜)
+        learning = Concept.objects.create(name='강화학습')
+        ConceptRelationship.objects.create(source_concept=self.ai, target_concept=learning, relationship_type='RELATED_TO')
+        self.capture(2, [self.ai])
+
+        response = self.get_graph(article, first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        self.assertEqual(len(response.data['nodes']), 3)
+
+    def test_cold_engine_without_snapshot_answers_503_and_caches_nothing(self):
+        article = self.capture(1, [self.ai])
+
+        cold = GraphEngine(refresh_interval=0, rebuild_interval=3600, snapshot_path='')
+        with mock.patch('api.versioned.v1.capture.views.get_graph_engine', return_value=cold), \
+                mock.patch.object(cold, '_rebuild_in_background') as rebuild_in_background:
+            response = self.get_graph(article)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '5')
+        rebuild_in_background.assert_called_once_with()
+
+        # 적재된 엔진으로는 같은 버전에서도 전체 그래프를 응답 (503 중에 빈 그래프가 캐시되지 않음)
+        self.assertEqual(len(self.get_graph(article).data['nodes']), 2)
+
+
+class SimilarArticlesTests(TestCase):
+    """요약 임베딩이 유사한 내 기사 조회 (CaptureViewSet.similar)"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.index = VectorIndex('article', directory.name, nprobe=4)
+        patch = mock.patch('api.versioned.v1.capture.views.get_vector_index', return_value=self.index)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        User = get_user_model()
+        self.user, other = User.objects.create_user(username='me'), User.objects.create_user(username='other')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+        rng = np.random.default_rng(0)
+        base = rng.normal(size=16)
+
+        def article(user, number, noise):
+            vector = base + rng.normal(scale=noise, size=16)
+            return Article.objects.create(
+                user=user, title=f't{number}', url=f'https://example.com/{number}', content='c',
+                summary_embedding=vector_to_bytes(vector / np.linalg.norm(vector))
+            )
+
+        self.query = article(self.user, 0, 0.0)
+        # 다른 사용자의 기사가 더 가깝고 훨씬 많아 전체 상위 후보를 모두 차지함
+        others = [article(other, number, 0.05) for number in range(1, 41)]
+        self.mine = [article(self.user, number, 0.5) for number in range(41, 44)]
+
+        articles = [self.query, *others, *self.mine]
+        self.index.build(lambda: (
+            np.array([a.id for a in articles]),
+            np.array([a.summary_embedding_vector for a in articles], dtype=np.float32)
+        ), nlist=4)
+
+    def test_returns_callers_articles_even_when_other_users_are_closer(self):
+        response = self.client.get(f'/api/v1/capture/capture/{self.query.id}/similar/', {'k': 3})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({row['id'] for row in response.data}, {a.id for a in self.mine})
+        scores = [row['similarity_score'] for row in response.data]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_k_limits_results(self):
+        response = self.client.get(f'/api/v1/capture/capture/{self.query.id}/similar/', {'k': 2})
+        self.assertEqual(len(response.data), 2)
+
+
+class RelatedArticlesTests(TestCase):
+    """관련 기사 조회의 키셋 페이지네이션과 그래프 결과 병합 (CaptureViewSet.related_articles)"""
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username='related')
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+        self.articles = [
+            Article.objects.create(user=user, title=f't{i}', url=f'https://example.com/{i}', content='c')
+            for i in range(6)
+        ]
+        source = self.articles[0]
+        for target, score in zip(self.articles[1:4], (0.9, 0.5, 0.7)):
+            ArticleRelationship.objects.create(source_article=source, target_article=target,
+                                               relationship_type='RELATED_TO', similarity_score=score)
+
+        # 그래프 결과: 이미 관계가 있는 기사, 새 기사, 삭제된 기사
+        engine = mock.Mock()
+        engine.find_similar_articles.return_value = [
+            {'article_id': self.articles[1].id, 'common_events': 5},
+            {'article_id': self.articles[5].id, 'common_events': 3},
+            {'article_id': 999999, 'common_events': 2},
+        ]
+        patches = [offline_neo4j(), mock.patch('api.versioned.v1.capture.views.get_graph_engine', return_value=engine)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def test_pages_by_similarity_and_appends_graph_results_on_last_page(self):
+        first = self.get(f'/api/v1/capture/capture/{self.articles[0].id}/related_articles/?limit=2')
+        self.assertEqual([row['id'] for row in first['results']], [self.articles[1].id, self.articles[3].id])
+        self.assertIsNotNone(first['next'])
+
+        last = self.get(first['next'])
+        self.assertEqual([row['id'] for row in last['results']], [self.articles[2].id, self.articles[5].id])
+        self.assertEqual(last['results'][1]['similarity_score'], 0.3)
+        self.assertIsNone(last['next'])
+
+
+class BatchCaptureTests(TestCase):
+    """여러 URL 일괄 캡처 (CaptureViewSet.batch)"""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='batch')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.done = Article.objects.create(user=self.user, title='done', url='https://example.com/done',
+                                           url_key=url_key('https://example.com/done'), content='c',
+                                           processing_status='completed')
+        self.failed = Article.objects.create(user=self.user, title='failed', url='https://example.com/failed',
+                                             url_key=url_key('https://example.com/failed'), content='c',
+                                             processing_status='failed', error_message='error')
+
+        def fetch_html(url):
+            if url.endswith('/down'):
+                raise requests.ConnectionError('connection refused')
+            return url
+
+        def extract_article(html, url):
+            return {'title': url.rsplit('/', 1)[-1], 'content': '' if url.endswith('/empty') else f'본문 {url}',
+                    'source': '', 'published_date': None}
+
+        patches = [
+            mock.patch('api.versioned.v1.capture.views.fetch_html', side_effect=fetch_html),
+            mock.patch('api.versioned.v1.capture.views.extract_article', side_effect=extract_article),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_results_follow_request_order(self):
+        urls = [
+            'https://example.com/new',
+            'https://example.com/done',
+            'https://example.com/failed',
+            'https://example.com/down',
+            'https://example.com/empty',
+            'https://www.example.com/new/?utm_source=feed',  # 정규화하면 첫 URL과 같은 기사
+        ]
+        response = self.client.post('/api/v1/capture/capture/batch/', {'urls': urls}, format='json')
+
+        self.assertEqual(response.status_code, 202, response.data)
+        statuses = [item['status'] for item in response.data['results']]
+        self.assertEqual(statuses, ['created', 'duplicate', 'queued', 'fetch_failed', 'fetch_failed', 'duplicate'])
+        self.assertEqual(response.data['counts'], {'created': 1, 'duplicate': 2, 'queued': 1, 'fetch_failed': 2})
+        self.assertEqual(response.data['results'][1]['id'], self.done.id)
+
+        created = Article.objects.get(id=response.data['results'][0]['id'])
+        self.assertEqual((created.title, created.processing_status), ('new', 'pending'))
+        self.assertEqual(
+            list(ArticleProgress.objects.filter(article=created).values_list('stage', flat=True)),
+            [ArticleProgress.STAGE_FETCHED, ArticleProgress.STAGE_EXTRACTED]
+        )
+        self.failed.refresh_from_db()
+        self.assertEqual((self.failed.processing_status, self.failed.error_message), ('pending', ''))
+        self.assertEqual(set(AnalysisJob.objects.values_list('article_id', flat=True)), {created.id, self.failed.id})
+
+    def test_empty_url_list_is_rejected(self):
+        response = self.client.post('/api/v1/capture/capture/batch/', {'urls': []}, format='json')
+        self.assertEqual(response.status_code, 400)
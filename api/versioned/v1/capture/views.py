@@ -1,31 +1,34 @@
 import json
 import logging
+import time
 import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from django.conf import settings
 from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from rest_framework.status import HTTP_200_OK, HTTP_202_ACCEPTED, HTTP_400_BAD_REQUEST, HTTP_503_SERVICE_UNAVAILABLE
 
-import openai
-from openai import OpenAI
+from api.versioned.v1.capture.renderers import EventStreamRenderer
+from api.versioned.v1.capture.serializers import CaptureSerializer, CaptureBatchSerializer
+from api.versioned.v1.utils.extractor import extract_article
+from api.versioned.v1.utils.fetcher import fetch_html
+from api.versioned.v1.utils.graph_cache import cached_graph_response
+from api.versioned.v1.utils.fingerprint import content_fingerprint, url_key
+from api.versioned.v1.utils.graph_engine import GraphEngineLoading, get_graph_engine
+from api.versioned.v1.utils.neo4j_client import get_neo4j_client
+from api.versioned.v1.utils.vector_index import get_vector_index
 
-from api.versioned.v1.capture.serializers import CaptureSerializer
-from api.versioned.v1.utils.neo4j_client import Neo4jClient
-
-from article.models import Article, ArticleConcept, ArticleEntity, ArticleEvent, ArticleRelationship
-from concept.models import ConceptDomain, Concept, ConceptRelationship
-from event.models import Event
-from entity.models import Entity
+from article.models import Article, AnalysisJob, ArticleProgress, ArticleRelationship
 
 logger = logging.getLogger(__name__)
-OPENAI_API_KEY = settings.OPENAI_API_KEY
 
 class CaptureViewSet(viewsets.ModelViewSet):
     """
@@ -36,77 +39,41 @@ class CaptureViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, ]
     serializer_class = CaptureSerializer
     queryset = Article.objects.all()
+    keyset_ordering = ('-created_at', '-id')  # 목록 키셋 페이지네이션 정렬 (액션별로 바꿀 수 있음)
     
     def get_queryset(self):
         """현재 사용자의 기사만 반환"""
         return Article.objects.filter(user=self.request.user)
     
     def create(self, request, *args, **kwargs):
-        """기사 캡처 및 분석"""
+        """기사 캡처 및 분석 작업 등록"""
         serializer = self.get_serializer(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=HTTP_400_BAD_REQUEST)
         
         url = serializer.validated_data.get('url')
         
-        # 웹 페이지 내용 가져오기
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-        }
-        
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 제목 추출
-            title_tag = soup.find('title') or soup.find('h1')
-            title = title_tag.get_text(strip=True) if title_tag else 'No title found'
-
-            # 본문 추출 (뉴스 사이트마다 다를 수 있음)
-            content_tag = soup.find('div', id='dic_area') or soup.find('div', id='contents') or soup.find('article')
-            content = content_tag.get_text(separator="\n", strip=True) if content_tag else ''
-
-            # 언론사 추출 시도
-            source = None
-            meta_publisher = soup.find('meta', property='og:site_name')
-            if meta_publisher:
-                source = meta_publisher.get('content')
-            
-            # 발행일 추출 시도
-            published_date = None
-            meta_date = soup.find('meta', property='article:published_time')
-            if meta_date:
-                date_str = meta_date.get('content')
-                try:
-                    published_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                except:
-                    pass
+            # 웹 페이지 내용 가져오기
+            page = extract_article(fetch_html(url), url)
 
             # 콘텐츠가 없으면 에러 반환
-            if not content:
+            if not page['content']:
                 return Response({"error": "분석할 콘텐츠가 필요합니다."}, status=HTTP_400_BAD_REQUEST)
             
-            # 기사 객체 생성
-
-            article = Article.objects.create(
-                user=request.user,
-                title=title,
-                url=url,
-                content=content,
-                source=source or '',
-                published_date=published_date,
-                processing_status='processing'
-            )
-            
-            # 비동기로 처리하는 것이 좋지만, 예제에서는 동기적으로 처리
-            self.analyze_and_process_article(article)
+            # 기사 객체 생성 및 분석 작업 등록 (분석은 run_analysis_worker에서 수행)
+            with transaction.atomic():
+                article = self._build_article(url, page)
+                article.save()
+                ArticleProgress.objects.record_many([article], [ArticleProgress.STAGE_FETCHED, ArticleProgress.STAGE_EXTRACTED])
+                AnalysisJob.objects.enqueue(article)
             
             return Response({
                 "id": article.id,
                 "title": article.title,
-                "message": "콘텐츠 분석 및 저장이 완료되었습니다."
-            }, status=HTTP_201_CREATED)
+                "processing_status": article.processing_status,
+                "message": "콘텐츠가 저장되었으며 분석 대기열에 등록되었습니다."
+            }, status=HTTP_202_ACCEPTED)
             
         except requests.RequestException as e:
             return Response({"error": f"웹 페이지를 가져오는데 실패했습니다: {str(e)}"}, status=HTTP_400_BAD_REQUEST)
@@ -114,310 +81,205 @@ class CaptureViewSet(viewsets.ModelViewSet):
             logger.error(f"기사 처리 중 오류 발생: {str(e)}")
             return Response({"error": f"처리 중 오류가 발생했습니다: {str(e)}"}, status=HTTP_400_BAD_REQUEST)
     
-    def analyze_and_process_article(self, article):
-        """기사 분석 및 처리"""
+    @action(detail=False, methods=['post'], url_path='batch', serializer_class=CaptureBatchSerializer)
+    def batch(self, request):
+        """
+        여러 URL 일괄 캡처
+        
+        공용 연결 풀을 사용해 페이지를 동시에 가져오고, URL별 처리 결과를 반환합니다.
+        - created: 새 기사를 저장하고 분석 작업을 등록함
+        - queued: 분석에 실패했던 기존 기사를 다시 분석 대기열에 등록함
+        - duplicate: 이미 캡처했거나 요청 안에서 중복된 URL
+        - fetch_failed: 페이지를 가져오지 못했거나 본문이 없음
+        """
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=HTTP_400_BAD_REQUEST)
+        
+        urls = serializer.validated_data['urls']
+        
         try:
-            # GPT 프롬프트 구성
-            leaf_domains = list(ConceptDomain.objects.filter(children__isnull=True).values_list('name', flat=True))
-            existing_events = list(Event.objects.all().values_list('name', flat=True)[:10])
-            
-            prompt = f"""
-            다음 텍스트를 한국어로 분석하고 다음 정보를 무조건 한국어로 추출하세요:
-
-            1. 모든 응답은 JSON 형식으로 제공해야 합니다.
-            2. 다음 영어 키를 정확히 사용하여 응답하세요:
-            {{
-                "category": [],           // 콘텐츠 카테고리 (예: 기술, 과학, 경제, 교육 등)
-                "core_themes": [],        // 주요 주제/토픽 (2-5개)
-                "main_concepts": [        // 주요 개념 (형식: {{ "name": "개념 이름", "description": "간략한 설명", "confidence": 95 }})
-                ],
-                "entities": [             // 기사에 등장하는 주요 엔티티 (형식: {{ "name": "엔티티 이름", "entity_type": "조직/인물/제품/기술", "mention_count": 3 }})
-                ],
-                "event_info": {{          // 기사가 다루는 이벤트 정보
-                    "event_name": "",     // 이벤트 이름 (예: "SKT 유심 해킹 사건")
-                    "event_date": "",     // 이벤트 발생 날짜 (정확한 YYYY-MM-DD 형식만 입력, 없으면 빈 문자열)
-                    "event_type": "",     // 이벤트 유형 (예: "사이버 보안 사고")
-                    "description": ""     // 이벤트 간략 설명
-                }},
-                "related_concepts": [     // 기사에 직접 언급되지 않았지만 관련된 개념들 (형식: {{ "name": "개념 이름", "confidence": 80 }})
-                ],
-                "concept_relationships": [ // 개념 간 관계 (형식: {{ "source": "개념1", "target": "개념2", "relationship_type": "RELATED_TO/IS_A/PART_OF", "weight": 0.9 }})
-                ],
-                "summary": "",            // 기사 요약 (3-5문장)
-                "related_to_existing_events": [] // 이 기사가 관련된 기존 이벤트 목록 (아래 목록에서 선택)
-            }}
-
-            이 기사가 다음 기존 이벤트와 관련이 있는지 평가하세요:
-            {existing_events}
-
-            적절한 도메인 분류:
-            {list(ConceptDomain.objects.all().values_list('name', flat=True))}
-
-            기존에 추출된 주요 개념(비슷한 개념이 있다면 재사용하는 것이 좋습니다):
-            {list(Concept.objects.all().values_list('name', flat=True)[:20])}
-
-            리프 도메인 목록(가장 구체적인 도메인):
-            {leaf_domains}
-
-            텍스트:
-            {article.content}
-            """
-
-            # OpenAI API 호출
-            client = OpenAI(api_key=OPENAI_API_KEY)
-            
-            completion = client.chat.completions.create(
-                model="gpt-4o",  # 또는 사용 가능한 모델
-                messages=[
-                    {"role": "system", "content": "주어진 텍스트를 분석하여 구조화된 JSON으로 응답하는 도우미입니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"}
-            )
-
-            # 응답 추출 및 JSON 파싱
-            gpt_response = completion.choices[0].message.content
-            analysis_result = json.loads(gpt_response)
-            
-            # 분석 결과를 DB에 저장
+            # 정규화된 URL 키 기준으로 요청 안의 중복 제거
+            keys = [url_key(url) for url in urls]
+            first_index = {}
+            for index, key in enumerate(keys):
+                first_index.setdefault(key, index)
+            key_urls = {key: urls[index] for key, index in first_index.items()}
+            
+            # 이미 캡처한 기사 확인 (실패한 기사는 재분석)
+            results = {}
+            retry_articles = []
+            existing = Article.objects.filter(
+                user=request.user,
+                url_key__in=list(key_urls)
+            ).only('id', 'url_key', 'processing_status')
+            for article in existing:
+                if article.url_key in results:
+                    continue
+                if article.processing_status == 'failed':
+                    retry_articles.append(article)
+                    results[article.url_key] = {"status": "queued", "id": article.id}
+                else:
+                    results[article.url_key] = {"status": "duplicate", "id": article.id}
+            fetch_urls = [url for key, url in key_urls.items() if key not in results]
+            
+            # 페이지 동시 수집
+            pages = {}
+            with ThreadPoolExecutor(max_workers=settings.CAPTURE_BATCH_CONCURRENCY) as executor:
+                futures = {executor.submit(self._fetch_page, url): url for url in fetch_urls}
+                for future in as_completed(futures):
+                    url = futures[future]
+                    page, error = future.result()
+                    if page:
+                        pages[url] = page
+                    else:
+                        results[url_key(url)] = {"status": "fetch_failed", "error": error}
+            
+            # 기사 저장 및 분석 작업 등록
             with transaction.atomic():
-                # 요약문 저장
-                article.summary = analysis_result.get('summary', '')
-                
-                # 카테고리 저장
-                for category_name in analysis_result.get('category', []):
-                    domain, created = ConceptDomain.objects.get_or_create(name=category_name)
-                    article.domains.add(domain)
-                
-                # 주요 개념 저장
-                for concept_data in analysis_result.get('main_concepts', []):
-                    concept, created = Concept.objects.get_or_create(
-                        name=concept_data['name'],
-                        defaults={
-                            'description': concept_data.get('description', ''),
-                            'confidence': concept_data.get('confidence', 0.0)
-                        }
-                    )
-                    
-                    # 개념과 기사 연결
-                    ArticleConcept.objects.create(
-                        article=article,
-                        concept=concept,
-                        confidence=concept_data.get('confidence', 0.0),
-                        is_key_concept=True
-                    )
-                
-                # 엔티티 저장
-                for entity_data in analysis_result.get('entities', []):
-                    entity, created = Entity.objects.get_or_create(
-                        name=entity_data['name'],
-                        entity_type=entity_data.get('entity_type', '기타'),
-                        defaults={
-                            'description': entity_data.get('description', '')
-                        }
-                    )
-                    
-                    # 엔티티와 기사 연결
-                    ArticleEntity.objects.create(
-                        article=article,
-                        entity=entity,
-                        confidence=1.0,
-                        mention_count=entity_data.get('mention_count', 1)
-                    )
-                
-                # 이벤트 저장
-                event_info = analysis_result.get('event_info', {})
-                if event_info and event_info.get('event_name'):
-                    # 날짜 값 처리 - 텍스트가 아닌 유효한 날짜 형식만 받음
-                    event_date = None
-                    if event_info.get('event_date'):
-                        try:
-                            # YYYY-MM-DD 형식 검증
-                            date_str = event_info.get('event_date')
-                            if date_str and isinstance(date_str, str) and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
-                                event_date = date_str
-                        except:
-                            pass
-                            
-                    event, created = Event.objects.get_or_create(
-                        name=event_info['event_name'],
-                        defaults={
-                            'description': event_info.get('description', ''),
-                            'event_date': event_date,
-                            'event_type': event_info.get('event_type', '')
-                        }
+                articles = Article.objects.bulk_create([
+                    self._build_article(url, pages[url])
+                    for url in fetch_urls if url in pages
+                ])
+                if retry_articles:
+                    Article.objects.filter(id__in=[a.id for a in retry_articles]).update(
+                        processing_status='pending',
+                        error_message=''
                     )
-                    
-                    # 이벤트와 기사 연결
-                    ArticleEvent.objects.create(
-                        article=article,
-                        event=event,
-                        relationship_type='PART_OF',
-                        confidence=1.0
-                    )
-                    
-                    # 이벤트에 도메인 연결
-                    if article.domains.exists():
-                        event.domain = article.domains.first()
-                        event.save()
-                
-                # 관련된 기존 이벤트 연결
-                for event_name in analysis_result.get('related_to_existing_events', []):
-                    try:
-                        event = Event.objects.get(name=event_name)
-                        ArticleEvent.objects.create(
-                            article=article,
-                            event=event,
-                            relationship_type='RELATED_TO',
-                            confidence=0.8
-                        )
-                    except Event.DoesNotExist:
-                        continue
-                
-                # 개념 간 관계 저장
-                for rel_data in analysis_result.get('concept_relationships', []):
-                    try:
-                        source_concept, _ = Concept.objects.get_or_create(name=rel_data['source'])
-                        target_concept, _ = Concept.objects.get_or_create(name=rel_data['target'])
-                        
-                        ConceptRelationship.objects.create(
-                            source_concept=source_concept,
-                            target_concept=target_concept,
-                            relationship_type=rel_data.get('relationship_type', 'RELATED_TO'),
-                            weight=rel_data.get('weight', 0.5)
-                        )
-                    except Exception as e:
-                        logger.warning(f"개념 관계 저장 중 오류: {str(e)}")
-                
-                # 관련 기사 찾기 및 관계 설정
-                self.find_and_link_related_articles(article)
-                
-                # Neo4j에 데이터 저장
-                self.save_to_neo4j(article)
-                
-                # 처리 완료로 상태 변경
-                article.processing_status = 'completed'
-                article.save()
-                
-            return True
+                ArticleProgress.objects.record_many(articles, [ArticleProgress.STAGE_FETCHED, ArticleProgress.STAGE_EXTRACTED])
+                AnalysisJob.objects.enqueue_many(articles + retry_articles)
             
-        except Exception as e:
-            logger.error(f"기사 분석 중 오류 발생: {str(e)}")
-            article.processing_status = 'failed'
-            article.error_message = str(e)
-            article.save()
-            return False
-    
-    def find_and_link_related_articles(self, article):
-        """관련 기사 찾기 및 연결"""
-        try:
-            # 같은 이벤트를 다루는 기사 찾기
-            related_by_event = Article.objects.filter(
-                events__in=article.events.all()
-            ).exclude(id=article.id).distinct()
+            for article in articles:
+                results[article.url_key] = {"status": "created", "id": article.id}
             
-            # 관련 기사와의 관계 설정
-            for related_article in related_by_event:
-                ArticleRelationship.objects.create(
-                    source_article=article,
-                    target_article=related_article,
-                    relationship_type='RELATED_TO',
-                    similarity_score=0.8
-                )
+            # 요청 순서대로 결과 정렬 (같은 기사를 가리키는 뒤쪽 URL은 duplicate로 표시)
+            response_items = []
+            for index, (url, key) in enumerate(zip(urls, keys)):
+                if first_index[key] == index:
+                    response_items.append({"url": url, **results[key]})
+                else:
+                    response_items.append({"url": url, "status": "duplicate"})
             
-            # 유사한 개념을 다루는 기사 찾기
-            article_concepts = article.concepts.all()
-            if article_concepts:
-                related_by_concept = Article.objects.filter(
-                    concepts__in=article_concepts
-                ).exclude(id=article.id).distinct()
-                
-                for related_article in related_by_concept:
-                    # 중복 방지
-                    if not ArticleRelationship.objects.filter(
-                        source_article=article,
-                        target_article=related_article
-                    ).exists():
-                        common_concepts = article.concepts.filter(
-                            id__in=related_article.concepts.values_list('id', flat=True)
-                        ).count()
-                        
-                        # 공통 개념이 많을수록 유사도 높음
-                        similarity = min(0.9, 0.5 + (common_concepts / 10))
-                        
-                        ArticleRelationship.objects.create(
-                            source_article=article,
-                            target_article=related_article,
-                            relationship_type='RELATED_BY_CONCEPT',
-                            similarity_score=similarity
-                        )
+            counts = {}
+            for item in response_items:
+                counts[item['status']] = counts.get(item['status'], 0) + 1
             
-            return True
+            return Response({"results": response_items, "counts": counts}, status=HTTP_202_ACCEPTED)
             
         except Exception as e:
-            logger.error(f"관련 기사 연결 중 오류 발생: {str(e)}")
-            return False
+            logger.error(f"일괄 캡처 중 오류 발생: {str(e)}")
+            return Response({"error": f"처리 중 오류가 발생했습니다: {str(e)}"}, status=HTTP_400_BAD_REQUEST)
     
-    def save_to_neo4j(self, article):
-        """Neo4j에 데이터 저장"""
+    def _build_article(self, url, page):
+        """추출 결과로 처리 대기 상태의 기사 객체 생성 (저장 전)"""
+        return Article(
+            user=self.request.user,
+            url=url,
+            url_key=url_key(url),
+            content_hash=content_fingerprint(page['content']),
+            processing_status='pending',
+            **page
+        )
+    
+    def _fetch_page(self, url):
+        """페이지 수집 및 본문 추출 (결과, 오류 메시지)"""
         try:
-            neo4j_client = Neo4jClient()
-            
-            # Neo4j 연결이 없을 경우 작업 스킵
-            if not neo4j_client.graph:
-                logger.warning("Neo4j 연결이 없어 그래프 저장을 건너뜁니다.")
-                return False
-            
-            # 기사 노드 생성
-            neo4j_client.create_article_node(article)
-            
-            # 개념 노드 생성 및 연결
-            for article_concept in ArticleConcept.objects.filter(article=article):
-                neo4j_client.create_concept_node(article_concept.concept)
-                neo4j_client.create_article_concept_relationship(article_concept)
-            
-            # 엔티티 노드 생성 및 연결
-            for article_entity in ArticleEntity.objects.filter(article=article):
-                neo4j_client.create_entity_node(article_entity.entity)
-                neo4j_client.create_article_entity_relationship(article_entity)
-            
-            # 이벤트 노드 생성 및 연결
-            for article_event in ArticleEvent.objects.filter(article=article):
-                neo4j_client.create_event_node(article_event.event)
-                neo4j_client.create_article_event_relationship(article_event)
-            
-            # 기사 간 관계 저장
-            for article_relationship in ArticleRelationship.objects.filter(source_article=article):
-                neo4j_client.create_article_relationship(article_relationship)
-            
-            # 개념 간 관계 저장
-            concept_ids = ArticleConcept.objects.filter(article=article).values_list('concept_id', flat=True)
-            concept_relationships = ConceptRelationship.objects.filter(
-                source_concept_id__in=concept_ids,
-                target_concept_id__in=concept_ids
-            )
+            page = extract_article(fetch_html(url), url)
+        except requests.RequestException as e:
+            return None, f"웹 페이지를 가져오는데 실패했습니다: {str(e)}"
+        except Exception as e:
+            return None, f"본문 추출에 실패했습니다: {str(e)}"
+        
+        if not page['content']:
+            return None, "분석할 콘텐츠가 필요합니다."
+        return page, None
+    
+    @action(detail=True, methods=['get'], renderer_classes=[EventStreamRenderer, JSONRenderer])
+    def progress(self, request, pk=None):
+        """
+        기사 처리 진행 상황 스트림 (Server-Sent Events)
+        
+        fetched, extracted, analyzing, summary_saved, concepts_saved, entities_saved, completed,
+        graph_synced/graph_sync_failed 단계를 기록 순서대로 progress 이벤트로 전송합니다.
+        분석이 최종 실패하면 failed 단계에서, 아니면 replicate_graph가 그래프 복제 결과를 기록할 때 끝납니다.
+        재시도가 남은 실패는 retrying 단계를 보낸 뒤 다음 시도의 analyzing 단계부터 이어집니다.
+        Last-Event-ID 헤더를 보내면 그 이후 단계부터 이어서 받습니다.
+        
+        한 응답은 짧은 구간(CAPTURE_PROGRESS_STREAM_WINDOW)만 열려 있다가 끝나고,
+        EventSource는 retry 간격 뒤에 Last-Event-ID로 다시 연결해 이어서 받습니다.
+        마지막 단계가 기록된 뒤 CAPTURE_PROGRESS_STREAM_TIMEOUT이 지나도록 새 단계가 없으면
+        timeout 이벤트를 보내므로, 클라이언트는 이 이벤트를 받으면 연결을 닫아야 합니다.
+        """
+        article = self.get_object()
+        
+        try:
+            last_id = int(request.headers.get('Last-Event-ID') or request.query_params.get('last_event_id') or 0)
+        except ValueError:
+            last_id = 0
+        
+        response = StreamingHttpResponse(
+            self._progress_events(article, last_id),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+    
+    def _progress_events(self, article, last_id):
+        """
+        진행 단계 이벤트 생성기 (완료/실패 단계 또는 응답 구간이 끝날 때까지)
+        
+        WSGI 워커를 오래 붙잡지 않도록 응답 구간이 끝나면 재연결 간격(retry)만 알리고 종료합니다.
+        """
+        deadline = time.monotonic() + settings.CAPTURE_PROGRESS_STREAM_WINDOW
+        last_sent = time.monotonic()
+        yield f"retry: {int(settings.CAPTURE_PROGRESS_RETRY_INTERVAL * 1000)}\n\n"
+        
+        # 마지막 활동(진행 기록, 없으면 기사 생성) 이후 새 단계 없이 제한 시간이 지났으면 종료
+        last_activity = (
+            ArticleProgress.objects.filter(article_id=article.id).order_by('-id').values_list('created_at', flat=True).first()
+            or article.created_at
+        )
+        stalled = timezone.now() - last_activity > timedelta(seconds=settings.CAPTURE_PROGRESS_STREAM_TIMEOUT)
+        
+        while time.monotonic() < deadline:
+            events = ArticleProgress.objects.filter(article_id=article.id, id__gt=last_id).order_by('id')
+            for event in events:
+                last_id = event.id
+                last_sent = time.monotonic()
+                data = {
+                    'stage': event.stage,
+                    'detail': event.detail,
+                    'created_at': event.created_at.isoformat()
+                }
+                yield f"id: {event.id}\nevent: progress\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+                
+                if event.stage in ArticleProgress.TERMINAL_STAGES:
+                    return
             
-            for concept_relationship in concept_relationships:
-                neo4j_client.create_concept_relationship(concept_relationship)
+            if stalled:
+                yield "event: timeout\ndata: {}\n\n"
+                return
             
-            return True
+            # 프록시 연결 유지를 위한 주석 이벤트
+            if time.monotonic() - last_sent > 15:
+                last_sent = time.monotonic()
+                yield ": keep-alive\n\n"
             
-        except Exception as e:
-            logger.error(f"Neo4j 저장 중 오류 발생: {str(e)}")
-            # Neo4j 저장은 실패해도 전체 처리는 성공으로 간주
-            return True
+            time.sleep(settings.CAPTURE_PROGRESS_POLL_INTERVAL)
     
-    @action(detail=True, methods=['get'])
+    @action(detail=True, methods=['get'], keyset_ordering=('-similarity_score', '-id'))
     def related_articles(self, request, pk=None):
-        """관련 기사 조회"""
+        """관련 기사 조회 (유사도 순 키셋 페이지네이션, 그래프에서 찾은 기사는 마지막 페이지에 덧붙임)"""
         try:
             article = self.get_object()
             
             # 관련 기사 조회 (Django ORM)
             related = ArticleRelationship.objects.filter(source_article=article)
+            page = self.paginate_queryset(related.select_related('target_article'))
             
             result = []
-            for rel in related:
+            for rel in page:
                 result.append({
                     'id': rel.target_article.id,
                     'title': rel.target_article.title,
@@ -426,25 +288,65 @@ class CaptureViewSet(viewsets.ModelViewSet):
                     'url': rel.target_article.url
                 })
             
-            # Neo4j에서 추가 관련 기사 조회
-            neo4j_client = Neo4jClient()
-            neo4j_related = neo4j_client.find_similar_articles(article.id)
-            
-            # 중복 제거하면서 Neo4j 결과 추가
-            existing_ids = [item['id'] for item in result]
-            for item in neo4j_related:
-                if item['article_id'] not in existing_ids:
+            if not self.paginator.get_next_link():
+                # Neo4j에서 추가 관련 기사 조회 (쓸 수 없으면 프로세스 내 그래프 엔진)
+                neo4j_client = get_neo4j_client()
+                if neo4j_client.graph is not None:
+                    neo4j_related = neo4j_client.find_similar_articles(article.id)
+                else:
                     try:
-                        related_article = Article.objects.get(id=item['article_id'])
-                        result.append({
-                            'id': related_article.id,
-                            'title': related_article.title,
-                            'relationship_type': 'RELATED_TO',
-                            'similarity_score': item.get('common_events', 0) / 10,
-                            'url': related_article.url
-                        })
-                    except Article.DoesNotExist:
+                        neo4j_related = get_graph_engine().find_similar_articles(article.id)
+                    except GraphEngineLoading:
+                        neo4j_related = []  # 적재가 끝날 때까지는 DB의 관계만 응답
+                
+                # 이미 관계가 있는 기사를 빼고 나머지를 한 번에 조회해 그래프 결과 순서대로 추가
+                existing_ids = set(related.values_list('target_article_id', flat=True))
+                neo4j_related = [item for item in neo4j_related if item['article_id'] not in existing_ids]
+                related_articles = Article.objects.only('id', 'title', 'url').in_bulk(
+                    [item['article_id'] for item in neo4j_related]
+                )
+                for item in neo4j_related:
+                    related_article = related_articles.get(item['article_id'])
+                    if related_article is None:
                         continue
+                    result.append({
+                        'id': related_article.id,
+                        'title': related_article.title,
+                        'relationship_type': 'RELATED_TO',
+                        'similarity_score': item.get('common_events', 0) / 10,
+                        'url': related_article.url
+                    })
+            
+            return self.get_paginated_response(result)
+            
+        except Exception as e:
+            return Response({"error": str(e)}, status=HTTP_400_BAD_REQUEST)
+    
+    @action(detail=True, methods=['get'])
+    def similar(self, request, pk=None):
+        """요약이 의미적으로 유사한 내 기사 조회 (임베딩 벡터 인덱스, ?k=개수)"""
+        try:
+            article = self.get_object()
+            if article.summary_embedding is None:
+                return Response({"error": "기사 요약 임베딩이 아직 생성되지 않았습니다."}, status=HTTP_400_BAD_REQUEST)
+            
+            # 인덱스는 전체 사용자의 기사를 포함하므로 내 기사 id만 후보로 남겨 상위 k개를 고름
+            k = min(max(int(request.query_params.get('k', 10)), 1), 100)
+            neighbours = get_vector_index('article').search(
+                article.summary_embedding_vector, k, exclude={article.id},
+                allow=self.get_queryset().values_list('id', flat=True)
+            )
+            articles = self.get_queryset().only('id', 'title', 'url').in_bulk([article_id for article_id, _ in neighbours])
+            
+            result = []
+            for article_id, score in neighbours:
+                if article_id in articles:
+                    result.append({
+                        'id': article_id,
+                        'title': articles[article_id].title,
+                        'url': articles[article_id].url,
+                        'similarity_score': round(score, 4)
+                    })
             
             return Response(result, status=HTTP_200_OK)
             
@@ -457,85 +359,24 @@ class CaptureViewSet(viewsets.ModelViewSet):
         try:
             article = self.get_object()
             
-            # Neo4j에서 지식 그래프 조회
-            neo4j_client = Neo4jClient()
-            graph_data = neo4j_client.get_article_knowledge_graph(article.id)
-            
-            if not graph_data:
-                # Fallback: Django ORM으로 간단한 그래프 생성
-                nodes = []
-                edges = []
+            def build():
+                # Neo4j에서 지식 그래프 조회
+                neo4j_client = get_neo4j_client()
+                graph_data = None
+                if neo4j_client.graph is not None:
+                    graph_data = neo4j_client.get_article_knowledge_graph(article.id)
                 
-                # 기사 노드
-                article_node = {
-                    'id': f"a_{article.id}",
-                    'label': 'Article',
-                    'title': article.title,
-                    'url': article.url
-                }
-                nodes.append(article_node)
-                
-                # 개념 노드 및 엣지
-                for ac in ArticleConcept.objects.filter(article=article):
-                    concept_node = {
-                        'id': f"c_{ac.concept.id}",
-                        'label': 'Concept',
-                        'name': ac.concept.name,
-                        'description': ac.concept.description
-                    }
-                    nodes.append(concept_node)
-                    
-                    edge = {
-                        'from': f"a_{article.id}",
-                        'to': f"c_{ac.concept.id}",
-                        'label': 'MENTIONS',
-                        'confidence': ac.confidence
-                    }
-                    edges.append(edge)
-                
-                # 엔티티 노드 및 엣지
-                for ae in ArticleEntity.objects.filter(article=article):
-                    entity_node = {
-                        'id': f"e_{ae.entity.id}",
-                        'label': 'Entity',
-                        'name': ae.entity.name,
-                        'entity_type': ae.entity.entity_type
-                    }
-                    nodes.append(entity_node)
-                    
-                    edge = {
-                        'from': f"a_{article.id}",
-                        'to': f"e_{ae.entity.id}",
-                        'label': 'MENTIONS',
-                        'mention_count': ae.mention_count
-                    }
-                    edges.append(edge)
-                
-                # 이벤트 노드 및 엣지
-                for ae in ArticleEvent.objects.filter(article=article):
-                    event_node = {
-                        'id': f"ev_{ae.event.id}",
-                        'label': 'Event',
-                        'name': ae.event.name,
-                        'event_type': ae.event.event_type
-                    }
-                    nodes.append(event_node)
-                    
-                    edge = {
-                        'from': f"a_{article.id}",
-                        'to': f"ev_{ae.event.id}",
-                        'label': ae.relationship_type,
-                        'confidence': ae.confidence
-                    }
-                    edges.append(edge)
-                
-                graph_data = {
-                    'nodes': nodes,
-                    'edges': edges
-                }
+                if not graph_data:
+                    # Fallback: 프로세스 내 그래프 엔진 (같은 노드/엣지 형식, 2단계 관계까지)
+                    graph_data = get_graph_engine().get_article_knowledge_graph(article.id) or {'nodes': [], 'edges': []}
+                return graph_data
             
-            return Response(graph_data, status=HTTP_200_OK)
+            # 기사 그래프 버전이 같으면 캐시된 응답 사용 (ETag/Last-Modified로 304 응답)
+            return cached_graph_response(request, 'article-graph', article, build)
             
+        except GraphEngineLoading as e:
+            # 스냅샷 없이 그래프 엔진을 처음 적재하는 중 (불완전한 그래프를 캐시하지 않도록 재시도 요청)
+            return Response({"error": str(e)}, status=HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': '5'})
         except Exception as e:
             return Response({"error": str(e)}, status=HTTP_400_BAD_REQUEST)
 
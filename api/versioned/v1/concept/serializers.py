@@ -9,14 +9,11 @@ from event.models import Event
 class ConceptSerializer(serializers.ModelSerializer):
     """개념 시리얼라이저"""
     domain_name = serializers.CharField(source='domain.name', read_only=True)
-    article_count = serializers.SerializerMethodField()
+    article_count = serializers.IntegerField(read_only=True)  # 유지되는 연결 수 컬럼
     
     class Meta:
         model = Concept
         fields = ['id', 'name', 'description', 'confidence', 'domain', 'domain_name', 'article_count', 'created_at']
-    
-    def get_article_count(self, obj):
-        return obj.articles.count()
 
 class ConceptDomainSerializer(serializers.ModelSerializer):
     """개념 도메인 시리얼라이저"""
@@ -33,43 +30,31 @@ class ConceptDomainSerializer(serializers.ModelSerializer):
 class EventSerializer(serializers.ModelSerializer):
     """이벤트 시리얼라이저"""
     domain_name = serializers.CharField(source='domain.name', read_only=True)
-    article_count = serializers.SerializerMethodField()
+    article_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Event
         fields = ['id', 'name', 'description', 'event_date', 'event_type', 'domain', 'domain_name', 'article_count', 'created_at']
-    
-    def get_article_count(self, obj):
-        return obj.articles.count()
 
 class EntitySerializer(serializers.ModelSerializer):
     """엔티티 시리얼라이저"""
-    article_count = serializers.SerializerMethodField()
+    article_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Entity
         fields = ['id', 'name', 'entity_type', 'description', 'article_count', 'created_at']
-    
-    def get_article_count(self, obj):
-        return obj.articles.count()
 
 class ArticleSerializer(serializers.ModelSerializer):
     """기사 시리얼라이저"""
     user_name = serializers.CharField(source='user.username', read_only=True)
-    concept_count = serializers.SerializerMethodField()
-    entity_count = serializers.SerializerMethodField()
+    concept_count = serializers.IntegerField(read_only=True)
+    entity_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Article
         fields = ['id', 'title', 'url', 'source', 'published_date', 'user', 'user_name', 
                  'concept_count', 'entity_count', 'processing_status', 'created_at']
         read_only_fields = ['processing_status', 'source', 'published_date']
-    
-    def get_concept_count(self, obj):
-        return obj.concepts.count()
-    
-    def get_entity_count(self, obj):
-        return obj.entities.count()
 
 class ArticleDetailSerializer(ArticleSerializer):
     """기사 상세 시리얼라이저"""
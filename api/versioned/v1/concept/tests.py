@@ -0,0 +1,102 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api.versioned.v1.utils.graph_cache import bump_graph_versions
+from api.versioned.v1.utils.graph_engine import GraphEngine
+from article.models import Article, ArticleConcept, ArticleEntity
+from concept.models import Concept, ConceptRelationship
+from entity.models import Entity
+
+
+class ConceptGraphCacheTests(TestCase):
+    """관련 개념 응답의 ETag/304와 그래프 버전 무효화 (ConceptViewSet.related_concepts)"""
+
+    def setUp(self):
+        caches['graph'].clear()
+        self.user = get_user_model().objects.create_user(username='concept-cache')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.ai, self.learning = Concept.objects.create(name='인공지능'), Concept.objects.create(name='강화학습')
+
+        self.engine = GraphEngine(refresh_interval=0, rebuild_interval=3600, snapshot_path='')
+        self.engine.rebuild()
+        patches = [
+            mock.patch('api.versioned.v1.concept.views.get_neo4j_client', return_value=mock.Mock(graph=None)),
+            mock.patch('api.versioned.v1.concept.views.get_graph_engine', return_value=self.engine),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def get_related(self, concept, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(f'/api/v1/concept/concepts/{concept.id}/related_concepts/', **headers)
+
+    def test_unchanged_concept_returns_304(self):
+        etag = self.get_related(self.ai)['ETag']
+        self.assertEqual(self.get_related(self.ai, etag).status_code, 304)
+
+    def test_relationship_from_new_analysis_changes_etag(self):
+        first = self.get_related(self.ai)
+        self.assertEqual(first.data, [])
+
+        # 분석이 개념 관계를 저장하고 그 기사의 그래프 버전을 올림
+        article = Article.objects.create(user=self.user, title='t', url='https://example.com/1', content='c')
+        ArticleConcept.objects.create(article=article, concept=self.ai)
+        ConceptRelationship.objects.create(source_concept=self.ai, target_concept=self.learning,
+                                           relationship_type='RELATED_TO', weight=0.8)
+        bump_graph_versions([article.id])
+        self.engine.rebuild()
+
+        response = self.get_related(self.ai, first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        self.assertEqual([row['name'] for row in response.data], ['강화학습'])
+
+
+class EntityRollupViewTests(TestCase):
+    """언급 수 집계 순 엔티티 목록 (ConceptViewSet.entities)"""
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username='entity-rollup')
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+        articles = [
+            Article.objects.create(user=user, title=f't{i}', url=f'https://example.com/{i}', content='c')
+            for i in range(2)
+        ]
+        self.entities = {
+            name: Entity.objects.create(name=name, entity_type=entity_type)
+            for name, entity_type in (('SKT', '조직'), ('KT', '조직'), ('홍길동', '인물'))
+        }
+        # 언급 수 합계: SKT 5, 홍길동 4, KT 1
+        ArticleEntity.objects.bulk_create([
+            ArticleEntity(article=articles[0], entity=self.entities['SKT'], mention_count=3),
+            ArticleEntity(article=articles[1], entity=self.entities['SKT'], mention_count=2),
+            ArticleEntity(article=articles[0], entity=self.entities['KT'], mention_count=1),
+            ArticleEntity(article=articles[1], entity=self.entities['홍길동'], mention_count=4),
+        ])
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def test_pages_by_mention_count(self):
+        first = self.get('/api/v1/concept/concepts/entities/?limit=2')
+        self.assertEqual([(row['name'], row['mention_count']) for row in first['results']], [('SKT', 5), ('홍길동', 4)])
+
+        last = self.get(first['next'])
+        self.assertEqual([row['name'] for row in last['results']], ['KT'])
+        self.assertIsNone(last['next'])
+
+    def test_type_filter_follows_rollup_changes(self):
+        ArticleEntity.objects.filter(entity=self.entities['SKT'], mention_count=3).delete()
+
+        data = self.get('/api/v1/concept/concepts/entities/?type=조직')
+        self.assertEqual([(row['name'], row['mention_count']) for row in data['results']], [('SKT', 2), ('KT', 1)])
@@ -1,15 +1,20 @@
+from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_503_SERVICE_UNAVAILABLE
 
 from api.versioned.v1.concept.serializers import ConceptSerializer
-from api.versioned.v1.utils.neo4j_client import Neo4jClient
+from api.versioned.v1.utils.graph_cache import cached_graph_response
+from api.versioned.v1.utils.graph_engine import GraphEngineLoading, get_graph_engine
+from api.versioned.v1.utils.neo4j_client import (
+    HUB_QUERY, Neo4jUnavailable, decode_rank_cursor, encode_rank_cursor, get_neo4j_client
+)
+from api.versioned.v1.utils.vector_index import get_vector_index
 from concept.models import Concept, ConceptRelationship, ConceptDomain
 from event.models import Event
-from entity.models import Entity
-from entity import models
+from entity.models import EntityMentionRollup
 
 class ConceptViewSet(viewsets.ModelViewSet):
     """
@@ -19,7 +24,8 @@ class ConceptViewSet(viewsets.ModelViewSet):
     """
     permission_classes = [IsAuthenticated, ]
     serializer_class = ConceptSerializer
-    queryset = Concept.objects.all()
+    queryset = Concept.objects.select_related('domain')
+    keyset_ordering = ('-created_at', '-id')  # 목록 키셋 페이지네이션 정렬 (액션별로 바꿀 수 있음)
     
     @action(detail=True, methods=['get'])
     def related_concepts(self, request, pk=None):
@@ -27,32 +33,69 @@ class ConceptViewSet(viewsets.ModelViewSet):
         try:
             concept = self.get_object()
             
-            # 관련 개념 조회 (Django ORM)
-            related = ConceptRelationship.objects.filter(source_concept=concept)
+            def build():
+                # 관련 개념 조회 (Django ORM)
+                related = ConceptRelationship.objects.filter(source_concept=concept)
+                
+                result = []
+                for rel in related:
+                    result.append({
+                        'concept_id': rel.target_concept.id,
+                        'name': rel.target_concept.name,
+                        'description': rel.target_concept.description,
+                        'relationship_type': rel.relationship_type,
+                        'weight': rel.weight
+                    })
+                
+                # Neo4j에서 추가 관련 개념 조회 (쓸 수 없으면 프로세스 내 그래프 엔진)
+                neo4j_client = get_neo4j_client()
+                if neo4j_client.graph is not None:
+                    neo4j_related = neo4j_client.find_related_concepts(concept.name)
+                else:
+                    neo4j_related = get_graph_engine().find_related_concepts(concept.id)
+                
+                # 중복 제거하면서 Neo4j 결과 추가
+                existing_names = [item['name'] for item in result]
+                for item in neo4j_related:
+                    if item['name'] not in existing_names:
+                        result.append({
+                            'name': item['name'],
+                            'description': item.get('description', ''),
+                            'relationship_type': item.get('relationship_type', 'RELATED_TO'),
+                            'weight': item.get('weight', 0.5)
+                        })
+                
+                return result
+            
+            # 개념 그래프 버전이 같으면 캐시된 응답 사용 (ETag/Last-Modified로 304 응답)
+            return cached_graph_response(request, 'concept-related', concept, build)
+            
+        except GraphEngineLoading as e:
+            # 스냅샷 없이 그래프 엔진을 처음 적재하는 중 (불완전한 그래프를 캐시하지 않도록 재시도 요청)
+            return Response({"error": str(e)}, status=HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': '5'})
+        except Exception as e:
+            return Response({"error": str(e)}, status=HTTP_400_BAD_REQUEST)
+    
+    @action(detail=True, methods=['get'])
+    def similar(self, request, pk=None):
+        """의미적으로 유사한 개념 조회 (임베딩 벡터 인덱스, ?k=개수)"""
+        try:
+            concept = self.get_object()
+            if concept.embedding is None:
+                return Response({"error": "개념 임베딩이 아직 생성되지 않았습니다."}, status=HTTP_400_BAD_REQUEST)
+            
+            k = min(max(int(request.query_params.get('k', 10)), 1), 100)
+            neighbours = get_vector_index('concept').search(concept.embedding_vector, k, exclude={concept.id})
+            concepts = Concept.objects.in_bulk([concept_id for concept_id, _ in neighbours])
             
             result = []
-            for rel in related:
-                result.append({
-                    'concept_id': rel.target_concept.id,
-                    'name': rel.target_concept.name,
-                    'description': rel.target_concept.description,
-                    'relationship_type': rel.relationship_type,
-                    'weight': rel.weight
-                })
-            
-            # Neo4j에서 추가 관련 개념 조회
-            neo4j_client = Neo4jClient()
-            neo4j_related = neo4j_client.find_related_concepts(concept.name)
-            
-            # 중복 제거하면서 Neo4j 결과 추가
-            existing_names = [item['name'] for item in result]
-            for item in neo4j_related:
-                if item['name'] not in existing_names:
+            for concept_id, score in neighbours:
+                if concept_id in concepts:
                     result.append({
-                        'name': item['name'],
-                        'description': item.get('description', ''),
-                        'relationship_type': item.get('relationship_type', 'RELATED_TO'),
-                        'weight': item.get('weight', 0.5)
+                        'concept_id': concept_id,
+                        'name': concepts[concept_id].name,
+                        'description': concepts[concept_id].description,
+                        'score': round(score, 4)
                     })
             
             return Response(result, status=HTTP_200_OK)
@@ -94,7 +137,7 @@ class ConceptViewSet(viewsets.ModelViewSet):
     def events(self, request):
         """이벤트 목록 조회"""
         try:
-            events = Event.objects.all().order_by('-created_at')
+            events = self.paginate_queryset(Event.objects.select_related('domain'))
             
             result = []
             for event in events:
@@ -105,60 +148,65 @@ class ConceptViewSet(viewsets.ModelViewSet):
                     'event_date': event.event_date,
                     'event_type': event.event_type,
                     'domain': event.domain.name if event.domain else None,
-                    'article_count': event.articles.count()
+                    'article_count': event.article_count
                 }
                 
                 result.append(event_data)
             
-            return Response(result, status=HTTP_200_OK)
+            return self.get_paginated_response(result)
             
         except Exception as e:
             return Response({"error": str(e)}, status=HTTP_400_BAD_REQUEST)
     
-    @action(detail=False, methods=['get'])
+    @action(detail=False, methods=['get'], keyset_ordering=('-mention_count', '-entity_id'))
     def entities(self, request):
         """엔티티 목록 조회"""
         try:
             entity_type = request.query_params.get('type')
             
+            # 언급 수 집계에서 많이 언급된 순으로 인덱스를 따라 읽음 (페이지 크기 기본 100)
+            rollups = EntityMentionRollup.objects.select_related('entity')
             if entity_type:
-                entities = Entity.objects.filter(entity_type=entity_type)
-            else:
-                entities = Entity.objects.all()
-            
-            # 많이 언급된 순으로 정렬
-            entities = entities.annotate(
-                mention_count=models.Sum('articleentity__mention_count')
-            ).order_by('-mention_count')[:100]  # 상위 100개만
+                rollups = rollups.filter(entity_type=entity_type)
+            rollups = self.paginate_queryset(rollups)
             
             result = []
-            for entity in entities:
+            for rollup in rollups:
+                entity = rollup.entity
                 entity_data = {
                     'id': entity.id,
                     'name': entity.name,
                     'entity_type': entity.entity_type,
                     'description': entity.description,
-                    'mention_count': entity.mention_count
+                    'mention_count': rollup.mention_count
                 }
                 
                 result.append(entity_data)
             
-            return Response(result, status=HTTP_200_OK)
+            return self.get_paginated_response(result)
             
         except Exception as e:
             return Response({"error": str(e)}, status=HTTP_400_BAD_REQUEST)
             
     @action(detail=False, methods=['get'])
     def knowledge_graph(self, request):
-        """전체 지식 그래프 조회 (제한된 크기)"""
+        """
+        전체 지식 그래프 조회 (제한된 크기)
+        
+        concept/event가 없으면 중요도 상위 노드와 그 사이의 간선을 limit개 노드씩 내려주며,
+        응답의 next_cursor를 cursor로 넘기면 다음 노드들을 이어서 불러옵니다.
+        """
         try:
             # Neo4j에서 지식 그래프 조회
-            neo4j_client = Neo4jClient()
+            neo4j_client = get_neo4j_client()
             
-            # 쿼리 파라미터
+            # 쿼리 파라미터 (limit은 서버 상한으로 제한)
             concept_name = request.query_params.get('concept')
             event_name = request.query_params.get('event')
-            limit = int(request.query_params.get('limit', 100))
+            limit = int(request.query_params.get('limit', settings.KNOWLEDGE_GRAPH_DEFAULT_LIMIT))
+            limit = min(max(limit, 1), settings.KNOWLEDGE_GRAPH_MAX_LIMIT)
+            cursor = request.query_params.get('cursor')
+            cursor = decode_rank_cursor(cursor) if cursor else None
             
             # Cypher 쿼리 구성
             if concept_name:
@@ -182,51 +230,76 @@ class ConceptViewSet(viewsets.ModelViewSet):
                 params = {'event_name': event_name, 'limit': limit}
                 
             else:
-                # 기본 쿼리 - 가장 연결이 많은 상위 노드 중심
-                query = """
-                MATCH (n)-[r]-(m)
-                RETURN n, r, m
-                LIMIT $limit
-                """
-                params = {'limit': limit}
+                # 기본 쿼리 - 중요도 상위 노드(커서 이후)와, 이 노드끼리 또는 이전 페이지 노드와의 간선
+                query = HUB_QUERY
+                importance, label, node_id = cursor or (float('inf'), '', -1)
+                params = {'importance': importance, 'label': label, 'id': node_id, 'limit': limit}
             
-            # Neo4j에서 직접 실행
-            results = neo4j_client.graph.run(query, **params)
+            # Neo4j에서 직접 실행 (쓸 수 없으면 프로세스 내 그래프 엔진에서 같은 범위로 조회)
+            try:
+                results = neo4j_client.run(query, **params)
+            except Neo4jUnavailable:
+                if concept_name or event_name:
+                    graph_data = get_graph_engine().knowledge_graph(
+                        concept_name=concept_name,
+                        event_name=event_name,
+                        limit=limit
+                    )
+                else:
+                    graph_data = get_graph_engine().hub_graph(limit, cursor)
+                return Response(graph_data, status=HTTP_200_OK)
             
-            # 결과를 그래프 형태로 가공
+            # 결과를 그래프 형태로 가공 (노드와 관계 모두 identity로 중복 제거)
             nodes = []
             edges = []
             node_ids = set()
+            edge_ids = set()
             
             for record in results:
-                # 각 레코드의 노드 추출
-                record_nodes = [record.get(k) for k in record.keys() if record.get(k) and hasattr(record.get(k), 'identity')]
-                
-                # 노드 추가 (중복 방지)
-                for node in record_nodes:
-                    if node and node.identity not in node_ids:
-                        node_ids.add(node.identity)
-                        nodes.append({
-                            'id': node.identity,
-                            'labels': list(node.labels),
-                            'properties': dict(node)
-                        })
-                
-                # 관계 추출 및 엣지 추가
                 for key in record.keys():
-                    rel = record.get(key)
-                    if rel and hasattr(rel, 'start_node') and hasattr(rel, 'end_node'):
-                        edges.append({
-                            'from': rel.start_node.identity,
-                            'to': rel.end_node.identity,
-                            'type': type(rel).__name__,
-                            'properties': dict(rel)
+                    value = record.get(key)
+                    if value is None:
+                        continue
+                    
+                    if hasattr(value, 'start_node') and hasattr(value, 'end_node'):
+                        # 관계
+                        if value.identity not in edge_ids:
+                            edge_ids.add(value.identity)
+                            edges.append({
+                                'from': value.start_node.identity,
+                                'to': value.end_node.identity,
+                                'type': type(value).__name__,
+                                'properties': dict(value)
+                            })
+                    elif hasattr(value, 'labels') and value.identity not in node_ids:
+                        # 노드
+                        node_ids.add(value.identity)
+                        nodes.append({
+                            'id': value.identity,
+                            'labels': list(value.labels),
+                            'properties': dict(value)
                         })
             
-            return Response({
+            graph_data = {
                 'nodes': nodes,
                 'edges': edges
-            }, status=HTTP_200_OK)
+            }
+            
+            if not (concept_name or event_name):
+                # 페이지가 가득 찼으면 마지막(중요도가 가장 낮은) 노드를 다음 커서로
+                graph_data['next_cursor'] = None
+                if len(nodes) == limit:
+                    last = max(nodes, key=lambda node: (
+                        -node['properties']['importance'], node['labels'][0], node['properties']['id']
+                    ))
+                    graph_data['next_cursor'] = encode_rank_cursor(
+                        last['properties']['importance'], last['labels'][0], last['properties']['id']
+                    )
+            
+            return Response(graph_data, status=HTTP_200_OK)
             
+        except GraphEngineLoading as e:
+            # 스냅샷 없이 그래프 엔진을 처음 적재하는 중
+            return Response({"error": str(e)}, status=HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': '5'})
         except Exception as e:
             return Response({"error": str(e)}, status=HTTP_400_BAD_REQUEST) 
\ No newline at end of file
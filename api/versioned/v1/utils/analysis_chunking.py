@@ -0,0 +1,173 @@
+import re
+
+from concept.utils import name_key
+
+SENTENCE_END_RE = re.compile(r'(?<=[.!?。？！])\s+')
+WIDE_CHAR_RE = re.compile(r'[ᄀ-ᇿ぀-ヿ㄰-㆏㐀-鿿가-힯]')
+
+
+def estimate_tokens(text):
+    """
+    토큰 수 근사치
+
+    한글/한자/가나는 글자당 1토큰, 나머지는 4글자당 1토큰으로 계산합니다.
+    (토크나이저 없이 청크 크기를 정하기 위한 보수적인 추정)
+    """
+    wide = len(WIDE_CHAR_RE.findall(text))
+    return wide + (len(text) - wide + 3) // 4
+
+
+def mention_count(entity):
+    """GPT가 준 언급 횟수를 정수로 변환 (없거나 숫자가 아니면 1)"""
+    try:
+        return max(int(entity.get('mention_count') or 1), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+def _split_oversized(paragraph, max_tokens):
+    """한 문단이 청크보다 크면 문장 단위, 그래도 크면 글자 단위로 분할"""
+    pieces = []
+    for sentence in SENTENCE_END_RE.split(paragraph):
+        if not sentence:
+            continue
+        if estimate_tokens(sentence) <= max_tokens:
+            pieces.append(sentence)
+            continue
+        step = max(1, max_tokens)  # 글자당 최대 1토큰이므로 max_tokens 글자면 한도 안에 들어감
+        pieces.extend(sentence[i:i + step] for i in range(0, len(sentence), step))
+    return pieces
+
+
+def split_into_chunks(text, max_tokens):
+    """
+    본문을 토큰 한도 안의 청크로 분할
+
+    문단 경계를 우선 유지하며 순서대로 채워 넣으므로 같은 입력은 항상 같은 청크가 됩니다.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    units = []
+    for paragraph in text.split('\n'):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) <= max_tokens:
+            units.append(paragraph)
+        else:
+            units.extend(_split_oversized(paragraph, max_tokens))
+
+    chunks = []
+    current = []
+    current_tokens = 0
+    for unit in units:
+        unit_tokens = estimate_tokens(unit) + 1
+        if current and current_tokens + unit_tokens > max_tokens:
+            chunks.append('\n'.join(current))
+            current = []
+            current_tokens = 0
+        current.append(unit)
+        current_tokens += unit_tokens
+    if current:
+        chunks.append('\n'.join(current))
+
+    return chunks
+
+
+def _ordered_union(lists):
+    seen = set()
+    merged = []
+    for values in lists:
+        for value in values or []:
+            key = name_key(value)
+            if key and key not in seen:
+                seen.add(key)
+                merged.append(value)
+    return merged
+
+
+def _merge_event_info(results):
+    """가장 많은 청크에서 언급된 이벤트 선택 (동률이면 앞선 청크), 빈 필드는 같은 이벤트의 다른 청크로 보완"""
+    candidates = {}
+    for index, result in enumerate(results):
+        event_info = result.get('event_info') or {}
+        key = name_key(event_info.get('event_name', ''))
+        if not key:
+            continue
+        candidate = candidates.setdefault(key, {'count': 0, 'first': index, 'event_info': {}})
+        candidate['count'] += 1
+        for field, value in event_info.items():
+            if value and not candidate['event_info'].get(field):
+                candidate['event_info'][field] = value
+
+    if not candidates:
+        return {}
+    best = min(candidates.values(), key=lambda c: (-c['count'], c['first']))
+    return best['event_info']
+
+
+def merge_analysis_results(results):
+    """
+    청크별 분석 결과 병합
+
+    개념/엔티티/관계는 이름 기준으로 중복 제거하고(신뢰도·가중치는 최댓값,
+    엔티티 언급 횟수는 합산), 요약은 청크 순서대로 이어 붙입니다.
+    """
+    concepts = {}
+    for result in results:
+        for concept in result.get('main_concepts') or []:
+            key = name_key(concept.get('name', ''))
+            if not key:
+                continue
+            merged = concepts.get(key)
+            if merged is None:
+                concepts[key] = dict(concept)
+                continue
+            merged['confidence'] = max(merged.get('confidence') or 0, concept.get('confidence') or 0)
+            if not merged.get('description') and concept.get('description'):
+                merged['description'] = concept['description']
+
+    entities = {}
+    for result in results:
+        for entity in result.get('entities') or []:
+            key = (name_key(entity.get('name', '')), entity.get('entity_type', '기타'))
+            if not key[0]:
+                continue
+            merged = entities.get(key)
+            if merged is None:
+                entities[key] = dict(entity, mention_count=mention_count(entity))
+                continue
+            merged['mention_count'] += mention_count(entity)
+            if not merged.get('description') and entity.get('description'):
+                merged['description'] = entity['description']
+
+    related_concepts = {}
+    for result in results:
+        for concept in result.get('related_concepts') or []:
+            key = name_key(concept.get('name', ''))
+            if not key or key in concepts:
+                continue
+            merged = related_concepts.setdefault(key, dict(concept))
+            merged['confidence'] = max(merged.get('confidence') or 0, concept.get('confidence') or 0)
+
+    relationships = {}
+    for result in results:
+        for rel in result.get('concept_relationships') or []:
+            key = (name_key(rel.get('source', '')), name_key(rel.get('target', '')), rel.get('relationship_type', 'RELATED_TO'))
+            if not key[0] or not key[1]:
+                continue
+            merged = relationships.setdefault(key, dict(rel))
+            merged['weight'] = max(merged.get('weight') or 0, rel.get('weight') or 0)
+
+    return {
+        'category': _ordered_union(result.get('category') for result in results),
+        'core_themes': _ordered_union(result.get('core_themes') for result in results),
+        'main_concepts': list(concepts.values()),
+        'entities': list(entities.values()),
+        'event_info': _merge_event_info(results),
+        'related_concepts': list(related_concepts.values()),
+        'concept_relationships': list(relationships.values()),
+        'summary': ' '.join(result['summary'].strip() for result in results if result.get('summary')),
+        'related_to_existing_events': _ordered_union(result.get('related_to_existing_events') for result in results),
+    }
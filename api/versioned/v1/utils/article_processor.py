@@ -0,0 +1,408 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, F, FloatField, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Least
+from openai import OpenAI
+
+from api.versioned.v1.utils.analysis_chunking import merge_analysis_results, split_into_chunks
+from api.versioned.v1.utils.catalog_context import get_catalog_snapshot
+from api.versioned.v1.utils.embeddings import embed_articles, embed_concepts
+from api.versioned.v1.utils.fingerprint import content_fingerprint
+from api.versioned.v1.utils.graph_cache import bump_graph_versions
+from api.versioned.v1.utils.graph_engine import get_graph_engine
+from api.versioned.v1.utils.json_stream import IncrementalJSONObjectParser
+from api.versioned.v1.utils.knowledge_writer import KnowledgeWriter
+from api.versioned.v1.utils.llm_cache import get_llm_cache
+from api.versioned.v1.utils.vector_index import get_vector_index
+from article.models import (
+    Article, ArticleConcept, ArticleEntity, ArticleEvent, ArticleProgress, ArticleRelationship, GraphSyncOutbox
+)
+from concept.models import ConceptRelationship
+
+logger = logging.getLogger(__name__)
+OPENAI_API_KEY = settings.OPENAI_API_KEY
+ANALYSIS_MODEL = "gpt-4o"  # 또는 사용 가능한 모델
+
+# 분석 프롬프트 템플릿 버전 (프롬프트를 바꾸면 올려서 LLM 캐시를 무효화)
+PROMPT_VERSION = "2"
+
+# 스트리밍 응답에서 완성되는 즉시 저장하는 섹션 (프롬프트에서도 이 순서로 먼저 응답하도록 배치)
+PROGRESSIVE_SECTIONS = ('summary', 'main_concepts', 'entities')
+
+
+class ArticleProcessor:
+    """
+    기사 분석 처리기
+
+    GPT 분석, DB 저장, 관련 기사 연결, Neo4j 동기화를 수행합니다.
+    API 요청과 분리되어 분석 워커(run_analysis_worker)에서 실행됩니다.
+    """
+    
+    def analyze_and_process_article(self, article):
+        """기사 분석 및 처리"""
+        try:
+            ArticleProgress.objects.record(article, ArticleProgress.STAGE_ANALYZING)
+            
+            # 재시도인 경우 이전 시도에서 부분 저장된 분석 결과 정리
+            self.clear_analysis(article)
+            
+            # 같은 본문이 이미 분석되었다면 GPT 호출 없이 분석 결과 재사용
+            source_article = self.find_analyzed_duplicate(article)
+            if source_article:
+                return self.reuse_analysis(article, source_article)
+            
+            # GPT 분석 (긴 본문은 청크별로 병렬 분석 후 병합)
+            # 스트리밍 응답에서 요약/주요 개념/엔티티 섹션이 완성되는 즉시 저장
+            persisted = set()
+            analysis_result = self.analyze_content(
+                article,
+                on_section=lambda key, value: self.persist_section(article, key, value, persisted)
+            )
+            
+            # 개념 매핑용 임베딩은 쓰기 트랜잭션을 열기 전에 계산
+            writer = KnowledgeWriter(article)
+            pending_concepts = [] if 'main_concepts' in persisted else analysis_result.get('main_concepts') or []
+            writer.prepare_concepts(pending_concepts, analysis_result.get('concept_relationships', []))
+            
+            # 분석 결과를 DB에 저장
+            with transaction.atomic():
+                # 스트리밍 중 저장되지 않은 섹션 저장 (캐시 응답, 청크 분석 등)
+                for key in PROGRESSIVE_SECTIONS:
+                    if key not in persisted:
+                        self.persist_section(article, key, analysis_result.get(key), persisted, writer)
+                
+                # 카테고리 저장
+                domains = writer.write_domains(analysis_result.get('category', []))
+                
+                # 이벤트 저장 및 관련된 기존 이벤트 연결 (이벤트 도메인은 첫 번째 카테고리)
+                writer.write_events(
+                    analysis_result.get('event_info', {}),
+                    analysis_result.get('related_to_existing_events', []),
+                    domain=domains[0] if domains else None
+                )
+                
+                # 개념 간 관계 저장
+                writer.write_concept_relationships(analysis_result.get('concept_relationships', []))
+                
+                # 관련 기사 찾기 및 관계 설정
+                self.find_and_link_related_articles(article)
+                
+                # Neo4j 동기화 요청 (replicate_graph 명령이 커밋 이후 비동기로 복제)
+                GraphSyncOutbox.objects.enqueue(article)
+                
+                # 이 기사와 연결된 개념의 그래프 응답 캐시 무효화 (버전 증가)
+                bump_graph_versions([article.id])
+                
+                # 처리 완료로 상태 변경
+                article.processing_status = 'completed'
+                article.save()
+                ArticleProgress.objects.record(article, ArticleProgress.STAGE_COMPLETED)
+            
+            # 새 개념과 기사 요약 임베딩 (실패해도 분석은 완료로 간주)
+            if settings.EMBEDDING_ON_ANALYSIS:
+                self.embed_article(article)
+            
+            # 이 프로세스에 그래프 엔진이 적재되어 있으면 새 관계 반영
+            get_graph_engine().refresh()
+                
+            return True
+            
+        except Exception as e:
+            logger.error(f"기사 분석 중 오류 발생: {str(e)}")
+            article.processing_status = 'failed'
+            article.error_message = str(e)
+            article.save()
+            # 실패 진행 단계(retrying/failed)는 재시도 여부를 아는 분석 워커가 기록
+            return False
+    
+    def persist_section(self, article, key, value, persisted, writer=None):
+        """
+        분석 결과 섹션(요약, 주요 개념, 엔티티) 저장 및 진행 단계 기록
+        
+        writer가 없으면 새로 만들고, 주요 개념의 임베딩을 트랜잭션을 열기 전에 계산합니다.
+        """
+        if key not in PROGRESSIVE_SECTIONS or key in persisted:
+            return
+        
+        if writer is None:
+            writer = KnowledgeWriter(article)
+            if key == 'main_concepts':
+                writer.prepare_concepts(value or [])
+        
+        with transaction.atomic():
+            if key == 'summary':
+                article.summary = value or ''
+                Article.objects.filter(id=article.id).update(summary=article.summary)
+                ArticleProgress.objects.record(article, ArticleProgress.STAGE_SUMMARY_SAVED)
+            elif key == 'main_concepts':
+                writer.write_concepts(value or [])
+                ArticleProgress.objects.record(article, ArticleProgress.STAGE_CONCEPTS_SAVED, count=len(value or []))
+            elif key == 'entities':
+                writer.write_entities(value or [])
+                ArticleProgress.objects.record(article, ArticleProgress.STAGE_ENTITIES_SAVED, count=len(value or []))
+        
+        persisted.add(key)
+    
+    def clear_analysis(self, article):
+        """기사에 저장된 분석 결과(도메인, 개념/엔티티/이벤트 연결, 관련 기사) 삭제"""
+        article.domains.clear()
+        ArticleConcept.objects.filter(article=article).delete()
+        ArticleEntity.objects.filter(article=article).delete()
+        ArticleEvent.objects.filter(article=article).delete()
+        ArticleRelationship.objects.filter(source_article=article).delete()
+    
+    def build_prompt(self, text, catalog):
+        """GPT 분석 프롬프트 구성 (도메인/이벤트/개념 목록은 카탈로그 스냅샷 사용)"""
+        return f"""
+        다음 텍스트를 한국어로 분석하고 다음 정보를 무조건 한국어로 추출하세요:
+
+        1. 모든 응답은 JSON 형식으로 제공해야 합니다.
+        2. 다음 영어 키를 정확히 사용하여 응답하세요:
+        {{
+            "summary": "",            // 기사 요약 (3-5문장)
+            "category": [],           // 콘텐츠 카테고리 (예: 기술, 과학, 경제, 교육 등)
+            "core_themes": [],        // 주요 주제/토픽 (2-5개)
+            "main_concepts": [        // 주요 개념 (형식: {{ "name": "개념 이름", "description": "간략한 설명", "confidence": 95 }})
+            ],
+            "entities": [             // 기사에 등장하는 주요 엔티티 (형식: {{ "name": "엔티티 이름", "entity_type": "조직/인물/제품/기술", "mention_count": 3 }})
+            ],
+            "event_info": {{          // 기사가 다루는 이벤트 정보
+                "event_name": "",     // 이벤트 이름 (예: "SKT 유심 해킹 사건")
+                "event_date": "",     // 이벤트 발생 날짜 (정확한 YYYY-MM-DD 형식만 입력, 없으면 빈 문자열)
+                "event_type": "",     // 이벤트 유형 (예: "사이버 보안 사고")
+                "description": ""     // 이벤트 간략 설명
+            }},
+            "related_concepts": [     // 기사에 직접 언급되지 않았지만 관련된 개념들 (형식: {{ "name": "개념 이름", "confidence": 80 }})
+            ],
+            "concept_relationships": [ // 개념 간 관계 (형식: {{ "source": "개념1", "target": "개념2", "relationship_type": "RELATED_TO/IS_A/PART_OF", "weight": 0.9 }})
+            ],
+            "related_to_existing_events": [] // 이 기사가 관련된 기존 이벤트 목록 (아래 목록에서 선택)
+        }}
+
+        이 기사가 다음 기존 이벤트와 관련이 있는지 평가하세요:
+        {catalog['existing_events']}
+
+        적절한 도메인 분류:
+        {catalog['domains']}
+
+        기존에 추출된 주요 개념(비슷한 개념이 있다면 재사용하는 것이 좋습니다):
+        {catalog['existing_concepts']}
+
+        리프 도메인 목록(가장 구체적인 도메인):
+        {catalog['leaf_domains']}
+
+        텍스트:
+        {text}
+        """
+    
+    def analyze_content(self, article, on_section=None):
+        """
+        기사 본문 분석
+        
+        본문이 ANALYSIS_CHUNK_MAX_TOKENS를 넘으면 청크로 나눠 병렬로 분석하고
+        결과를 결정적으로 병합하므로, 지연 시간이 문서 길이가 아닌 청크 크기에 비례합니다.
+        단일 청크는 스트리밍으로 받아 섹션이 완성될 때마다 on_section(key, value)을 호출합니다.
+        """
+        catalog = get_catalog_snapshot().context()
+        chunks = split_into_chunks(article.content, settings.ANALYSIS_CHUNK_MAX_TOKENS)
+        
+        # OpenAI API 호출 (같은 본문·모델·프롬프트 버전이면 캐시된 응답 사용)
+        if len(chunks) == 1:
+            text_hash = article.content_hash or content_fingerprint(article.content)
+            return self.request_analysis(self.build_prompt(article.content, catalog), text_hash, on_section)
+        
+        logger.info(f"긴 기사 청크 분석: article_id={article.id}, chunks={len(chunks)}")
+        with ThreadPoolExecutor(max_workers=min(len(chunks), settings.ANALYSIS_CHUNK_CONCURRENCY)) as executor:
+            results = list(executor.map(
+                lambda chunk: self.request_analysis(self.build_prompt(chunk, catalog), content_fingerprint(chunk)),
+                chunks
+            ))
+        
+        return merge_analysis_results(results)
+    
+    def request_analysis(self, prompt, text_hash, on_section=None):
+        """
+        GPT 분석 요청 (LLM 응답 캐시 적용)
+        
+        on_section이 주어지면 스트리밍으로 응답을 받아 최상위 섹션이 완성될 때마다 호출합니다.
+        캐시된 응답은 스트리밍 없이 바로 반환합니다.
+        """
+        cache = get_llm_cache()
+        cache_key = cache.make_key(text_hash, ANALYSIS_MODEL, PROMPT_VERSION) if cache else None
+        
+        gpt_response = cache.get(cache_key) if cache else None
+        if gpt_response is not None:
+            return json.loads(gpt_response)
+        
+        client = OpenAI(api_key=OPENAI_API_KEY)
+        request = {
+            'model': ANALYSIS_MODEL,
+            'messages': [
+                {"role": "system", "content": "주어진 텍스트를 분석하여 구조화된 JSON으로 응답하는 도우미입니다."},
+                {"role": "user", "content": prompt}
+            ],
+            'response_format': {"type": "json_object"}
+        }
+        
+        if on_section is None:
+            completion = client.chat.completions.create(**request)
+            gpt_response = completion.choices[0].message.content
+        else:
+            parser = IncrementalJSONObjectParser(on_section)
+            for chunk in client.chat.completions.create(stream=True, **request):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parser.feed(chunk.choices[0].delta.content)
+            gpt_response = parser.text
+
+        # 응답 JSON 파싱 (파싱 가능한 응답만 캐시)
+        analysis_result = json.loads(gpt_response)
+        if cache:
+            cache.set(cache_key, gpt_response)
+        
+        return analysis_result
+    
+    def find_analyzed_duplicate(self, article):
+        """본문 지문이 같고 분석이 완료된 다른 기사 조회"""
+        if not article.content_hash:
+            return None
+        
+        return Article.objects.filter(
+            content_hash=article.content_hash,
+            processing_status='completed'
+        ).exclude(id=article.id).order_by('id').first()
+    
+    def reuse_analysis(self, article, source_article):
+        """다른 기사의 분석 결과(요약, 도메인, 개념, 엔티티, 이벤트) 복제"""
+        with transaction.atomic():
+            article.summary = source_article.summary
+            article.domains.set(source_article.domains.all())
+            
+            ArticleConcept.objects.bulk_create([
+                ArticleConcept(
+                    article=article,
+                    concept_id=ac.concept_id,
+                    confidence=ac.confidence,
+                    is_key_concept=ac.is_key_concept
+                )
+                for ac in ArticleConcept.objects.filter(article=source_article)
+            ], ignore_conflicts=True)
+            
+            ArticleEntity.objects.bulk_create([
+                ArticleEntity(
+                    article=article,
+                    entity_id=ae.entity_id,
+                    confidence=ae.confidence,
+                    mention_count=ae.mention_count
+                )
+                for ae in ArticleEntity.objects.filter(article=source_article)
+            ], ignore_conflicts=True)
+            
+            ArticleEvent.objects.bulk_create([
+                ArticleEvent(
+                    article=article,
+                    event_id=ae.event_id,
+                    relationship_type=ae.relationship_type,
+                    confidence=ae.confidence
+                )
+                for ae in ArticleEvent.objects.filter(article=source_article)
+            ], ignore_conflicts=True)
+            
+            # 관련 기사 찾기 및 관계 설정
+            self.find_and_link_related_articles(article)
+            
+            ArticleProgress.objects.record_many([article], [
+                ArticleProgress.STAGE_SUMMARY_SAVED,
+                ArticleProgress.STAGE_CONCEPTS_SAVED,
+                ArticleProgress.STAGE_ENTITIES_SAVED
+            ])
+            
+            # Neo4j 동기화 요청 (replicate_graph 명령이 커밋 이후 비동기로 복제)
+            GraphSyncOutbox.objects.enqueue(article)
+            bump_graph_versions([article.id])
+            
+            article.processing_status = 'completed'
+            article.save()
+            ArticleProgress.objects.record(article, ArticleProgress.STAGE_COMPLETED, reused_from=source_article.id)
+        
+        if settings.EMBEDDING_ON_ANALYSIS:
+            self.embed_article(article)
+        
+        get_graph_engine().refresh()
+        
+        logger.info(f"분석 결과 재사용: article_id={article.id}, source_article_id={source_article.id}")
+        return True
+    
+    def embed_article(self, article):
+        """기사 요약과 임베딩이 없는 연결 개념의 임베딩을 배치로 생성하고 벡터 인덱스에 추가"""
+        try:
+            concepts = list(article.concepts.filter(embedding__isnull=True).only('id', 'name', 'description'))
+            embed_concepts(concepts)
+            concepts = [concept for concept in concepts if concept.embedding is not None]
+            if concepts:
+                get_vector_index('concept').insert(
+                    [concept.id for concept in concepts],
+                    [concept.embedding_vector for concept in concepts]
+                )
+            if embed_articles([article]):
+                get_vector_index('article').insert([article.id], [article.summary_embedding_vector])
+            return True
+        except Exception as e:
+            logger.warning(f"임베딩 생성 중 오류 발생: {str(e)}")
+            return False
+    
+    def find_and_link_related_articles(self, article):
+        """
+        관련 기사 찾기 및 연결
+        
+        이벤트나 개념을 공유하는 후보 기사별 공유 개념/이벤트 수를 한 번의 집계 쿼리로 계산하고,
+        점수 상위 RELATED_ARTICLE_TOP_K개(RELATED_ARTICLE_MIN_SCORE 이상)만 일괄 저장합니다.
+        같은 이벤트를 다루면 RELATED_TO(0.8), 아니면 공통 개념이 많을수록 높은 RELATED_BY_CONCEPT 점수를 줍니다.
+        """
+        try:
+            concept_ids = ArticleConcept.objects.filter(article=article).values('concept_id')
+            event_ids = ArticleEvent.objects.filter(article=article).values('event_id')
+            
+            shared_concepts = ArticleConcept.objects.filter(
+                article=OuterRef('pk'), concept_id__in=concept_ids
+            ).values('article').annotate(count=Count('*')).values('count')
+            shared_events = ArticleEvent.objects.filter(
+                article=OuterRef('pk'), event_id__in=event_ids
+            ).values('article').annotate(count=Count('*')).values('count')
+            
+            candidates = Article.objects.filter(
+                Q(id__in=ArticleConcept.objects.filter(concept_id__in=concept_ids).values('article_id'))
+                | Q(id__in=ArticleEvent.objects.filter(event_id__in=event_ids).values('article_id'))
+            ).exclude(id=article.id).annotate(
+                shared_concepts=Coalesce(Subquery(shared_concepts, output_field=IntegerField()), 0),
+                shared_events=Coalesce(Subquery(shared_events, output_field=IntegerField()), 0),
+            ).annotate(
+                score=Case(
+                    When(shared_events__gt=0, then=Value(0.8)),
+                    default=Least(Value(0.9), (Value(5.0) + F('shared_concepts')) / Value(10.0)),
+                    output_field=FloatField()
+                )
+            ).filter(
+                score__gte=settings.RELATED_ARTICLE_MIN_SCORE
+            ).order_by('-score', '-shared_events', '-shared_concepts', '-id').values_list(
+                'id', 'shared_events', 'score'
+            )[:settings.RELATED_ARTICLE_TOP_K]
+            
+            ArticleRelationship.objects.bulk_create([
+                ArticleRelationship(
+                    source_article=article,
+                    target_article_id=target_id,
+                    relationship_type='RELATED_TO' if shared_event_count else 'RELATED_BY_CONCEPT',
+                    similarity_score=score
+                )
+                for target_id, shared_event_count, score in candidates
+            ], ignore_conflicts=True)
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"관련 기사 연결 중 오류 발생: {str(e)}")
+            return False
@@ -0,0 +1,107 @@
+import threading
+import time
+
+from django.conf import settings
+
+EXISTING_EVENT_LIMIT = 10
+EXISTING_CONCEPT_LIMIT = 20
+
+
+class CatalogSnapshot:
+    """
+    분석 프롬프트용 카탈로그 컨텍스트 스냅샷 (프로세스 단위)
+
+    리프 도메인, 전체 도메인, 기존 이벤트, 기존 개념 이름 목록을 메모리에 보관하고
+    프롬프트에 들어갈 문자열로 미리 렌더링해 둡니다.
+    같은 프로세스의 변경은 모델 시그널로 즉시 반영(생성은 증분, 수정/삭제는 세대 증가)되고,
+    다른 프로세스의 변경은 CATALOG_SNAPSHOT_TTL이 지나면 다시 읽어 반영됩니다.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.generation = 0
+        self._lock = threading.RLock()
+        self._loaded_generation = -1
+        self._loaded_at = 0.0
+        self._domains = []
+        self._domain_parents = {}
+        self._events = []
+        self._concepts = []
+        self._rendered = None
+
+    def context(self):
+        """프롬프트 컨텍스트 반환 (필요할 때만 DB에서 다시 읽음)"""
+        with self._lock:
+            if self._loaded_generation != self.generation or time.monotonic() - self._loaded_at > self.ttl:
+                self._load()
+            if self._rendered is None:
+                self._render()
+            return self._rendered
+
+    def invalidate(self):
+        """세대 증가 (다음 조회 때 전체를 다시 읽음)"""
+        with self._lock:
+            self.generation += 1
+
+    def _load(self):
+        from concept.models import ConceptDomain, Concept
+        from event.models import Event
+
+        self._domains = list(ConceptDomain.objects.order_by('id').values_list('id', 'name', 'parent_id'))
+        self._domain_parents = {domain_id: parent_id for domain_id, _, parent_id in self._domains}
+        self._events = list(Event.objects.order_by('id').values_list('name', flat=True)[:EXISTING_EVENT_LIMIT])
+        self._concepts = list(Concept.objects.order_by('id').values_list('name', flat=True)[:EXISTING_CONCEPT_LIMIT])
+        self._loaded_generation = self.generation
+        self._loaded_at = time.monotonic()
+        self._rendered = None
+
+    def _render(self):
+        parent_ids = set(self._domain_parents.values())
+        self._rendered = {
+            'leaf_domains': str([name for domain_id, name, _ in self._domains if domain_id not in parent_ids]),
+            'domains': str([name for _, name, _ in self._domains]),
+            'existing_events': str(self._events),
+            'existing_concepts': str(self._concepts),
+        }
+
+    def _apply(self, update):
+        """로드된 스냅샷에 증분 변경 적용 (로드 전이면 무시)"""
+        with self._lock:
+            if self._loaded_generation != self.generation:
+                return
+            update()
+            self._rendered = None
+
+    def domain_created(self, domain):
+        def update():
+            self._domains.append((domain.id, domain.name, domain.parent_id))
+            self._domain_parents[domain.id] = domain.parent_id
+        self._apply(update)
+
+    def event_created(self, event):
+        def update():
+            if len(self._events) < EXISTING_EVENT_LIMIT:
+                self._events.append(event.name)
+        self._apply(update)
+
+    def concepts_created(self, names):
+        def update():
+            for name in names:
+                if len(self._concepts) >= EXISTING_CONCEPT_LIMIT:
+                    break
+                self._concepts.append(name)
+        self._apply(update)
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def get_catalog_snapshot():
+    """프로세스 공용 카탈로그 스냅샷 반환"""
+    global _snapshot
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                _snapshot = CatalogSnapshot(settings.CATALOG_SNAPSHOT_TTL)
+    return _snapshot
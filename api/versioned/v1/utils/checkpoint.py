@@ -0,0 +1,26 @@
+import json
+import os
+
+
+def load_checkpoint(path):
+    """작업 재개 지점 읽기 (파일이 없거나 읽을 수 없으면 빈 dict)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_checkpoint(path, checkpoint):
+    """
+    작업 재개 지점 저장
+
+    임시 파일에 쓴 뒤 os.replace로 바꾸므로 중간에 중단돼도 이전 체크포인트가 깨지지 않습니다.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
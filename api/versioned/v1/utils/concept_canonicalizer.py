@@ -0,0 +1,211 @@
+import logging
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from api.versioned.v1.utils.embeddings import concept_text, get_embedding_engine, vector_to_bytes
+from api.versioned.v1.utils.vector_index import get_vector_index
+from concept.models import Concept, ConceptAlias
+from concept.utils import name_key
+
+logger = logging.getLogger(__name__)
+
+
+class ConceptCanonicalizer:
+    """
+    개념 이름을 대표 개념으로 매핑
+
+    GPT가 돌려준 이름마다 1) 별칭 테이블 2) 정규화 이름 키 3) 임베딩 최근접 이웃(임계값 이상)
+    순으로 기존 대표 개념을 찾고, 찾지 못한 이름만 새 개념으로 만듭니다.
+    매핑 결과는 별칭 테이블에 기록하므로 같은 표기는 다음부터 조회 한 번으로 해결됩니다.
+
+    임베딩 계산은 CPU를 오래 쓰므로 쓰기 트랜잭션 밖에서 prepare()로 미리 해 둡니다.
+    트랜잭션 안의 resolve()는 미리 계산된 벡터만 쓰고, 없는 이름은 이름 기준으로만 매핑합니다.
+    """
+
+    def __init__(self, similarity_threshold=None):
+        if similarity_threshold is None:
+            similarity_threshold = settings.CONCEPT_CANONICAL_SIMILARITY
+        self.similarity_threshold = similarity_threshold
+        self.vectors = {}  # 정규화 이름 키 -> 미리 계산한 임베딩
+
+    def prepare(self, concepts_data):
+        """
+        별칭/정규화 이름으로 찾을 수 없는 이름의 임베딩을 미리 계산 (트랜잭션을 열기 전에 호출)
+        """
+        if not self.similarity_threshold:
+            return
+        data_by_key = {}
+        for concept_data in concepts_data:
+            key = name_key(concept_data.get('name'))
+            if key and key not in self.vectors:
+                data_by_key.setdefault(key, concept_data)
+        if not data_by_key:
+            return
+
+        known = set(ConceptAlias.objects.filter(normalized_alias__in=list(data_by_key)).values_list('normalized_alias', flat=True))
+        known.update(Concept.objects.filter(normalized_name__in=list(data_by_key)).values_list('normalized_name', flat=True))
+        self.vectors.update(self._encode({key: data for key, data in data_by_key.items() if key not in known}))
+
+    def resolve(self, concepts_data):
+        """
+        개념 데이터 목록을 대표 개념으로 변환 (없으면 생성)
+
+        반환값: ({원래 이름: Concept}, 새로 만든 개념 이름 목록)
+        """
+        data_by_key = {}
+        names_by_key = {}
+        for concept_data in concepts_data:
+            key = name_key(concept_data.get('name'))
+            if key:
+                data_by_key.setdefault(key, concept_data)
+                names_by_key.setdefault(key, []).append(concept_data['name'])
+        if not data_by_key:
+            return {}, []
+
+        resolved = {}
+        new_aliases = []
+
+        # 1) 별칭 테이블
+        for alias in ConceptAlias.objects.filter(normalized_alias__in=list(data_by_key)).select_related('concept'):
+            resolved[alias.normalized_alias] = alias.concept
+
+        # 2) 정규화 이름 일치 (가장 먼저 만들어진 개념)
+        missing = [key for key in data_by_key if key not in resolved]
+        if missing:
+            for concept in Concept.objects.filter(normalized_name__in=missing).order_by('id'):
+                if concept.normalized_name not in resolved:
+                    resolved[concept.normalized_name] = concept
+                    new_aliases.append((concept.normalized_name, ConceptAlias.METHOD_NORMALIZED, None))
+
+        # 3) 임베딩 최근접 이웃
+        missing = [key for key in data_by_key if key not in resolved]
+        vectors = {}
+        if missing and self.similarity_threshold:
+            vectors, matches = self._nearest({key: data_by_key[key] for key in missing})
+            concepts = Concept.objects.in_bulk([concept_id for concept_id, _ in matches.values()])
+            for key, (concept_id, similarity) in matches.items():
+                if concept_id in concepts:
+                    resolved[key] = concepts[concept_id]
+                    new_aliases.append((key, ConceptAlias.METHOD_EMBEDDING, similarity))
+
+        # 4) 새 개념 생성
+        missing = [key for key in data_by_key if key not in resolved]
+        created = []
+        if missing:
+            created = self._create(missing, data_by_key, vectors, resolved)
+            new_aliases.extend(
+                (key, ConceptAlias.METHOD_CREATED if key in created else ConceptAlias.METHOD_NORMALIZED, None)
+                for key in missing if key in resolved
+            )
+
+        ConceptAlias.objects.bulk_create([
+            ConceptAlias(
+                alias=data_by_key[key]['name'],
+                normalized_alias=key,
+                concept=resolved[key],
+                method=method,
+                similarity=similarity
+            )
+            for key, method, similarity in new_aliases
+        ], ignore_conflicts=True)
+
+        rows = {}
+        for key, names in names_by_key.items():
+            if key in resolved:
+                for name in names:
+                    rows[name] = resolved[key]
+        return rows, [resolved[key].name for key in created]
+
+    def _encode(self, data_by_key):
+        """이름별 임베딩을 한 번에 계산 (반환값: {키: 벡터}, 임베딩을 쓸 수 없으면 빈 결과)"""
+        if not data_by_key:
+            return {}
+        keys = list(data_by_key)
+        try:
+            encoded = get_embedding_engine().encode(
+                concept_text(Concept(name=data_by_key[key]['name'], description=data_by_key[key].get('description', '')))
+                for key in keys
+            )
+        except Exception as e:
+            logger.warning(f"개념 임베딩 계산 실패, 이름 기준으로만 매핑합니다: {str(e)}")
+            return {}
+        return dict(zip(keys, encoded))
+
+    def _nearest(self, data_by_key):
+        """
+        이름별 임베딩으로 개념 인덱스에서 가장 가까운 개념 조회
+
+        트랜잭션 밖이면 prepare()하지 않은 이름의 임베딩을 여기서 계산하고,
+        트랜잭션 안이면 쓰기 잠금을 잡은 채 모델을 돌리지 않도록 미리 계산된 벡터만 씁니다.
+        반환값: ({키: 벡터}, {키: (개념 id, 유사도)})
+        """
+        if not connection.in_atomic_block:
+            self.vectors.update(self._encode({key: data for key, data in data_by_key.items() if key not in self.vectors}))
+
+        index = get_vector_index('concept')
+        vectors = {}
+        matches = {}
+        for key in data_by_key:
+            vector = self.vectors.get(key)
+            if vector is None:
+                continue
+            vectors[key] = vector
+            neighbours = index.search(vector, 1)
+            if neighbours and neighbours[0][1] >= self.similarity_threshold:
+                matches[key] = neighbours[0]
+        return vectors, matches
+
+    def _create(self, keys, data_by_key, vectors, resolved):
+        """
+        새 개념 일괄 생성 (계산해 둔 임베딩도 함께 저장하고 인덱스에 추가)
+
+        다른 작업자가 먼저 넣은 이름은 ignore_conflicts로 삽입이 건너뛰어지므로, 삽입 전후 조회를 비교해
+        이번에 새로 생긴 행의 키만 반환합니다.
+        """
+        names = [data_by_key[key]['name'] for key in keys]
+        existing = set(Concept.objects.filter(name__in=names).values_list('id', flat=True))
+        Concept.objects.bulk_create([
+            Concept(
+                name=data_by_key[key]['name'],
+                normalized_name=key,
+                description=data_by_key[key].get('description', ''),
+                confidence=data_by_key[key].get('confidence', 0.0),
+                embedding=vector_to_bytes(vectors[key]) if key in vectors else None
+            )
+            for key in keys
+        ], ignore_conflicts=True)
+
+        # 동시에 같은 이름을 넣은 경우에도 같은 행으로 수렴하도록 다시 조회
+        rows = {}
+        for concept in Concept.objects.filter(name__in=names).order_by('id'):
+            rows.setdefault(concept.name, concept)
+
+        created = []
+        indexed = []
+        for key in keys:
+            concept = rows.get(data_by_key[key]['name'])
+            if concept is None:
+                continue
+            resolved[key] = concept
+            if concept.id in existing:
+                continue
+            created.append(key)
+            if concept.embedding is not None:
+                indexed.append(concept)
+
+        if indexed:
+            # 롤백되면 없는 id가 인덱스에 남으므로 커밋된 뒤에 추가
+            transaction.on_commit(lambda: self._index(indexed))
+
+        return created
+
+    def _index(self, concepts):
+        """새 개념의 임베딩을 개념 벡터 인덱스에 추가"""
+        try:
+            get_vector_index('concept').insert(
+                [concept.id for concept in concepts],
+                [concept.embedding_vector for concept in concepts]
+            )
+        except Exception as e:
+            logger.warning(f"개념 벡터 인덱스 추가 실패: {str(e)}")
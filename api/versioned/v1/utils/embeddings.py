@@ -0,0 +1,152 @@
+import logging
+import threading
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# 임베딩 저장 형식 (정규화된 벡터는 float16으로도 코사인 유사도 오차가 작음, 384차원 기준 768바이트)
+EMBEDDING_DTYPE = np.float16
+
+
+class EmbeddingEngine:
+    """
+    로컬 sentence-transformers 임베딩 엔진
+
+    모델은 첫 호출 때 한 번만 로드하며, 여러 행의 텍스트를 batch_size 단위로 묶어
+    순전파 한 번에 인코딩합니다. 벡터는 코사인 유사도를 내적으로 계산할 수 있도록 정규화합니다.
+    """
+
+    def __init__(self, model_name, device='cpu', batch_size=64):
+        self.model_name = model_name
+        self.device = device
+        self.batch_size = batch_size
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    logger.info(f"임베딩 모델 로드: {self.model_name} ({self.device})")
+                    self._model = SentenceTransformer(self.model_name, device=self.device)
+        return self._model
+
+    @property
+    def dimension(self):
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts):
+        """텍스트 목록을 정규화된 벡터(float32 ndarray, 행 단위)로 인코딩"""
+        model = self.model
+        with self._lock:
+            return model.encode(
+                list(texts),
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+
+
+def vector_to_bytes(vector):
+    """벡터를 저장 형식(EMBEDDING_DTYPE) 바이트로 변환"""
+    return np.asarray(vector, dtype=EMBEDDING_DTYPE).tobytes()
+
+
+def bytes_to_vector(data):
+    """저장된 바이트를 복사 없이 읽기 전용 NumPy 벡터로 변환 (없으면 None)"""
+    if data is None:
+        return None
+    return np.frombuffer(data, dtype=EMBEDDING_DTYPE)
+
+
+def load_matrix(queryset, field='embedding', dtype=np.float32):
+    """
+    임베딩 행렬 일괄 로드
+
+    (id, 임베딩) 두 컬럼만 한 번의 쿼리로 읽어 바이트를 이어 붙인 뒤
+    하나의 연속된 (행 수, 차원) 행렬로 변환합니다. 차원이 다른 행(다른 모델로 생성)은 제외합니다.
+    dtype이 None이면 저장 형식(float16) 그대로 반환합니다.
+    반환값: (id 배열, 행렬)
+    """
+    rows = list(queryset.filter(**{f'{field}__isnull': False}).values_list('id', field))
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=dtype or EMBEDDING_DTYPE)
+
+    # 가장 많은 행의 크기를 기준 차원으로 사용
+    sizes = Counter(len(data) for _, data in rows)
+    row_bytes = sizes.most_common(1)[0][0]
+    if len(sizes) > 1:
+        rows = [row for row in rows if len(row[1]) == row_bytes]
+        logger.warning(f"차원이 다른 임베딩 {sum(sizes.values()) - len(rows)}개 제외")
+
+    ids = np.fromiter((row_id for row_id, _ in rows), dtype=np.int64, count=len(rows))
+    matrix = np.frombuffer(b''.join(data for _, data in rows), dtype=EMBEDDING_DTYPE)
+    matrix = matrix.reshape(len(rows), row_bytes // np.dtype(EMBEDDING_DTYPE).itemsize)
+    if dtype is not None:
+        matrix = matrix.astype(dtype, copy=False)
+    return ids, matrix
+
+
+def concept_text(concept):
+    """개념 임베딩 입력 텍스트 (이름 + 설명)"""
+    return f"{concept.name}: {concept.description}" if concept.description else concept.name
+
+
+def article_text(article):
+    """기사 임베딩 입력 텍스트 (요약, 없으면 제목)"""
+    return article.summary or article.title
+
+
+def embed_concepts(concepts):
+    """개념 목록을 한 번에 인코딩해 embedding 필드에 저장 (저장한 개수 반환)"""
+    from concept.models import Concept
+
+    concepts = [concept for concept in concepts if concept.name]
+    if not concepts:
+        return 0
+
+    vectors = get_embedding_engine().encode(concept_text(concept) for concept in concepts)
+    for concept, vector in zip(concepts, vectors):
+        concept.embedding = vector_to_bytes(vector)
+    Concept.objects.bulk_update(concepts, ['embedding'])
+    return len(concepts)
+
+
+def embed_articles(articles):
+    """기사 목록의 요약을 한 번에 인코딩해 summary_embedding 필드에 저장 (저장한 개수 반환)"""
+    from article.models import Article
+
+    articles = [article for article in articles if article_text(article)]
+    if not articles:
+        return 0
+
+    vectors = get_embedding_engine().encode(article_text(article) for article in articles)
+    for article, vector in zip(articles, vectors):
+        article.summary_embedding = vector_to_bytes(vector)
+    Article.objects.bulk_update(articles, ['summary_embedding'])
+    return len(articles)
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_embedding_engine():
+    """설정 기반 공용 임베딩 엔진 반환 (모델은 첫 인코딩 때 로드)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = EmbeddingEngine(
+                    settings.EMBEDDING_MODEL,
+                    device=settings.EMBEDDING_DEVICE,
+                    batch_size=settings.EMBEDDING_BATCH_SIZE
+                )
+    return _engine
@@ -0,0 +1,106 @@
+from urllib.parse import urlsplit
+
+from lxml import etree
+
+
+class SiteRule:
+    """
+    사이트별 본문 추출 규칙
+
+    content/title/published/source는 XPath 목록이며 앞에서부터 처음 값이 나오는 식을 사용합니다.
+    remove에 해당하는 요소(사진 설명, 기자 정보, 광고 등)는 본문 추출 전에 제거합니다.
+    """
+
+    def __init__(self, name, domains, content, title=(), published=(), source=(), remove=()):
+        self.name = name
+        self.domains = tuple(domains)
+        self.content = [etree.XPath(expr) for expr in content]
+        self.title = [etree.XPath(expr) for expr in title]
+        self.published = [etree.XPath(expr) for expr in published]
+        self.source = [etree.XPath(expr) for expr in source]
+        self.remove = [etree.XPath(expr) for expr in remove]
+
+    def matches(self, host):
+        """호스트가 규칙의 도메인(또는 하위 도메인)인지 확인"""
+        return any(host == domain or host.endswith('.' + domain) for domain in self.domains)
+
+
+_rules = []
+
+
+def register_rule(rule):
+    """사이트 규칙 등록 (먼저 등록된 규칙이 우선)"""
+    _rules.append(rule)
+    return rule
+
+
+def find_rule(url):
+    """URL의 호스트에 해당하는 사이트 규칙 조회 (없으면 None)"""
+    if not url:
+        return None
+    host = (urlsplit(url).hostname or '').lower()
+    for rule in _rules:
+        if rule.matches(host):
+            return rule
+    return None
+
+
+# 네이버 뉴스 (일반/연예/스포츠)
+register_rule(SiteRule(
+    name='naver_news',
+    domains=['news.naver.com', 'entertain.naver.com', 'sports.naver.com'],
+    content=[
+        '//*[@id="dic_area"]',
+        '//*[@id="articeBody"]',
+        '//*[@id="newsEndContents"]',
+    ],
+    title=[
+        '//*[@id="title_area"]',
+        '//h2[contains(@class, "media_end_head_headline")]',
+        '//h2[contains(@class, "end_tit")]',
+    ],
+    published=[
+        '//span[contains(@class, "_ARTICLE_DATE_TIME")]/@data-date-time',
+    ],
+    source=[
+        '//a[contains(@class, "media_end_head_top_logo")]//img/@title',
+    ],
+    remove=[
+        '//*[contains(@class, "end_photo_org")]',
+        '//*[contains(@class, "img_desc")]',
+        '//*[contains(@class, "byline")]',
+        '//*[contains(@class, "source")]',
+    ],
+))
+
+# 다음 뉴스
+register_rule(SiteRule(
+    name='daum_news',
+    domains=['v.daum.net', 'news.v.daum.net'],
+    content=[
+        '//div[contains(@class, "article_view")]//section',
+        '//div[contains(@class, "article_view")]',
+    ],
+    title=[
+        '//h3[contains(@class, "tit_view")]',
+    ],
+    published=[
+        '//span[contains(@class, "num_date")]',
+    ],
+    remove=[
+        '//figure',
+        '//*[contains(@class, "txt_caption")]',
+    ],
+))
+
+# 브런치
+register_rule(SiteRule(
+    name='brunch',
+    domains=['brunch.co.kr'],
+    content=[
+        '//div[contains(@class, "wrap_body")]',
+    ],
+    title=[
+        '//h1[contains(@class, "cover_title")]',
+    ],
+))
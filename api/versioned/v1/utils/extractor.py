@@ -0,0 +1,300 @@
+import json
+import logging
+import re
+from datetime import date, datetime
+
+from django.conf import settings
+from lxml import etree, html as lxml_html
+
+from api.versioned.v1.utils.extraction_rules import find_rule
+
+logger = logging.getLogger(__name__)
+
+# 본문 추출 전에 제거하는 요소
+STRIP_TAGS = ('script', 'style', 'noscript', 'iframe', 'form', 'button', 'svg', 'template')
+
+# 줄바꿈으로 구분하는 블록 요소
+BLOCK_TAGS = frozenset((
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'figcaption', 'figure',
+    'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'li', 'main', 'nav', 'ol', 'p', 'pre',
+    'section', 'table', 'td', 'th', 'tr', 'ul',
+))
+
+# 본문 후보 점수 계산 (readability 방식)
+CANDIDATE_TAGS = ('p', 'div', 'td', 'pre', 'blockquote', 'section', 'article')
+POSITIVE_RE = re.compile(r'article|body|content|entry|main|news|post|story|text|view', re.I)
+NEGATIVE_RE = re.compile(
+    r'ad-|ads|banner|comment|copyright|footer|gnb|header|lnb|menu|nav|popup|promo|related|reply|share|sidebar|sns|sponsor|tag|widget',
+    re.I
+)
+MIN_PARAGRAPH_LENGTH = 25
+
+# 메타데이터 키 (우선순위 순)
+TITLE_META = ('og:title', 'twitter:title')
+SOURCE_META = ('og:site_name', 'application-name')
+PUBLISHED_META = (
+    'article:published_time', 'og:published_time', 'datepublished', 'pubdate', 'publishdate',
+    'publish-date', 'article.published', 'dc.date', 'date',
+)
+
+DATE_RE = re.compile(r'(\d{4})[.\-/년]\s*(\d{1,2})[.\-/월]\s*(\d{1,2})')
+
+_parser = lxml_html.HTMLParser(encoding='utf-8', remove_comments=True, remove_pis=True)
+
+
+def _parse(html):
+    """HTML 문자열을 lxml 트리로 파싱 (빈 문서면 None)"""
+    if not html or not html.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(html.encode('utf-8'), parser=_parser)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _text_of(element):
+    """요소의 텍스트를 블록 단위 줄바꿈으로 연결 (빈 줄 제거)"""
+    parts = []
+
+    def walk(el):
+        tag = el.tag if isinstance(el.tag, str) else ''
+        if tag in BLOCK_TAGS or tag == 'br':
+            parts.append('\n')
+        if el.text and tag:
+            parts.append(el.text)
+        for child in el:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if tag in BLOCK_TAGS:
+            parts.append('\n')
+
+    walk(element)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _first_value(root, xpaths):
+    """XPath 목록에서 처음으로 비어 있지 않은 값 (요소면 텍스트)"""
+    for xpath in xpaths:
+        for value in xpath(root):
+            text = _text_of(value) if isinstance(value, etree._Element) else str(value).strip()
+            if text:
+                return text
+    return ''
+
+
+def _parse_date(value):
+    """ISO 8601 또는 'YYYY.MM.DD' 형식의 날짜 문자열을 date로 변환 (실패하면 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        match = DATE_RE.search(value)
+        if not match:
+            return None
+        try:
+            return date(*(int(group) for group in match.groups()))
+        except ValueError:
+            return None
+    return parsed.date()  # 발행처 기준 날짜 (시간대 변환 없음)
+
+
+def _json_ld_metadata(script_text, metadata):
+    """JSON-LD의 headline/publisher/datePublished를 메타데이터 후보에 추가"""
+    try:
+        data = json.loads(script_text)
+    except ValueError:
+        return
+    items = data if isinstance(data, list) else data.get('@graph', [data]) if isinstance(data, dict) else []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if isinstance(item.get('headline'), str):
+            metadata.setdefault('json_ld:headline', item['headline'])
+        if item.get('datePublished'):
+            metadata.setdefault('json_ld:date', str(item['datePublished']))
+        publisher = item.get('publisher')
+        if isinstance(publisher, dict) and isinstance(publisher.get('name'), str):
+            metadata.setdefault('json_ld:publisher', publisher['name'])
+
+
+def _collect_metadata(root):
+    """
+    제목/언론사/발행일 후보를 트리 한 번 순회로 수집
+
+    meta(property/name/itemprop), title, 첫 h1, 첫 time[datetime], JSON-LD를 같은 순회에서 읽습니다.
+    """
+    metadata = {}
+    for el in root.iter('meta', 'title', 'h1', 'time', 'script'):
+        tag = el.tag
+        if tag == 'meta':
+            key = (el.get('property') or el.get('name') or el.get('itemprop') or '').lower()
+            content = (el.get('content') or '').strip()
+            if key and content:
+                metadata.setdefault(key, content)
+        elif tag == 'title':
+            metadata.setdefault('title', _text_of(el))
+        elif tag == 'h1':
+            metadata.setdefault('h1', _text_of(el))
+        elif tag == 'time':
+            if el.get('datetime'):
+                metadata.setdefault('time', el.get('datetime'))
+        elif el.get('type') == 'application/ld+json' and el.text:
+            _json_ld_metadata(el.text, metadata)
+    return metadata
+
+
+def _pick(metadata, keys):
+    for key in keys:
+        if metadata.get(key):
+            return metadata[key]
+    return ''
+
+
+def _class_weight(el):
+    """class/id 이름으로 본문 여부 가중치 계산"""
+    weight = 0
+    for name in (el.get('class'), el.get('id')):
+        if not name:
+            continue
+        if NEGATIVE_RE.search(name):
+            weight -= 25
+        if POSITIVE_RE.search(name):
+            weight += 25
+    return weight
+
+
+def _own_text_length(el):
+    """하위 블록 요소를 제외한 요소 자체의 텍스트 길이 (<br>로 문단을 나누는 페이지 대응)"""
+    length = len((el.text or '').strip())
+    for child in el:
+        if child.tag not in BLOCK_TAGS and isinstance(child.tag, str):
+            length += len(child.text_content().strip())
+        length += len((child.tail or '').strip())
+    return length
+
+
+def _link_density(el, text_length):
+    if not text_length:
+        return 1.0
+    link_length = sum(len(a.text_content()) for a in el.iter('a'))
+    return min(1.0, link_length / text_length)
+
+
+def _readable_content(root):
+    """
+    사이트 규칙이 없을 때의 범용 본문 추출 (readability 방식)
+
+    문단 텍스트 길이와 쉼표 수로 부모/조부모 요소에 점수를 주고,
+    class/id 가중치와 링크 밀도를 반영해 가장 점수가 높은 요소의 텍스트를 본문으로 사용합니다.
+    """
+    body = root.find('body')
+    if body is None:
+        return ''
+
+    scores = {}
+    for el in body.iter(*CANDIDATE_TAGS):
+        length = _own_text_length(el)
+        if length < MIN_PARAGRAPH_LENGTH:
+            continue
+        own_text = el.text_content() if el.tag == 'p' else (el.text or '')
+        score = 1 + own_text.count(',') + own_text.count('，') + min(length // 100, 3)
+
+        # <br> 문단 형식의 요소는 자신도 후보로 삼음
+        targets = [(el, 1.0)] if el.tag != 'p' else []
+        parent = el.getparent()
+        if parent is not None:
+            targets.append((parent, 1.0))
+            grandparent = parent.getparent()
+            if grandparent is not None:
+                targets.append((grandparent, 0.5))
+
+        for target, factor in targets:
+            if target not in scores:
+                scores[target] = _class_weight(target)
+            scores[target] += score * factor
+
+    best, best_score = None, 0
+    for el, score in scores.items():
+        text_length = len(el.text_content())
+        score *= 1 - _link_density(el, text_length)
+        if score > best_score:
+            best, best_score = el, score
+
+    return _text_of(best) if best is not None else ''
+
+
+def _newspaper_content(html, url):
+    """newspaper3k 추출 (범용 추출 결과가 너무 짧을 때의 마지막 수단)"""
+    try:
+        from newspaper import Article as NewspaperArticle
+    except ImportError:
+        return ''
+
+    try:
+        parsed = NewspaperArticle(url or '', language='ko')
+        parsed.download(input_html=html)
+        parsed.parse()
+        return parsed.text.strip()
+    except Exception as e:
+        logger.debug(f"newspaper 본문 추출 실패: {str(e)}")
+        return ''
+
+
+def extract_page(html, url=None):
+    """
+    HTML에서 제목, 본문, 언론사, 발행일 추출
+
+    URL에 해당하는 사이트 규칙 → readability 방식 범용 추출 → newspaper3k 순으로 본문을 찾고,
+    메타데이터는 트리 한 번 순회로 수집합니다.
+    반환값: (추출 결과, 본문 추출 방법)
+    """
+    root = _parse(html)
+    if root is None:
+        return {'title': 'No title found', 'content': '', 'source': '', 'published_date': None}, None
+
+    metadata = _collect_metadata(root)  # JSON-LD를 읽기 위해 script 제거 전에 수집
+    etree.strip_elements(root, *STRIP_TAGS, with_tail=False)
+    rule = find_rule(url)
+
+    content, method = '', None
+    title = source = published = ''
+    if rule:
+        for xpath in rule.remove:
+            for el in xpath(root):
+                el.drop_tree()
+        content = _first_value(root, rule.content)
+        method = rule.name if content else None
+        title = _first_value(root, rule.title)
+        source = _first_value(root, rule.source)
+        published = _first_value(root, rule.published)
+
+    if len(content) < settings.CAPTURE_EXTRACT_MIN_LENGTH:
+        readable = _readable_content(root)
+        if len(readable) > len(content):
+            content, method = readable, 'readability'
+
+    if len(content) < settings.CAPTURE_EXTRACT_MIN_LENGTH:
+        fallback = _newspaper_content(html, url)
+        if len(fallback) > len(content):
+            content, method = fallback, 'newspaper'
+
+    title = title or _pick(metadata, TITLE_META + ('json_ld:headline', 'title', 'h1')) or 'No title found'
+    source = source or _pick(metadata, SOURCE_META + ('json_ld:publisher',))
+    published_date = _parse_date(published) or _parse_date(_pick(metadata, PUBLISHED_META + ('json_ld:date', 'time')))
+
+    return {
+        'title': title[:255],
+        'content': content,
+        'source': source[:100],
+        'published_date': published_date
+    }, method
+
+
+def extract_article(html, url=None):
+    """HTML에서 제목, 본문, 언론사, 발행일 추출"""
+    page, _ = extract_page(html, url)
+    return page
@@ -0,0 +1,236 @@
+import codecs
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+import requests
+from charset_normalizer import from_bytes
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+}
+
+CHUNK_SIZE = 64 * 1024
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?\s*([a-zA-Z0-9_\-]+)', re.IGNORECASE)
+HEADER_CHARSET_RE = re.compile(r'charset=["\']?\s*([a-zA-Z0-9_\-]+)', re.IGNORECASE)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class FetchError(requests.RequestException):
+    """웹 페이지 수집 실패"""
+
+
+class PageTooLargeError(FetchError):
+    """최대 본문 크기 초과"""
+
+
+class FetchResult:
+    """웹 페이지 수집 결과"""
+
+    def __init__(self, url, html, encoding, status_code, from_cache=False):
+        self.url = url
+        self.html = html
+        self.encoding = encoding
+        self.status_code = status_code
+        self.from_cache = from_cache
+
+
+def get_session():
+    """
+    프로세스 공용 HTTP 세션 반환
+
+    keep-alive 연결 풀을 재사용하므로 여러 스레드에서 동시에 사용해도
+    호스트마다 TCP/TLS 연결을 새로 맺지 않습니다.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=settings.CAPTURE_FETCH_POOL_SIZE,
+                    pool_maxsize=settings.CAPTURE_FETCH_POOL_SIZE
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+
+    return _session
+
+
+def detect_encoding(content_type, head):
+    """
+    응답 문자 인코딩 결정
+
+    Content-Type의 charset, HTML meta charset 순으로 확인하고,
+    둘 다 없으면 None을 반환합니다 (본문 전체 감지는 호출 측에서 한 번만 수행).
+    """
+    candidates = []
+    match = HEADER_CHARSET_RE.search(content_type or '')
+    if match:
+        candidates.append(match.group(1))
+    match = META_CHARSET_RE.search(head)
+    if match:
+        candidates.append(match.group(1).decode('ascii'))
+
+    for candidate in candidates:
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            continue
+    return None
+
+
+class HttpCache:
+    """
+    ETag/Last-Modified 기반 디스크 HTTP 캐시
+
+    URL별로 원본 바이트(.body)와 검증자 메타데이터(.json)를 저장합니다.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}.json", f"{base}.body"
+
+    def get(self, url):
+        """캐시 항목 조회 (메타데이터, 본문 경로)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None, None
+        if not os.path.exists(body_path):
+            return None, None
+        return meta, body_path
+
+    def read_body(self, body_path):
+        with open(body_path, 'rb') as f:
+            return f.read()
+
+    def set(self, url, meta, body):
+        """캐시 항목 저장 (임시 파일에 쓴 뒤 교체하므로 동시 쓰기에 안전)"""
+        meta_path, body_path = self._paths(url)
+        directory = os.path.dirname(meta_path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode('utf-8'))):
+                fd, tmp_path = tempfile.mkstemp(dir=directory)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"HTTP 캐시 저장 실패: {str(e)}")
+
+
+class PageFetcher:
+    """
+    웹 페이지 수집기
+
+    공용 연결 풀, 연결/읽기 타임아웃, 전체 수집 시간 제한, 최대 본문 크기,
+    조건부 요청(ETag/Last-Modified) 디스크 캐시를 적용합니다.
+    """
+
+    def __init__(self, connect_timeout=None, read_timeout=None, total_timeout=None, max_bytes=None, cache_dir=None):
+        self.connect_timeout = connect_timeout or settings.CAPTURE_FETCH_CONNECT_TIMEOUT
+        self.read_timeout = read_timeout or settings.CAPTURE_FETCH_READ_TIMEOUT
+        self.total_timeout = total_timeout or settings.CAPTURE_FETCH_TOTAL_TIMEOUT
+        self.max_bytes = max_bytes or settings.CAPTURE_FETCH_MAX_BYTES
+        cache_dir = cache_dir or settings.CAPTURE_FETCH_CACHE_DIR
+        self.cache = HttpCache(cache_dir) if cache_dir else None
+
+    def fetch(self, url):
+        """웹 페이지 수집 (실패 시 requests.RequestException)"""
+        meta, body_path = self.cache.get(url) if self.cache else (None, None)
+
+        headers = {}
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        response = get_session().get(
+            url,
+            headers=headers,
+            timeout=(self.connect_timeout, self.read_timeout),
+            stream=True
+        )
+
+        try:
+            if response.status_code == 304 and meta:
+                body = self.cache.read_body(body_path)
+                return FetchResult(response.url, body.decode(meta['encoding'], errors='replace'),
+                                   meta['encoding'], response.status_code, from_cache=True)
+
+            response.raise_for_status()
+            body = self._read_body(response)
+        finally:
+            response.close()
+
+        encoding = detect_encoding(response.headers.get('Content-Type'), body[:4096])
+        if encoding is None:
+            best = from_bytes(body).best()
+            encoding = best.encoding if best else 'utf-8'
+
+        if self.cache and (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            self.cache.set(url, {
+                'url': response.url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'encoding': encoding
+            }, body)
+
+        return FetchResult(response.url, body.decode(encoding, errors='replace'), encoding, response.status_code)
+
+    def _read_body(self, response):
+        """최대 크기와 전체 시간 제한을 지키며 본문 스트리밍 수신"""
+        content_length = response.headers.get('Content-Length')
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            raise PageTooLargeError(f"페이지 크기가 제한({self.max_bytes} bytes)을 초과합니다: {content_length} bytes")
+
+        deadline = time.monotonic() + self.total_timeout
+        chunks = []
+        received = 0
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            received += len(chunk)
+            if received > self.max_bytes:
+                raise PageTooLargeError(f"페이지 크기가 제한({self.max_bytes} bytes)을 초과합니다.")
+            if time.monotonic() > deadline:
+                raise FetchError(f"페이지 수집 시간이 제한({self.total_timeout}초)을 초과했습니다.")
+            chunks.append(chunk)
+
+        return b''.join(chunks)
+
+
+_fetcher = None
+
+
+def get_fetcher():
+    """기본 설정의 공용 수집기 반환"""
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = PageFetcher()
+    return _fetcher
+
+
+def fetch_html(url):
+    """웹 페이지 HTML 가져오기 (실패 시 requests.RequestException)"""
+    return get_fetcher().fetch(url).html
@@ -0,0 +1,44 @@
+import hashlib
+import re
+import unicodedata
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 추적용 쿼리 파라미터 (같은 기사를 가리키는 URL을 구분하지 않음)
+TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'mc_cid', 'mc_eid', 'ref', 'ref_src'}
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_url(url):
+    """
+    URL 정규화
+
+    스킴/호스트 소문자화, 기본 포트·www·fragment·추적 파라미터 제거,
+    쿼리 파라미터 정렬, 경로 끝 슬래시 제거를 적용합니다.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and str(parts.port) != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ))
+
+    return urlunsplit((scheme, host, path, query, ''))
+
+
+def url_key(url):
+    """정규화된 URL의 고정 길이 키 (sha256)"""
+    return hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+
+
+def content_fingerprint(text):
+    """본문 지문 (유니코드 정규화, 공백 정리 후 sha256)"""
+    normalized = WHITESPACE_RE.sub(' ', unicodedata.normalize('NFC', text or '')).strip()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
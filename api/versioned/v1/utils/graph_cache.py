@@ -0,0 +1,66 @@
+from django.core.cache import caches
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+from rest_framework.status import HTTP_200_OK
+
+
+def bump_graph_versions(article_ids):
+    """
+    기사와 그 기사가 건드린 개념, 그 개념에 연결된 기사의 그래프 버전 증가
+
+    개념은 기사에 연결된 개념과, 그 개념과 관계로 이어진 개념까지 포함합니다.
+    기사 그래프는 개념에서 나가는 관계(2단계)까지 보여주므로, 이 개념들에 연결된 다른 기사도 함께 올립니다.
+    버전이 바뀌면 이전 버전 키로 저장된 응답 캐시는 더 이상 조회되지 않습니다.
+    """
+    from article.models import Article, ArticleConcept
+    from concept.models import Concept, ConceptRelationship
+
+    article_ids = list(article_ids)
+    if not article_ids:
+        return
+
+    now = timezone.now()
+    concept_ids = set(ArticleConcept.objects.filter(article_id__in=article_ids).values_list('concept_id', flat=True))
+    if concept_ids:
+        for source_id, target_id in ConceptRelationship.objects.filter(
+            Q(source_concept_id__in=concept_ids) | Q(target_concept_id__in=concept_ids)
+        ).values_list('source_concept_id', 'target_concept_id'):
+            concept_ids.update((source_id, target_id))
+
+    articles = Q(id__in=article_ids)
+    if concept_ids:
+        articles |= Q(id__in=ArticleConcept.objects.filter(concept_id__in=concept_ids).values('article_id'))
+        Concept.objects.filter(id__in=concept_ids).update(graph_version=F('graph_version') + 1, graph_updated_at=now)
+    Article.objects.filter(articles).update(graph_version=F('graph_version') + 1, graph_updated_at=now)
+
+
+def cached_graph_response(request, namespace, obj, build):
+    """
+    그래프 버전 기반 응답 (조건부 요청 처리 + 응답 캐시)
+
+    ETag는 (namespace, id, graph_version), Last-Modified는 graph_updated_at입니다.
+    클라이언트 캐시가 최신이면 304를 반환하고, 아니면 같은 버전의 캐시된 응답을 쓰거나
+    build()로 만들어 저장합니다.
+    """
+    etag = quote_etag(f"{namespace}-{obj.pk}-{obj.graph_version}")
+    last_modified = int(obj.graph_updated_at.timestamp()) if obj.graph_updated_at else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        cache = caches['graph']
+        key = f"graph:{namespace}:{obj.pk}:{obj.graph_version}"
+        data = cache.get(key)
+        if data is None:
+            data = build()
+            cache.set(key, data)
+        response = Response(data, status=HTTP_200_OK)
+
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    # 브라우저는 저장하되 매번 ETag로 재검증
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,624 @@
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+from scipy.sparse import csr_array
+
+from api.versioned.v1.utils.neo4j_client import article_node, concept_node, encode_rank_cursor, entity_node, event_node
+
+logger = logging.getLogger(__name__)
+
+LABELS = ('Article', 'Concept', 'Entity', 'Event')
+ARTICLE, CONCEPT, ENTITY, EVENT = range(len(LABELS))
+
+# 델타 간선이 이 수(또는 전체의 10%)를 넘으면 CSR을 다시 만듦
+DELTA_REBUILD_MIN = 1000
+
+
+class GraphEngineLoading(Exception):
+    """스냅샷 없이 첫 적재가 백그라운드에서 진행 중이라 아직 조회할 수 없는 경우"""
+
+
+def _edge_sources():
+    """
+    간선 원본 테이블 목록
+
+    (모델, 시작 레이블, 끝 레이블, 시작 id 필드, 끝 id 필드, 가중치 필드, 관계 타입 필드 - None이면 MENTIONS)
+    """
+    from article.models import ArticleConcept, ArticleEntity, ArticleEvent, ArticleRelationship
+    from concept.models import ConceptRelationship
+
+    return [
+        (ArticleConcept, ARTICLE, CONCEPT, 'article_id', 'concept_id', 'confidence', None),
+        (ArticleEntity, ARTICLE, ENTITY, 'article_id', 'entity_id', 'confidence', None),
+        (ArticleEvent, ARTICLE, EVENT, 'article_id', 'event_id', 'confidence', 'relationship_type'),
+        (ArticleRelationship, ARTICLE, ARTICLE, 'source_article_id', 'target_article_id', 'similarity_score',
+         'relationship_type'),
+        (ConceptRelationship, CONCEPT, CONCEPT, 'source_concept_id', 'target_concept_id', 'weight',
+         'relationship_type'),
+    ]
+
+
+def pagerank(adjacency, damping=0.85, iterations=50, tolerance=1e-6):
+    """무방향 인접 CSR의 PageRank (최댓값이 1이 되도록 정규화한 중요도)"""
+    node_count = adjacency.shape[0]
+    if not node_count:
+        return np.empty(0, dtype=np.float32)
+
+    structure = csr_array(
+        (np.ones(adjacency.nnz, dtype=np.float32), adjacency.indices, adjacency.indptr),
+        shape=adjacency.shape
+    )
+    degree = np.diff(adjacency.indptr).astype(np.float32)
+    inverse = np.divide(1.0, degree, out=np.zeros_like(degree), where=degree > 0)
+    rank = np.full(node_count, 1.0 / node_count, dtype=np.float32)
+    for _ in range(iterations):
+        dangling = rank[degree == 0].sum()
+        updated = (1 - damping) / node_count + damping * (structure @ (rank * inverse) + dangling / node_count)
+        converged = np.abs(updated - rank).sum() < tolerance
+        rank = updated.astype(np.float32)
+        if converged:
+            break
+    return rank / rank.max()
+
+
+def _node_properties(label, ids):
+    """노드 속성 일괄 조회 (레이블별 쿼리 한 번, Neo4j 노드와 같은 속성)"""
+    from article.models import Article
+    from concept.models import Concept
+    from entity.models import Entity
+    from event.models import Event
+
+    model, fields, build = {
+        ARTICLE: (Article, ('id', 'title', 'url', 'created_at', 'source'), article_node),
+        CONCEPT: (Concept, ('id', 'name', 'description', 'confidence'), concept_node),
+        ENTITY: (Entity, ('id', 'name', 'entity_type', 'description'), entity_node),
+        EVENT: (Event, ('id', 'name', 'description', 'event_date', 'event_type'), event_node),
+    }[label]
+    return {row.id: dict(build(row)['props'], id=row.id) for row in model.objects.only(*fields).filter(id__in=ids)}
+
+
+class GraphEngine:
+    """
+    프로세스 내 지식 그래프 엔진 (Neo4j를 쓸 수 없을 때의 읽기 대체 경로)
+
+    연결 테이블의 행을 정수 인덱스 노드와 간선 배열로 읽고, 방향을 무시한 인접 리스트를
+    CSR 배열(indptr/indices/data=간선 번호)로 만들어 이웃 조회를 배열 슬라이스 한 번으로 처리합니다.
+    새 행은 테이블별 마지막 id(워터마크) 이후만 읽어 델타 간선으로 덧붙이고, 삭제를 반영하기 위해
+    rebuild_interval마다 전체를 다시 읽습니다.
+
+    전체 적재는 별도 엔진에서 잠금 없이 만든 뒤 교체하므로, 주기적인 재적재는 백그라운드 스레드에서
+    진행되고 그동안 조회는 이전 그래프로 응답합니다. 첫 조회 때는 build_graph_snapshot 명령이 저장한
+    스냅샷 파일이 있으면 전체 스캔 대신 파일을 읽고 이후 행만 증분 반영합니다. 파일이 없으면 요청
+    스레드에서 전체를 읽지 않고 백그라운드 적재를 시작한 뒤, 끝날 때까지 GraphEngineLoading을 발생시킵니다.
+    """
+
+    def __init__(self, refresh_interval=None, rebuild_interval=None, snapshot_path=None):
+        self.refresh_interval = settings.GRAPH_ENGINE_REFRESH_INTERVAL if refresh_interval is None else refresh_interval
+        self.rebuild_interval = settings.GRAPH_ENGINE_REBUILD_INTERVAL if rebuild_interval is None else rebuild_interval
+        self.snapshot_path = settings.GRAPH_ENGINE_SNAPSHOT_PATH if snapshot_path is None else snapshot_path
+        self._lock = threading.RLock()
+        self._rebuild_thread = None
+        self.loaded_at = None
+        self.refreshed_at = 0.0
+
+    # 적재
+
+    def _reset(self):
+        self._node_index = [{} for _ in LABELS]  # 레이블별 DB id -> 노드 인덱스
+        self._node_label = np.empty(0, dtype=np.int8)
+        self._node_id = np.empty(0, dtype=np.int64)
+        self._src = np.empty(0, dtype=np.int32)
+        self._dst = np.empty(0, dtype=np.int32)
+        self._type = np.empty(0, dtype=np.int16)
+        self._weight = np.empty(0, dtype=np.float32)
+        self._source = np.empty(0, dtype=np.int8)  # 간선 원본 테이블 번호
+        self._types = []
+        self._type_codes = {}
+        self._watermarks = {}
+        self._csr = csr_array((0, 0), dtype=np.int32)
+        self._csr_edges = 0
+        self._importance = np.empty(0, dtype=np.float32)
+        self._rank = None  # (중요도 순 노드 배열, 노드별 순위)
+        self._degrees = None
+
+    def _node(self, label, db_id, new_labels, new_ids):
+        index = self._node_index[label].get(db_id)
+        if index is None:
+            index = len(self._node_id) + len(new_ids)
+            self._node_index[label][db_id] = index
+            new_labels.append(label)
+            new_ids.append(db_id)
+        return index
+
+    def _type_code(self, name):
+        code = self._type_codes.get(name)
+        if code is None:
+            code = self._type_codes[name] = len(self._types)
+            self._types.append(name)
+        return code
+
+    def _load(self):
+        """워터마크 이후의 새 행을 간선으로 추가 (추가한 간선 수 반환)"""
+        new_labels, new_ids = [], []
+        src, dst, types, weights, sources = [], [], [], [], []
+
+        for number, (model, src_label, dst_label, src_field, dst_field, weight_field, type_field) in enumerate(
+            _edge_sources()
+        ):
+            fields = ['id', src_field, dst_field, weight_field] + ([type_field] if type_field else [])
+            rows = model.objects.filter(id__gt=self._watermarks.get(number, 0)).order_by('id').values_list(*fields)
+
+            last_id = None
+            for row in rows.iterator(chunk_size=5000):
+                last_id = row[0]
+                src.append(self._node(src_label, row[1], new_labels, new_ids))
+                dst.append(self._node(dst_label, row[2], new_labels, new_ids))
+                weights.append(row[3] or 0.0)
+                types.append(self._type_code(row[4] if type_field else 'MENTIONS'))
+                sources.append(number)
+            if last_id is not None:
+                self._watermarks[number] = last_id
+
+        if new_ids:
+            self._node_label = np.concatenate((self._node_label, np.asarray(new_labels, dtype=np.int8)))
+            self._node_id = np.concatenate((self._node_id, np.asarray(new_ids, dtype=np.int64)))
+        if src:
+            self._degrees = None
+            self._src = np.concatenate((self._src, np.asarray(src, dtype=np.int32)))
+            self._dst = np.concatenate((self._dst, np.asarray(dst, dtype=np.int32)))
+            self._type = np.concatenate((self._type, np.asarray(types, dtype=np.int16)))
+            self._weight = np.concatenate((self._weight, np.asarray(weights, dtype=np.float32)))
+            self._source = np.concatenate((self._source, np.asarray(sources, dtype=np.int8)))
+        return len(src)
+
+    def _build_csr(self):
+        """무방향 인접 CSR 생성 (각 간선을 양 끝 노드의 행에 한 번씩 저장)"""
+        node_count, edge_count = len(self._node_id), len(self._src)
+        rows = np.concatenate((self._src, self._dst))
+        cols = np.concatenate((self._dst, self._src))
+        edges = np.tile(np.arange(edge_count, dtype=np.int32), 2)
+        order = np.argsort(rows, kind='stable')
+
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(rows, minlength=node_count))
+        # 간선 번호 0도 유지되도록 (data, indices, indptr)로 직접 생성 (중복 합산/0 제거 없음)
+        self._csr = csr_array((edges[order], cols[order], indptr), shape=(node_count, node_count))
+        self._csr_edges = edge_count
+        self._importance = pagerank(self._csr)
+        self._rank = None
+
+    def _state(self):
+        """적재된 그래프 상태 (교체 대상 속성)"""
+        return {name: value for name, value in vars(self).items()
+                if name.startswith('_') and name not in ('_lock', '_rebuild_thread')}
+
+    def rebuild(self):
+        """
+        전체 다시 적재
+
+        새 엔진에서 잠금 없이 DB 전체를 읽고 CSR/중요도를 계산한 뒤, 잠금을 잡고 상태만 교체합니다.
+        """
+        started = time.perf_counter()
+        fresh = GraphEngine(self.refresh_interval, self.rebuild_interval, self.snapshot_path)
+        fresh._reset()
+        fresh._load()
+        fresh._build_csr()
+
+        with self._lock:
+            vars(self).update(fresh._state())
+            self.loaded_at = self.refreshed_at = time.monotonic()
+        logger.info(f"그래프 엔진 적재: nodes={len(fresh._node_id)}, edges={len(fresh._src)}, "
+                    f"{time.perf_counter() - started:.2f}s")
+
+    def _rebuild_in_background(self):
+        """전체 재적재를 백그라운드 스레드에서 시작 (이미 진행 중이면 건너뜀)"""
+        with self._lock:
+            if self._rebuild_thread is not None and self._rebuild_thread.is_alive():
+                return
+            self._rebuild_thread = threading.Thread(target=self._background_rebuild, daemon=True)
+            self._rebuild_thread.start()
+
+    def _background_rebuild(self):
+        try:
+            self.rebuild()
+        except Exception as e:
+            logger.warning(f"그래프 엔진 재적재 실패, 이전 그래프를 계속 사용합니다: {str(e)}")
+            with self._lock:
+                if self.loaded_at is not None:
+                    self.loaded_at = time.monotonic()  # 다음 재적재 주기에 다시 시도 (첫 적재는 다음 조회 때)
+        finally:
+            connection.close()
+
+    def refresh(self):
+        """
+        새 행만 증분 반영 (아직 적재되지 않았으면 건너뜀)
+
+        델타 간선이 많아지면 CSR을 다시 만들고, rebuild_interval이 지났으면 전체 재적재를 백그라운드로 시작합니다.
+        """
+        with self._lock:
+            if self.loaded_at is None:
+                return
+            if time.monotonic() - self.loaded_at >= self.rebuild_interval:
+                self._rebuild_in_background()
+
+            self._load()
+            delta = len(self._src) - self._csr_edges
+            if delta > max(DELTA_REBUILD_MIN, self._csr_edges // 10):
+                self._build_csr()
+            self.refreshed_at = time.monotonic()
+
+    def _ensure(self):
+        """
+        첫 조회 때 스냅샷 파일을 적재하고, 이후에는 refresh_interval마다 증분 반영
+
+        스냅샷 파일이 없으면 전체 적재를 백그라운드로 시작하고 GraphEngineLoading을 발생시킵니다.
+        """
+        if self.loaded_at is None:
+            if self.load_snapshot():
+                self.refresh()
+                return
+            if self._rebuild_thread is None:
+                logger.warning("그래프 스냅샷 파일이 없어 백그라운드에서 전체 적재를 시작합니다. "
+                               "배포 때 build_graph_snapshot 명령으로 스냅샷을 만들어 두세요.")
+            self._rebuild_in_background()
+            raise GraphEngineLoading("그래프 엔진을 적재하는 중입니다. 잠시 후 다시 시도하세요.")
+        elif time.monotonic() - self.refreshed_at >= self.refresh_interval:
+            self.refresh()
+
+    # 스냅샷 파일
+
+    def save_snapshot(self, path=None):
+        """
+        현재 그래프를 스냅샷 파일로 저장
+
+        임시 파일에 쓴 뒤 os.replace로 바꾸므로 읽는 프로세스는 항상 완성된 파일만 봅니다.
+        """
+        path = path or self.snapshot_path
+        with self._lock:
+            arrays = {
+                'node_label': self._node_label, 'node_id': self._node_id,
+                'src': self._src, 'dst': self._dst, 'type': self._type, 'weight': self._weight,
+                'source': self._source, 'types': np.asarray(self._types, dtype=str),
+                'watermarks': np.asarray(sorted(self._watermarks.items()), dtype=np.int64).reshape(-1, 2),
+                'csr_indptr': self._csr.indptr, 'csr_indices': self._csr.indices, 'csr_data': self._csr.data,
+                'csr_edges': np.int64(self._csr_edges), 'importance': self._importance,
+                'saved_at': np.float64(time.time()),
+            }
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    def load_snapshot(self, path=None):
+        """스냅샷 파일 적재 (파일이 없거나 읽을 수 없으면 False)"""
+        path = path or self.snapshot_path
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"그래프 스냅샷 파일을 읽을 수 없어 DB에서 적재합니다: {str(e)}")
+            return False
+
+        with self._lock:
+            self._reset()
+            self._node_label, self._node_id = arrays['node_label'], arrays['node_id']
+            for label in range(len(LABELS)):
+                nodes = np.flatnonzero(self._node_label == label)
+                self._node_index[label] = dict(zip(self._node_id[nodes].tolist(), nodes.tolist()))
+            self._src, self._dst, self._type = arrays['src'], arrays['dst'], arrays['type']
+            self._weight, self._source = arrays['weight'], arrays['source']
+            self._types = arrays['types'].tolist()
+            self._type_codes = {name: code for code, name in enumerate(self._types)}
+            self._watermarks = {int(number): int(last_id) for number, last_id in arrays['watermarks']}
+            node_count = len(self._node_id)
+            self._csr = csr_array(
+                (arrays['csr_data'], arrays['csr_indices'], arrays['csr_indptr']), shape=(node_count, node_count)
+            )
+            self._csr_edges = int(arrays['csr_edges'])
+            self._importance = arrays['importance']
+
+            # 파일이 저장된 시점부터 재적재 주기를 계산
+            age = max(0.0, time.time() - float(arrays['saved_at']))
+            self.loaded_at = time.monotonic() - age
+            self.refreshed_at = 0.0
+        logger.info(f"그래프 스냅샷 적재: nodes={len(self._node_id)}, edges={len(self._src)}, age={age:.0f}s")
+        return True
+
+    # 조회
+
+    def _index(self, label, db_id):
+        return self._node_index[label].get(db_id)
+
+    def _incident(self, index):
+        """노드에 닿는 (이웃 노드 인덱스 배열, 간선 번호 배열)"""
+        neighbours, edges = [], []
+        if index < self._csr.shape[0]:
+            start, end = self._csr.indptr[index], self._csr.indptr[index + 1]
+            neighbours.append(self._csr.indices[start:end])
+            edges.append(self._csr.data[start:end])
+
+        if len(self._src) > self._csr_edges:
+            delta_src, delta_dst = self._src[self._csr_edges:], self._dst[self._csr_edges:]
+            outgoing = np.flatnonzero(delta_src == index)
+            incoming = np.flatnonzero(delta_dst == index)
+            neighbours += [delta_dst[outgoing], delta_src[incoming]]
+            edges += [outgoing + self._csr_edges, incoming + self._csr_edges]
+
+        if not neighbours:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32)
+        return np.concatenate(neighbours), np.concatenate(edges)
+
+    def degrees(self):
+        """노드별 연결 수 (간선 수 기준, 간선이 추가될 때까지 캐시)"""
+        if self._degrees is None:
+            node_count = len(self._node_id)
+            self._degrees = np.bincount(self._src, minlength=node_count) + np.bincount(self._dst, minlength=node_count)
+        return self._degrees
+
+    def importance(self):
+        """노드별 중요도 (마지막 CSR 생성 시점의 PageRank, 이후 추가된 노드는 0)"""
+        importance = np.zeros(len(self._node_id), dtype=np.float32)
+        importance[:len(self._importance)] = self._importance
+        return importance
+
+    def ranks(self):
+        """노드별 (레이블 번호, DB id, 연결 수, 중요도) 배열 - Neo4j 노드 속성 갱신용"""
+        with self._lock:
+            self._ensure()
+            return self._node_label.copy(), self._node_id.copy(), self.degrees(), self.importance()
+
+    def find_related_concepts(self, concept_id, limit=10):
+        """관련 개념 (개념 간 관계를 가중치 순으로, Neo4jClient.find_related_concepts와 같은 형식)"""
+        with self._lock:
+            self._ensure()
+            index = self._index(CONCEPT, concept_id)
+            if index is None:
+                return []
+
+            neighbours, edges = self._incident(index)
+            mask = self._node_label[neighbours] == CONCEPT
+            neighbours, edges = neighbours[mask], edges[mask]
+            order = np.argsort(-self._weight[edges], kind='stable')[:limit]
+            rows = [(int(self._node_id[neighbours[i]]), self._types[self._type[edges[i]]],
+                     round(float(self._weight[edges[i]]), 4)) for i in order]
+
+        properties = _node_properties(CONCEPT, [concept for concept, _, _ in rows])
+        return [
+            {
+                'name': properties[concept]['name'],
+                'description': properties[concept]['description'],
+                'relationship_type': relationship_type,
+                'weight': weight
+            }
+            for concept, relationship_type, weight in rows if concept in properties
+        ]
+
+    def find_similar_articles(self, article_id, limit=5):
+        """같은 이벤트를 다루는 기사 (공통 이벤트 수 순, Neo4jClient.find_similar_articles와 같은 형식)"""
+        with self._lock:
+            self._ensure()
+            index = self._index(ARTICLE, article_id)
+            if index is None:
+                return []
+
+            neighbours, _ = self._incident(index)
+            events = np.unique(neighbours[self._node_label[neighbours] == EVENT])
+            counts = {}
+            for event in events:
+                articles, _ = self._incident(event)
+                for article in np.unique(articles[self._node_label[articles] == ARTICLE]):
+                    if article != index:
+                        counts[article] = counts.get(article, 0) + 1
+            rows = [(int(self._node_id[article]), count)
+                    for article, count in sorted(counts.items(), key=lambda item: -item[1])[:limit]]
+
+        properties = _node_properties(ARTICLE, [article for article, _ in rows])
+        return [
+            {'article_id': article, 'title': properties[article]['title'], 'common_events': count}
+            for article, count in rows if article in properties
+        ]
+
+    def get_article_knowledge_graph(self, article_id, limit=100):
+        """
+        기사의 지식 그래프 (Neo4jClient.get_article_knowledge_graph와 같은 형식)
+
+        기사에서 나가는 관계와, 그 개념/엔티티/이벤트에서 다시 나가는 관계까지 포함합니다.
+        """
+        with self._lock:
+            self._ensure()
+            index = self._index(ARTICLE, article_id)
+            if index is None:
+                return None
+
+            _, edges = self._incident(index)
+            first = edges[self._src[edges] == index]
+            selected = list(dict.fromkeys(first.tolist()))
+            for node in np.unique(self._dst[first]):
+                if self._node_label[node] == ARTICLE:
+                    continue
+                _, node_edges = self._incident(node)
+                selected.extend(int(edge) for edge in node_edges[self._src[node_edges] == node] if edge not in first)
+            return self._subgraph(selected[:limit])
+
+    def knowledge_graph(self, concept_name=None, event_name=None, limit=100):
+        """
+        전체 지식 그래프 조회 (ConceptViewSet.knowledge_graph의 Neo4j 쿼리와 같은 범위)
+
+        개념/이벤트 이름이 주어지면 해당 노드에서 2단계 이웃까지, 없으면 연결이 많은 노드부터 간선을 모읍니다.
+        """
+        from concept.models import Concept
+        from event.models import Event
+
+        if concept_name:
+            starts = [(CONCEPT, concept_id) for concept_id in
+                      Concept.objects.filter(name=concept_name).values_list('id', flat=True)]
+        elif event_name:
+            starts = [(EVENT, event_id) for event_id in
+                      Event.objects.filter(name=event_name).values_list('id', flat=True)]
+        else:
+            return self.hub_graph(limit)
+
+        with self._lock:
+            self._ensure()
+            start_nodes = [index for index in (self._index(label, db_id) for label, db_id in starts)
+                           if index is not None]
+            return self._subgraph(self._expand(start_nodes, 2, limit))
+
+    def hub_graph(self, limit=100, cursor=None):
+        """
+        중요도 상위 노드와 그 사이의 간선 (ConceptViewSet.knowledge_graph 기본 조회와 같은 형식)
+
+        노드는 (중요도 내림차순, 레이블, id) 순으로 limit개씩 내려주며, cursor는 이전 페이지의
+        마지막 노드 (중요도, 레이블, id)입니다. 간선은 이번 페이지 노드끼리, 그리고 이번 페이지 노드와
+        이전 페이지 노드 사이의 것만 한 번씩 포함하므로 페이지를 이어 붙이면 상위 노드의 유도 부분그래프가 됩니다.
+        """
+        with self._lock:
+            self._ensure()
+            importance = self.importance()
+            order, position = self._ranking(importance)
+            start = self._cursor_position(cursor, position, importance) if cursor else 0
+            end = min(start + limit, len(order))
+            page = order[start:end]
+
+            # 이전 페이지 노드(순위 < start)와의 간선, 이번 페이지 노드끼리는 순위가 뒤인 쪽에서 한 번만
+            selected = {}
+            for node in page:
+                neighbours, edges = self._incident(node)
+                neighbour_position = position[neighbours]
+                keep = (neighbour_position < start) | (
+                    (neighbour_position < end) & (neighbour_position < position[node])
+                )
+                for edge in edges[keep].tolist():
+                    selected.setdefault(edge, None)
+
+            next_cursor = None
+            if end < len(order):
+                last = page[-1]
+                next_cursor = encode_rank_cursor(
+                    float(importance[last]), LABELS[self._node_label[last]], int(self._node_id[last])
+                )
+
+            graph_data = self._subgraph(list(selected), nodes=page, importance=importance)
+        graph_data['next_cursor'] = next_cursor
+        return graph_data
+
+    def _ranking(self, importance):
+        """(중요도 내림차순, 레이블, id) 순 노드 배열과 노드별 순위 (노드가 늘어날 때까지 캐시)"""
+        if self._rank is None or len(self._rank[0]) != len(self._node_id):
+            order = np.lexsort((self._node_id, self._node_label, -importance))
+            position = np.empty(len(order), dtype=np.int64)
+            position[order] = np.arange(len(order))
+            self._rank = (order, position)
+        return self._rank
+
+    def _cursor_position(self, cursor, position, importance):
+        """커서(이전 페이지 마지막 노드) 다음 순위"""
+        cursor_importance, cursor_label, cursor_id = cursor
+        cursor_importance = np.float32(cursor_importance)
+        label = LABELS.index(cursor_label) if cursor_label in LABELS else -1
+        index = self._index(label, cursor_id) if label >= 0 else None
+        if index is not None and importance[index] == cursor_importance:
+            return int(position[index]) + 1
+
+        # 커서 노드가 없어졌거나 중요도가 다시 계산된 경우: 커서보다 앞선 노드 수
+        labels, ids = self._node_label, self._node_id
+        return int(np.count_nonzero(
+            (importance > cursor_importance) | ((importance == cursor_importance) & (
+                (labels < label) | ((labels == label) & (ids <= cursor_id))
+            ))
+        ))
+
+    def _expand(self, start_nodes, hops, limit):
+        """시작 노드에서 너비 우선으로 hops 단계까지의 간선 번호를 최대 limit개 수집"""
+        selected = {}
+        frontier = list(start_nodes)
+        visited = set(int(node) for node in frontier)
+        for _ in range(hops):
+            next_frontier = []
+            for node in frontier:
+                neighbours, edges = self._incident(node)
+                for neighbour, edge in zip(neighbours.tolist(), edges.tolist()):
+                    selected.setdefault(edge, None)
+                    if len(selected) >= limit:
+                        return list(selected)
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        return list(selected)
+
+    def _subgraph(self, edges, nodes=None, importance=None):
+        """
+        간선 번호 목록을 노드/엣지 응답으로 변환 (노드 속성은 레이블별 쿼리 한 번)
+
+        nodes를 주지 않으면 간선의 양 끝 노드를 모두 포함합니다.
+        """
+        edges = np.asarray(edges, dtype=np.int64)
+        if nodes is None:
+            nodes = np.unique(np.concatenate((self._src[edges], self._dst[edges]))) if len(edges) else edges
+        if importance is None:
+            importance = self.importance()
+        degrees = self.degrees()
+
+        ids_by_label = {}
+        for node in nodes:
+            ids_by_label.setdefault(int(self._node_label[node]), []).append(int(self._node_id[node]))
+        properties = {label: _node_properties(label, ids) for label, ids in ids_by_label.items()}
+        property_names = [source[5] for source in _edge_sources()]
+
+        return {
+            'nodes': [
+                {
+                    'id': int(node),
+                    'labels': [LABELS[self._node_label[node]]],
+                    'properties': dict(
+                        properties[int(self._node_label[node])].get(int(self._node_id[node]), {}),
+                        degree=int(degrees[node]),
+                        importance=round(float(importance[node]), 6)
+                    )
+                }
+                for node in nodes
+            ],
+            'edges': [
+                {
+                    'from': int(self._src[edge]),
+                    'to': int(self._dst[edge]),
+                    'type': self._types[self._type[edge]],
+                    'properties': {property_names[self._source[edge]]: round(float(self._weight[edge]), 4)}
+                }
+                for edge in edges
+            ]
+        }
+
+    def stats(self):
+        with self._lock:
+            return {
+                'loaded': self.loaded_at is not None,
+                'rebuilding': self._rebuild_thread is not None and self._rebuild_thread.is_alive(),
+                'nodes': len(self._node_id) if self.loaded_at is not None else 0,
+                'edges': len(self._src) if self.loaded_at is not None else 0,
+                'delta_edges': len(self._src) - self._csr_edges if self.loaded_at is not None else 0,
+            }
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_graph_engine():
+    """프로세스 공용 그래프 엔진 반환 (첫 조회 때 적재)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = GraphEngine()
+    return _engine
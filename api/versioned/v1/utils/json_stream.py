@@ -0,0 +1,74 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalJSONObjectParser:
+    """
+    스트리밍 JSON 객체 파서
+
+    최상위 JSON 객체를 조각 단위로 받아, 최상위 멤버("key": value)가 완성될 때마다
+    on_member(key, value)를 호출합니다. 전체 응답이 끝나기 전에 섹션별로 결과를 사용할 수 있습니다.
+    """
+
+    def __init__(self, on_member):
+        self.on_member = on_member
+        self._text = ''
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start = None
+
+    @property
+    def text(self):
+        """지금까지 받은 전체 텍스트"""
+        return self._text
+
+    def feed(self, chunk):
+        """조각 입력 후 새로 완성된 멤버에 대해 콜백 호출"""
+        if not chunk:
+            return
+        self._text += chunk
+        text = self._text
+
+        for pos in range(self._pos, len(text)):
+            char = text[pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+                if self._depth == 1:
+                    self._member_start = pos + 1
+            elif char in '}]':
+                if self._depth == 1:
+                    self._emit(text[self._member_start:pos])
+                    self._member_start = None
+                self._depth -= 1
+            elif char == ',' and self._depth == 1:
+                self._emit(text[self._member_start:pos])
+                self._member_start = pos + 1
+
+        self._pos = len(text)
+
+    def _emit(self, member_text):
+        if self._member_start is None or not member_text.strip():
+            return
+        try:
+            member = json.loads('{' + member_text + '}')
+        except ValueError:
+            logger.debug(f"스트리밍 JSON 멤버 파싱 실패: {member_text[:100]}")
+            return
+        for key, value in member.items():
+            self.on_member(key, value)
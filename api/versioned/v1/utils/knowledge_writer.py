@@ -0,0 +1,212 @@
+import logging
+
+from api.versioned.v1.utils.analysis_chunking import mention_count
+from api.versioned.v1.utils.catalog_context import get_catalog_snapshot
+from api.versioned.v1.utils.concept_canonicalizer import ConceptCanonicalizer
+from article.models import ArticleConcept, ArticleEntity, ArticleEvent
+from concept.models import ConceptDomain, ConceptRelationship
+from event.models import Event
+from entity.models import Entity
+
+logger = logging.getLogger(__name__)
+
+
+def _unique(values):
+    """순서를 유지하며 빈 값과 중복 제거"""
+    return list(dict.fromkeys(value for value in values if value))
+
+
+def _relationship_concepts(relationships_data):
+    """개념 관계의 양 끝 개념 이름 목록"""
+    return [
+        {'name': rel[end]}
+        for rel in relationships_data if rel.get('source') and rel.get('target')
+        for end in ('source', 'target')
+    ]
+
+
+def _valid_event_date(date_str):
+    """YYYY-MM-DD 형식의 날짜 문자열만 허용"""
+    if date_str and isinstance(date_str, str) and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        return date_str
+    return None
+
+
+class KnowledgeWriter:
+    """
+    기사 분석 결과 일괄 저장기
+
+    항목마다 get_or_create/create를 호출하는 대신, 이름을 한 번의 filter(name__in=...)로
+    조회하고 없는 행만 bulk_create(ignore_conflicts=True)로 넣은 뒤 다시 조회합니다.
+    연결 테이블도 bulk_create로 한 번에 저장하므로 기사당 쿼리 수가 항목 수와 무관하며,
+    다른 워커가 같은 이름을 동시에 넣어도 IntegrityError 없이 같은 행으로 수렴합니다.
+    """
+
+    def __init__(self, article):
+        self.article = article
+        self.canonicalizer = ConceptCanonicalizer()
+
+    def prepare_concepts(self, concepts_data, relationships_data=()):
+        """
+        개념 매핑용 임베딩 미리 계산
+
+        임베딩 모델은 CPU를 오래 쓰므로 저장 트랜잭션을 열기 전에 호출합니다.
+        """
+        self.canonicalizer.prepare(list(concepts_data) + _relationship_concepts(relationships_data))
+
+    def _resolve(self, model, lookup_field, keys, build, key_of, queryset=None):
+        """
+        키 목록을 행으로 변환 (없으면 생성)
+
+        이미 있는 행을 조회하고, 없는 키만 일괄 삽입한 뒤 다시 조회합니다.
+        같은 키의 행이 여러 개면 가장 먼저 만들어진 행(id 최소)을 사용합니다.
+        반환값: ({키: 인스턴스}, 새로 삽입을 시도한 키 목록)
+        """
+        queryset = queryset if queryset is not None else model.objects.all()
+        lookup_values = _unique(key[0] if isinstance(key, tuple) else key for key in keys)
+
+        def fetch():
+            rows = {}
+            for instance in queryset.filter(**{f"{lookup_field}__in": lookup_values}).order_by('id'):
+                rows.setdefault(key_of(instance), instance)
+            return rows
+
+        rows = fetch()
+        missing = [key for key in keys if key not in rows]
+        if missing:
+            model.objects.bulk_create([build(key) for key in missing], ignore_conflicts=True)
+            rows = fetch()
+
+        return rows, missing
+
+    def write_domains(self, names):
+        """카테고리(도메인) 저장 및 기사 연결"""
+        names = _unique(names)
+        if not names:
+            return []
+
+        rows, created = self._resolve(
+            ConceptDomain, 'name', names,
+            build=lambda name: ConceptDomain(name=name),
+            key_of=lambda domain: domain.name
+        )
+        if created:
+            get_catalog_snapshot().invalidate()
+
+        domains = [rows[name] for name in names if name in rows]
+        self.article.domains.add(*domains)
+        return domains
+
+    def resolve_concepts(self, concepts_data):
+        """개념 이름을 대표 Concept 행으로 변환 (표기가 달라도 같은 개념이면 기존 행, 없으면 생성)"""
+        rows, created = self.canonicalizer.resolve(concepts_data)
+        if created:
+            get_catalog_snapshot().concepts_created(created)
+        return rows
+
+    def write_concepts(self, concepts_data):
+        """주요 개념 저장 및 기사 연결"""
+        concepts = self.resolve_concepts(concepts_data)
+
+        links = {}
+        for concept_data in concepts_data:
+            concept = concepts.get(concept_data.get('name'))
+            if concept and concept.id not in links:
+                links[concept.id] = ArticleConcept(
+                    article=self.article,
+                    concept=concept,
+                    confidence=concept_data.get('confidence', 0.0),
+                    is_key_concept=True
+                )
+        ArticleConcept.objects.bulk_create(links.values(), ignore_conflicts=True)
+        return concepts
+
+    def write_entities(self, entities_data):
+        """엔티티 저장 및 기사 연결"""
+        data_by_key = {}
+        for entity_data in entities_data:
+            if entity_data.get('name'):
+                data_by_key.setdefault((entity_data['name'], entity_data.get('entity_type', '기타')), entity_data)
+        if not data_by_key:
+            return {}
+
+        entities, _ = self._resolve(
+            Entity, 'name', list(data_by_key),
+            build=lambda key: Entity(
+                name=key[0],
+                entity_type=key[1],
+                description=data_by_key[key].get('description', '')
+            ),
+            key_of=lambda entity: (entity.name, entity.entity_type)
+        )
+
+        links = {}
+        for key, entity_data in data_by_key.items():
+            entity = entities.get(key)
+            if entity and entity.id not in links:
+                links[entity.id] = ArticleEntity(
+                    article=self.article,
+                    entity=entity,
+                    confidence=1.0,
+                    mention_count=mention_count(entity_data)
+                )
+        ArticleEntity.objects.bulk_create(links.values(), ignore_conflicts=True)
+        return entities
+
+    def write_events(self, event_info, related_event_names, domain=None):
+        """기사가 다루는 이벤트와 관련된 기존 이벤트 저장 및 기사 연결"""
+        links = []
+
+        if event_info and event_info.get('event_name'):
+            name = event_info['event_name']
+            rows, created = self._resolve(
+                Event, 'name', [name],
+                build=lambda key: Event(
+                    name=key,
+                    description=event_info.get('description', ''),
+                    event_date=_valid_event_date(event_info.get('event_date')),
+                    event_type=event_info.get('event_type', '')
+                ),
+                key_of=lambda event: event.name
+            )
+            if created:
+                get_catalog_snapshot().invalidate()
+
+            event = rows[name]
+            links.append(ArticleEvent(article=self.article, event=event, relationship_type='PART_OF', confidence=1.0))
+
+            # 이벤트에 도메인 연결
+            if domain:
+                Event.objects.filter(id=event.id).update(domain=domain)
+
+        related_event_names = _unique(related_event_names)
+        if related_event_names:
+            for event in Event.objects.filter(name__in=related_event_names):
+                links.append(ArticleEvent(article=self.article, event=event, relationship_type='RELATED_TO', confidence=0.8))
+
+        # 같은 이벤트가 중복되면 먼저 추가된 PART_OF 연결 유지
+        ArticleEvent.objects.bulk_create(links, ignore_conflicts=True)
+
+    def write_concept_relationships(self, relationships_data):
+        """개념 간 관계 저장"""
+        relationships_data = [rel for rel in relationships_data if rel.get('source') and rel.get('target')]
+        if not relationships_data:
+            return
+
+        concepts = self.resolve_concepts(_relationship_concepts(relationships_data))
+
+        relationships = {}
+        for rel in relationships_data:
+            source = concepts.get(rel['source'])
+            target = concepts.get(rel['target'])
+            relationship_type = rel.get('relationship_type', 'RELATED_TO')
+            # 대표 개념으로 매핑된 결과 같은 개념이 된 관계는 제외
+            key = (source.id, target.id, relationship_type) if source and target and source.id != target.id else None
+            if key and key not in relationships:
+                relationships[key] = ConceptRelationship(
+                    source_concept=source,
+                    target_concept=target,
+                    relationship_type=relationship_type,
+                    weight=rel.get('weight', 0.5)
+                )
+        ConceptRelationship.objects.bulk_create(relationships.values(), ignore_conflicts=True)
@@ -0,0 +1,76 @@
+from django.db.models import Count, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+# (연결 모델, 외래 키, 연결 수를 가진 모델, 연결 수 필드) - article.models의 COUNTERS와 같은 구성
+LINK_COUNTERS = (
+    ('article.ArticleConcept', 'article', 'article.Article', 'concept_count'),
+    ('article.ArticleConcept', 'concept', 'concept.Concept', 'article_count'),
+    ('article.ArticleEntity', 'article', 'article.Article', 'entity_count'),
+    ('article.ArticleEntity', 'entity', 'entity.Entity', 'article_count'),
+    ('article.ArticleEvent', 'event', 'event.Event', 'article_count'),
+)
+
+
+def recount_link_counters(apps, dry_run=False):
+    """
+    연결 수를 연결 테이블에서 다시 계산
+
+    연결 수마다 상관 서브쿼리 UPDATE 한 번으로, 값이 틀린 행만 고칩니다.
+    apps는 django.apps.apps 또는 마이그레이션의 과거 모델 레지스트리입니다.
+    반환값: [(연결 수 이름, 틀린 행 수)]
+    """
+    results = []
+    for link_label, field_name, counted_label, counter in LINK_COUNTERS:
+        link_model = apps.get_model(link_label)
+        counted_model = apps.get_model(counted_label)
+
+        actual = Coalesce(Subquery(
+            link_model.objects.filter(**{field_name: OuterRef('pk')})
+            .order_by().values(field_name).annotate(count=Count('pk')).values('count')
+        ), Value(0))
+        stale = counted_model.objects.annotate(actual_count=actual).exclude(**{counter: F('actual_count')})
+
+        if dry_run:
+            fixed = stale.count()
+        else:
+            fixed = counted_model.objects.filter(pk__in=stale.values('pk')).update(**{counter: actual})
+        results.append((f"{counted_model._meta.label}.{counter}", fixed))
+    return results
+
+
+def recount_entity_mentions(apps, dry_run=False):
+    """
+    엔티티별 언급 수 집계(EntityMentionRollup)를 ArticleEntity에서 다시 계산
+
+    연결이 있는데 집계 행이 없는 엔티티는 행을 만들고, 합계나 유형이 틀린 행만 고칩니다.
+    반환값: [(집계 이름, 틀린 행 수)]
+    """
+    Entity = apps.get_model('entity.Entity')
+    ArticleEntity = apps.get_model('article.ArticleEntity')
+    EntityMentionRollup = apps.get_model('entity.EntityMentionRollup')
+
+    missing = Entity.objects.filter(
+        id__in=ArticleEntity.objects.values('entity_id')
+    ).exclude(id__in=EntityMentionRollup.objects.values('entity_id'))
+
+    actual = Coalesce(Subquery(
+        ArticleEntity.objects.filter(entity_id=OuterRef('entity_id'))
+        .order_by().values('entity_id').annotate(total=Sum('mention_count')).values('total')
+    ), Value(0))
+    actual_type = Subquery(Entity.objects.filter(id=OuterRef('entity_id')).values('entity_type'))
+    stale = EntityMentionRollup.objects.annotate(actual_count=actual, actual_type=actual_type).exclude(
+        mention_count=F('actual_count'), entity_type=F('actual_type')
+    )
+
+    if dry_run:
+        return [(EntityMentionRollup._meta.label, missing.count() + stale.count())]
+
+    # 새로 만든 행은 0에서 시작하므로 아래 UPDATE에서 함께 채워짐
+    EntityMentionRollup.objects.bulk_create([
+        EntityMentionRollup(entity_id=entity_id, entity_type=entity_type)
+        for entity_id, entity_type in missing.values_list('id', 'entity_type').iterator(chunk_size=2000)
+    ], batch_size=2000, ignore_conflicts=True)
+    fixed = EntityMentionRollup.objects.filter(pk__in=stale.values('pk')).update(
+        mention_count=actual, entity_type=actual_type
+    )
+    return [(EntityMentionRollup._meta.label, fixed)]
@@ -0,0 +1,136 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class LLMResponseCache:
+    """
+    SQLite 기반 LLM 응답 캐시
+
+    키는 본문 해시, 모델 이름, 프롬프트 버전의 조합이며,
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다(LRU).
+    여러 프로세스/스레드가 같은 파일을 공유할 수 있도록 호출마다 연결을 새로 엽니다.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    @staticmethod
+    def make_key(text_hash, model, prompt_version):
+        """캐시 키 생성"""
+        return hashlib.sha256(f"{text_hash}:{model}:{prompt_version}".encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """캐시 조회 (없으면 None), 조회 결과에 따라 hit/miss 카운터 증가"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+                if row:
+                    conn.execute('UPDATE entries SET last_access = ? WHERE key = ?', (time.time(), key))
+                self._increment(conn, 'hits' if row else 'misses')
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 캐시 조회 실패: {str(e)}")
+            return None
+
+    def set(self, key, value):
+        """캐시 저장 후 크기 제한 초과분 삭제"""
+        now = time.time()
+        size = len(value.encode('utf-8'))
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO entries (key, value, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)',
+                    (key, value, size, now, now)
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM 캐시 저장 실패: {str(e)}")
+
+    def _evict(self, conn):
+        """LRU 순서로 크기 제한을 넘는 항목 삭제"""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in conn.execute('SELECT key, size FROM entries ORDER BY last_access').fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+            total -= size
+            evicted += 1
+        self._increment(conn, 'evictions', evicted)
+
+    def _increment(self, conn, name, amount=1):
+        conn.execute(
+            'INSERT INTO counters (name, value) VALUES (?, ?) '
+            'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value',
+            (name, amount)
+        )
+
+    def stats(self):
+        """캐시 통계 (항목 수, 크기, hit/miss/eviction 카운터)"""
+        with self._connect() as conn:
+            entries, total = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+            counters = dict(conn.execute('SELECT name, value FROM counters').fetchall())
+        hits = counters.get('hits', 0)
+        misses = counters.get('misses', 0)
+        return {
+            'entries': entries,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'hits': hits,
+            'misses': misses,
+            'evictions': counters.get('evictions', 0),
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0
+        }
+
+    def clear(self):
+        """캐시 항목과 카운터 삭제"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM entries')
+            conn.execute('DELETE FROM counters')
+
+
+_cache = None
+
+
+def get_llm_cache():
+    """설정 기반 공용 LLM 캐시 반환 (LLM_CACHE_PATH가 비어 있으면 None)"""
+    global _cache
+    if _cache is None and settings.LLM_CACHE_PATH:
+        _cache = LLMResponseCache(settings.LLM_CACHE_PATH, settings.LLM_CACHE_MAX_BYTES)
+    return _cache
@@ -1,277 +1,385 @@
-from py2neo import Graph, Node, Relationship
+from py2neo import Graph
+from py2neo.errors import ClientError
 from django.conf import settings
+import base64
+import json
 import logging
+import re
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+RELATIONSHIP_TYPE_RE = re.compile(r'[^A-Z0-9_]')
+
+# 그래프 스키마 (MERGE/MATCH의 id 조회와 개념 이름 조회용)
+SCHEMA_STATEMENTS = [
+    "CREATE CONSTRAINT article_id IF NOT EXISTS FOR (n:Article) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT concept_id IF NOT EXISTS FOR (n:Concept) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (n:Entity) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT event_id IF NOT EXISTS FOR (n:Event) REQUIRE n.id IS UNIQUE",
+    # 개념 이름은 도메인별로만 고유하므로 일반 인덱스
+    "CREATE INDEX concept_name IF NOT EXISTS FOR (n:Concept) ON (n.name)",
+] + [
+    # 중요도 상위 노드 조회(HUB_QUERY)를 레이블별 범위 인덱스 탐색으로 처리
+    f"CREATE INDEX {label.lower()}_importance IF NOT EXISTS FOR (n:{label}) ON (n.importance)"
+    for label in ('Article', 'Concept', 'Entity', 'Event')
+]
+
+# 중요도 상위 노드 페이지 (커서 이후 limit개)와, 이 노드끼리 또는 이전 페이지 노드와의 간선
+# 레이블마다 importance 인덱스를 내림차순으로 limit개만 읽고 합쳐 전체 순서(importance, 레이블, id)로 자릅니다.
+# 첫 페이지는 $importance에 무한대를 넘깁니다.
+HUB_QUERY = "CALL {" + "\nUNION ALL".join(f"""
+    MATCH (n:{label})
+    WHERE n.importance <= $importance AND (
+        n.importance < $importance OR '{label}' > $label OR ('{label}' = $label AND n.id > $id)
+    )
+    RETURN n ORDER BY n.importance DESC, n.id LIMIT $limit""" for label in ('Article', 'Concept', 'Entity', 'Event')) + """
+}
+WITH n ORDER BY n.importance DESC, labels(n)[0], n.id LIMIT $limit
+WITH collect(n) AS page
+UNWIND page AS n
+OPTIONAL MATCH (n)-[r]-(m)
+WHERE (m IN page AND id(n) < id(m)) OR m.importance > $importance OR (m.importance = $importance AND (
+    labels(m)[0] < $label OR (labels(m)[0] = $label AND m.id <= $id)
+))
+RETURN n, r
+"""
+
+
+class Neo4jUnavailable(Exception):
+    """Neo4j에 연결할 수 없거나 회로 차단 중인 경우"""
+
+
+def relationship_type_label(value, default='RELATED_TO'):
+    """관계 유형을 Cypher 관계 타입으로 쓸 수 있는 이름으로 변환 (파라미터로 넘길 수 없어 문장에 직접 삽입)"""
+    label = RELATIONSHIP_TYPE_RE.sub('_', str(value or '').strip().upper())
+    if not label:
+        return default
+    return f"_{label}" if label[0].isdigit() else label
+
+
+def encode_rank_cursor(importance, label, node_id):
+    """중요도 순 페이지 커서 (마지막 노드의 중요도, 레이블, id)"""
+    return base64.urlsafe_b64encode(json.dumps([importance, label, node_id]).encode()).decode()
+
+
+def decode_rank_cursor(cursor):
+    """페이지 커서 해석 (잘못된 값이면 ValueError)"""
+    try:
+        importance, label, node_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(importance), str(label), int(node_id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def article_node(article):
+    return {'id': article.id, 'props': {
+        'title': article.title,
+        'url': article.url,
+        'created_at': str(article.created_at),
+        'source': article.source
+    }}
+
+
+def concept_node(concept):
+    return {'id': concept.id, 'props': {
+        'name': concept.name,
+        'description': concept.description,
+        'confidence': concept.confidence
+    }}
+
+
+def entity_node(entity):
+    return {'id': entity.id, 'props': {
+        'name': entity.name,
+        'entity_type': entity.entity_type,
+        'description': entity.description
+    }}
+
+
+def event_node(event):
+    return {'id': event.id, 'props': {
+        'name': event.name,
+        'description': event.description,
+        'event_date': str(event.event_date) if event.event_date else None,
+        'event_type': event.event_type
+    }}
+
+
+class GraphBatch:
+    """
+    그래프 일괄 쓰기 묶음
+
+    노드는 레이블별, 관계는 (시작 레이블, 끝 레이블, 관계 타입)별 파라미터 목록으로 모아
+    Neo4jClient.write_batch()가 묶음마다 UNWIND ... MERGE 문장 하나로 전송합니다.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.relationships = {}
+
+    def add_node(self, label, row):
+        self.nodes.setdefault(label, {})[row['id']] = row
+
+    def add_relationship(self, source_label, target_label, relationship_type, source_id, target_id, **props):
+        key = (source_label, target_label, relationship_type_label(relationship_type))
+        self.relationships.setdefault(key, {})[(source_id, target_id)] = {
+            'source_id': source_id,
+            'target_id': target_id,
+            'props': props
+        }
+
+    def add_article_concept(self, article_concept):
+        self.add_relationship(
+            'Article', 'Concept', 'MENTIONS', article_concept.article_id, article_concept.concept_id,
+            confidence=article_concept.confidence, is_key_concept=article_concept.is_key_concept
+        )
+
+    def add_article_entity(self, article_entity):
+        self.add_relationship(
+            'Article', 'Entity', 'MENTIONS', article_entity.article_id, article_entity.entity_id,
+            confidence=article_entity.confidence, mention_count=article_entity.mention_count
+        )
+
+    def add_article_event(self, article_event):
+        self.add_relationship(
+            'Article', 'Event', article_event.relationship_type, article_event.article_id, article_event.event_id,
+            confidence=article_event.confidence
+        )
+
+    def add_article_relationship(self, article_relationship):
+        self.add_relationship(
+            'Article', 'Article', article_relationship.relationship_type,
+            article_relationship.source_article_id, article_relationship.target_article_id,
+            similarity_score=article_relationship.similarity_score
+        )
+
+    def add_concept_relationship(self, concept_relationship):
+        self.add_relationship(
+            'Concept', 'Concept', concept_relationship.relationship_type,
+            concept_relationship.source_concept_id, concept_relationship.target_concept_id,
+            weight=concept_relationship.weight
+        )
+
+    def __len__(self):
+        return sum(len(rows) for rows in self.nodes.values()) + sum(len(rows) for rows in self.relationships.values())
+
+
+def build_article_batch(article_ids, batch=None):
+    """
+    기사들의 노드와 관계를 GraphBatch로 수집
+
+    연결 테이블을 select_related로 한 번씩만 조회하므로 기사 수와 관계없이 쿼리 수가 일정합니다.
+    """
+    from article.models import Article, ArticleConcept, ArticleEntity, ArticleEvent, ArticleRelationship
+    from concept.models import ConceptRelationship
+
+    batch = batch if batch is not None else GraphBatch()
+    article_ids = list(article_ids)
+
+    for article in Article.objects.filter(id__in=article_ids).only('id', 'title', 'url', 'created_at', 'source'):
+        batch.add_node('Article', article_node(article))
+
+    concept_ids = set()
+    for article_concept in ArticleConcept.objects.filter(article_id__in=article_ids).select_related('concept'):
+        concept_ids.add(article_concept.concept_id)
+        batch.add_node('Concept', concept_node(article_concept.concept))
+        batch.add_article_concept(article_concept)
+
+    for article_entity in ArticleEntity.objects.filter(article_id__in=article_ids).select_related('entity'):
+        batch.add_node('Entity', entity_node(article_entity.entity))
+        batch.add_article_entity(article_entity)
+
+    for article_event in ArticleEvent.objects.filter(article_id__in=article_ids).select_related('event'):
+        batch.add_node('Event', event_node(article_event.event))
+        batch.add_article_event(article_event)
+
+    for article_relationship in ArticleRelationship.objects.filter(source_article_id__in=article_ids):
+        batch.add_article_relationship(article_relationship)
+
+    # 기사 개념 사이의 관계
+    if concept_ids:
+        for concept_relationship in ConceptRelationship.objects.filter(
+            source_concept_id__in=concept_ids,
+            target_concept_id__in=concept_ids
+        ):
+            batch.add_concept_relationship(concept_relationship)
+
+    return batch
+
+
 class Neo4jClient:
-    """Neo4j 그래프 데이터베이스 클라이언트"""
+    """
+    Neo4j 그래프 데이터베이스 클라이언트
+
+    프로세스마다 get_neo4j_client()로 하나만 만들어 공유합니다. 연결은 첫 사용 때 맺고
+    py2neo 커넥터 풀(최대 NEO4J_POOL_SIZE개)을 재사용합니다.
+    연결/서버 오류가 NEO4J_FAILURE_THRESHOLD번 연속되면 NEO4J_COOLDOWN초 동안 회로를 열어
+    graph가 None을 반환하므로, 요청마다 연결 시간 초과를 다시 기다리지 않습니다.
+    """
     
-    def __init__(self):
-        """Neo4j 연결 초기화"""
-        try:
-            # 명시적으로 URI, 사용자 이름, 비밀번호 로그 출력 (디버깅용)
-            logger.info(f"Neo4j 연결 시도: {settings.NEO4J_URI}")
-            
-            # Neo4j AuraDB의 경우 인증서 검증을 건너뛰도록 설정
-            self.graph = Graph(
-                settings.NEO4J_URI,
-                auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
-                secure=True,
-                verify=True
-            )
-            logger.info("Neo4j 연결 성공")
-        except Exception as e:
-            logger.error(f"Neo4j 연결 실패: {str(e)}")
-            self.graph = None
+    def __init__(self, pool_size=None, failure_threshold=None, cooldown=None):
+        """설정만 저장 (연결은 graph 첫 접근 시)"""
+        self.pool_size = pool_size or settings.NEO4J_POOL_SIZE
+        self.failure_threshold = failure_threshold or settings.NEO4J_FAILURE_THRESHOLD
+        self.cooldown = settings.NEO4J_COOLDOWN if cooldown is None else cooldown
+        self._graph = None
+        self._lock = threading.RLock()
+        self.failures = 0
+        self.open_until = 0.0
+        self.last_error = None
+        self.last_success_at = None
     
-    def create_article_node(self, article):
-        """기사 노드 생성"""
-        if not self.graph:
-            logger.error("Neo4j 연결이 없습니다.")
+    @property
+    def graph(self):
+        """공유 Graph 연결 (회로가 열려 있거나 연결에 실패하면 None)"""
+        if self.is_open():
             return None
+        if self._graph is not None:
+            return self._graph
         
-        try:
-            query = """
-            MERGE (a:Article {id: $article_id})
-            SET a.title = $title, 
-                a.url = $url, 
-                a.created_at = $created_at,
-                a.source = $source
-            RETURN a
-            """
-            
-            result = self.graph.run(
-                query, 
-                article_id=article.id, 
-                title=article.title, 
-                url=article.url,
-                created_at=str(article.created_at),
-                source=article.source
-            )
-            
-            return result.evaluate()
-        except Exception as e:
-            logger.error(f"기사 노드 생성 실패: {str(e)}")
-            return None
+        with self._lock:
+            if self._graph is None and not self.is_open():
+                try:
+                    logger.info(f"Neo4j 연결 시도: {settings.NEO4J_URI}")
+                    self._graph = Graph(
+                        settings.NEO4J_URI,
+                        auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+                        secure=True,
+                        verify=True,
+                        max_size=self.pool_size,
+                        max_age=settings.NEO4J_POOL_MAX_AGE
+                    )
+                    logger.info("Neo4j 연결 성공")
+                except Exception as e:
+                    logger.error(f"Neo4j 연결 실패: {str(e)}")
+                    self._record(e)
+        return self._graph
     
-    def create_concept_node(self, concept):
-        """개념 노드 생성"""
-        if not self.graph:
-            logger.error("Neo4j 연결이 없습니다.")
-            return None
-        
-        try:
-            query = """
-            MERGE (c:Concept {id: $concept_id})
-            SET c.name = $name, 
-                c.description = $description,
-                c.confidence = $confidence
-            RETURN c
-            """
-            
-            result = self.graph.run(
-                query, 
-                concept_id=concept.id, 
-                name=concept.name, 
-                description=concept.description,
-                confidence=concept.confidence
-            )
-            
-            return result.evaluate()
-        except Exception as e:
-            logger.error(f"개념 노드 생성 실패: {str(e)}")
-            return None
+    def is_open(self):
+        """회로 차단 중인지 여부 (대기 시간이 지나면 다음 요청 하나를 시험 삼아 통과시킴)"""
+        return self.open_until > time.monotonic()
     
-    def create_entity_node(self, entity):
-        """엔티티 노드 생성"""
-        if not self.graph:
-            logger.error("Neo4j 연결이 없습니다.")
-            return None
-        
-        try:
-            query = """
-            MERGE (e:Entity {id: $entity_id})
-            SET e.name = $name, 
-                e.entity_type = $entity_type,
-                e.description = $description
-            RETURN e
-            """
+    def _record(self, error=None):
+        """호출 결과를 회로 상태에 반영 (error가 None이면 성공)"""
+        with self._lock:
+            if error is None:
+                self.failures = 0
+                self.last_success_at = time.time()
+                return
             
-            result = self.graph.run(
-                query, 
-                entity_id=entity.id, 
-                name=entity.name, 
-                entity_type=entity.entity_type,
-                description=entity.description
-            )
-            
-            return result.evaluate()
-        except Exception as e:
-            logger.error(f"엔티티 노드 생성 실패: {str(e)}")
-            return None
+            self.failures += 1
+            self.last_error = str(error)
+            if self.failures >= self.failure_threshold:
+                self.open_until = time.monotonic() + self.cooldown
+                logger.warning(f"Neo4j 오류 {self.failures}회 연속, {self.cooldown}초 동안 호출을 건너뜁니다.")
     
-    def create_event_node(self, event):
-        """이벤트 노드 생성"""
-        if not self.graph:
-            logger.error("Neo4j 연결이 없습니다.")
-            return None
-        
-        try:
-            query = """
-            MERGE (e:Event {id: $event_id})
-            SET e.name = $name, 
-                e.description = $description,
-                e.event_date = $event_date,
-                e.event_type = $event_type
-            RETURN e
-            """
-            
-            result = self.graph.run(
-                query, 
-                event_id=event.id, 
-                name=event.name, 
-                description=event.description,
-                event_date=str(event.event_date) if event.event_date else None,
-                event_type=event.event_type
-            )
-            
-            return result.evaluate()
-        except Exception as e:
-            logger.error(f"이벤트 노드 생성 실패: {str(e)}")
-            return None
+    def record_success(self):
+        self._record()
     
-    def create_article_concept_relationship(self, article_concept):
-        """기사와 개념 간의 관계 생성"""
-        if not self.graph:
-            logger.error("Neo4j 연결이 없습니다.")
-            return None
-        
-        try:
-            query = """
-            MATCH (a:Article {id: $article_id})
-            MATCH (c:Concept {id: $concept_id})
-            MERGE (a)-[r:MENTIONS {confidence: $confidence, is_key_concept: $is_key_concept}]->(c)
-            RETURN r
-            """
-            
-            result = self.graph.run(
-                query, 
-                article_id=article_concept.article.id, 
-                concept_id=article_concept.concept.id,
-                confidence=article_concept.confidence,
-                is_key_concept=article_concept.is_key_concept
-            )
-            
-            return result.evaluate()
-        except Exception as e:
-            logger.error(f"기사-개념 관계 생성 실패: {str(e)}")
-            return None
+    def record_failure(self, error):
+        """연결/서버 오류 기록 (잘못된 쿼리 같은 클라이언트 오류는 회로에 반영하지 않음)"""
+        if not isinstance(error, ClientError):
+            self._record(error)
     
-    def create_article_entity_relationship(self, article_entity):
-        """기사와 엔티티 간의 관계 생성"""
-        if not self.graph:
-            logger.error("Neo4j 연결이 없습니다.")
-            return None
-        
-        try:
-            query = """
-            MATCH (a:Article {id: $article_id})
-            MATCH (e:Entity {id: $entity_id})
-            MERGE (a)-[r:MENTIONS {confidence: $confidence, mention_count: $mention_count}]->(e)
-            RETURN r
-            """
-            
-            result = self.graph.run(
-                query, 
-                article_id=article_entity.article.id, 
-                entity_id=article_entity.entity.id,
-                confidence=article_entity.confidence,
-                mention_count=article_entity.mention_count
-            )
-            
-            return result.evaluate()
-        except Exception as e:
-            logger.error(f"기사-엔티티 관계 생성 실패: {str(e)}")
-            return None
+    def health(self):
+        """회로 상태와 최근 오류 (상태 확인용)"""
+        if self.is_open():
+            state = 'open'
+        elif self.failures >= self.failure_threshold:
+            state = 'half_open'
+        else:
+            state = 'closed'
+        return {
+            'state': state,
+            'connected': self._graph is not None,
+            'failures': self.failures,
+            'retry_in': max(0.0, round(self.open_until - time.monotonic(), 1)),
+            'last_error': self.last_error,
+            'last_success_at': self.last_success_at,
+        }
     
-    def create_article_event_relationship(self, article_event):
-        """기사와 이벤트 간의 관계 생성"""
-        if not self.graph:
-            logger.error("Neo4j 연결이 없습니다.")
-            return None
-        
+    def run(self, query, **params):
+        """
+        Cypher 쿼리 실행 후 레코드 목록 반환 (결과를 모두 읽어 연결을 풀에 돌려줌)
+
+        사용할 수 없으면 Neo4jUnavailable, 쿼리 실패는 기록 후 원래 예외를 올립니다.
+        """
+        graph = self.graph
+        if graph is None:
+            raise Neo4jUnavailable("Neo4j를 사용할 수 없습니다.")
         try:
-            query = f"""
-            MATCH (a:Article {{id: $article_id}})
-            MATCH (e:Event {{id: $event_id}})
-            MERGE (a)-[r:{article_event.relationship_type} {{confidence: $confidence}}]->(e)
-            RETURN r
-            """
-            
-            result = self.graph.run(
-                query, 
-                article_id=article_event.article.id, 
-                event_id=article_event.event.id,
-                confidence=article_event.confidence
-            )
-            
-            return result.evaluate()
+            records = list(graph.run(query, **params))
         except Exception as e:
-            logger.error(f"기사-이벤트 관계 생성 실패: {str(e)}")
-            return None
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return records
     
-    def create_article_relationship(self, article_relationship):
-        """기사 간의 관계 생성"""
-        if not self.graph:
-            logger.error("Neo4j 연결이 없습니다.")
-            return None
+    def write_batch(self, batch, tx=None):
+        """
+        GraphBatch를 UNWIND ... MERGE 문장으로 전송 (노드 먼저, 관계는 타입별로 한 문장)
+
+        tx가 없으면 새 트랜잭션을 열어 모두 성공했을 때만 커밋합니다.
+        사용할 수 없으면 Neo4jUnavailable, 실패하면 기록 후 예외를 그대로 올립니다.
+        반환값: 실행한 문장 수
+        """
+        graph = self.graph
+        if graph is None:
+            raise Neo4jUnavailable("Neo4j를 사용할 수 없습니다.")
         
+        own_tx = tx is None
+        statements = 0
         try:
-            query = f"""
-            MATCH (a1:Article {{id: $source_id}})
-            MATCH (a2:Article {{id: $target_id}})
-            MERGE (a1)-[r:{article_relationship.relationship_type} {{similarity_score: $similarity_score}}]->(a2)
-            RETURN r
-            """
-            
-            result = self.graph.run(
-                query, 
-                source_id=article_relationship.source_article.id, 
-                target_id=article_relationship.target_article.id,
-                similarity_score=article_relationship.similarity_score
-            )
+            if own_tx:
+                tx = graph.begin()
             
-            return result.evaluate()
-        except Exception as e:
-            logger.error(f"기사-기사 관계 생성 실패: {str(e)}")
-            return None
-    
-    def create_concept_relationship(self, concept_relationship):
-        """개념 간의 관계 생성"""
-        if not self.graph:
-            logger.error("Neo4j 연결이 없습니다.")
-            return None
-        
-        try:
-            query = f"""
-            MATCH (c1:Concept {{id: $source_id}})
-            MATCH (c2:Concept {{id: $target_id}})
-            MERGE (c1)-[r:{concept_relationship.relationship_type} {{weight: $weight}}]->(c2)
-            RETURN r
-            """
+            for label, rows in batch.nodes.items():
+                tx.run(
+                    # 새 노드는 update_graph_rank 전까지 중요도 0으로 기본 조회 끝에 포함
+                    f"UNWIND $rows AS row MERGE (n:{label} {{id: row.id}}) "
+                    f"ON CREATE SET n.degree = 0, n.importance = 0.0 SET n += row.props",
+                    rows=list(rows.values())
+                )
+                statements += 1
             
-            result = self.graph.run(
-                query, 
-                source_id=concept_relationship.source_concept.id, 
-                target_id=concept_relationship.target_concept.id,
-                weight=concept_relationship.weight
-            )
+            for (source_label, target_label, relationship_type), rows in batch.relationships.items():
+                tx.run(
+                    f"""
+                    UNWIND $rows AS row
+                    MATCH (s:{source_label} {{id: row.source_id}})
+                    MATCH (t:{target_label} {{id: row.target_id}})
+                    MERGE (s)-[r:{relationship_type}]->(t)
+                    SET r += row.props
+                    """,
+                    rows=list(rows.values())
+                )
+                statements += 1
             
-            return result.evaluate()
+            if own_tx:
+                graph.commit(tx)
         except Exception as e:
-            logger.error(f"개념-개념 관계 생성 실패: {str(e)}")
-            return None
+            self.record_failure(e)
+            if own_tx and tx is not None:
+                try:
+                    graph.rollback(tx)
+                except Exception:
+                    pass
+            raise
+        
+        self.record_success()
+        return statements
+    
+    def ensure_schema(self):
+        """고유 제약 조건과 인덱스 생성 (이미 있으면 건너뜀), 실행한 문장 수 반환"""
+        for statement in SCHEMA_STATEMENTS:
+            self.run(statement)
+        return len(SCHEMA_STATEMENTS)
+    
+    def write_node_properties(self, label, rows):
+        """기존 노드의 속성 일괄 갱신 (rows: [{'id', 'props'}], 없는 노드는 건너뜀)"""
+        self.run(f"UNWIND $rows AS row MATCH (n:{label} {{id: row.id}}) SET n += row.props", rows=rows)
     
     def find_similar_articles(self, article_id, limit=5):
         """유사한 기사 찾기"""
@@ -289,7 +397,7 @@ class Neo4jClient:
             LIMIT $limit
             """
             
-            results = self.graph.run(
+            results = self.run(
                 query, 
                 article_id=article_id,
                 limit=limit
@@ -314,7 +422,7 @@ class Neo4jClient:
             LIMIT $limit
             """
             
-            results = self.graph.run(
+            results = self.run(
                 query, 
                 concept_name=concept_name,
                 limit=limit
@@ -340,7 +448,7 @@ class Neo4jClient:
             LIMIT 100
             """
             
-            results = self.graph.run(
+            results = self.run(
                 query, 
                 article_id=article_id
             )
@@ -378,4 +486,18 @@ class Neo4jClient:
             }
         except Exception as e:
             logger.error(f"기사 지식 그래프 검색 실패: {str(e)}")
-            return None 
\ No newline at end of file
+            return None 
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_neo4j_client():
+    """프로세스 공용 Neo4j 클라이언트 반환 (연결은 첫 사용 때 맺음)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Neo4jClient()
+    return _client
@@ -0,0 +1,152 @@
+import base64
+import datetime
+import decimal
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+def _json_default(value):
+    # 커서 값은 정확해야 하므로 마이크로초까지 그대로 유지 (DjangoJSONEncoder는 밀리초로 자름)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    raise TypeError(f"커서에 넣을 수 없는 값입니다: {type(value).__name__}")
+
+
+class KeysetPagination(BasePagination):
+    """
+    키셋(커서) 페이지네이션
+
+    OFFSET으로 앞의 행을 건너뛰는 대신 이전 페이지 마지막 행의 정렬 키보다 뒤에 있는 행을
+    WHERE 조건으로 읽으므로, 정렬 키 인덱스를 타고 깊은 페이지도 첫 페이지와 같은 비용이 듭니다.
+
+    정렬은 뷰의 keyset_ordering(기본 -created_at, -id)이며 마지막 필드는 고유해야 합니다.
+    정렬 필드는 NULL이 아닌 모델 필드나 annotate 값이어야 합니다.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'limit'
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = settings.PAGINATION_MAX_PAGE_SIZE
+    ordering = ('-created_at', '-id')
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = [(name.lstrip('-'), name.startswith('-')) for name in self.get_ordering(view)]
+        position, self.reversed = self.decode_cursor(request)
+
+        # 이전 페이지는 정렬을 뒤집어 읽은 뒤 결과 순서를 되돌림
+        order = [(field, descending != self.reversed) for field, descending in self.fields]
+        queryset = queryset.order_by(*[f"-{field}" if descending else field for field, descending in order])
+        if position is not None:
+            queryset = queryset.filter(self._after(order, position))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if self.reversed:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.first = self._position(rows[0]) if rows else None
+        self.last = self._position(rows[-1]) if rows else None
+        return rows
+
+    def get_ordering(self, view):
+        return getattr(view, 'keyset_ordering', None) or self.ordering
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def _position(self, row):
+        return [getattr(row, field) for field, _ in self.fields]
+
+    def _after(self, order, position):
+        """(a, b, ...) 정렬 키가 position보다 뒤인 행: a > v1 OR (a = v1 AND b > v2) OR ..."""
+        condition = Q()
+        for index, (field, descending) in enumerate(order):
+            term = Q(**{f"{field}__{'lt' if descending else 'gt'}": position[index]})
+            for (equal_field, _), value in zip(order[:index], position):
+                term &= Q(**{equal_field: value})
+            condition |= term
+        return condition
+
+    def decode_cursor(self, request):
+        """커서 해석 (없으면 (None, False), 잘못된 값이면 404)"""
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            position = payload['p']
+            if not isinstance(position, list) or len(position) != len(self.fields):
+                raise ValueError(cursor)
+            return position, bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, position, reversed=False):
+        payload = {'p': position, 'r': 1} if reversed else {'p': position}
+        cursor = base64.urlsafe_b64encode(json.dumps(payload, default=_json_default).encode()).decode()
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        if not self.has_next or self.last is None:
+            return None
+        return self.encode_cursor(self.last)
+
+    def get_previous_link(self):
+        if not self.has_previous or self.first is None:
+            return None
+        return self.encode_cursor(self.first, reversed=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "페이지 커서 (응답의 next/previous 링크에 포함)",
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f"페이지당 결과 수 (최대 {self.max_page_size})",
+                'schema': {'type': 'integer'},
+            },
+        ]
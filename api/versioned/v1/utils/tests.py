@@ -0,0 +1,259 @@
+import os
+import tempfile
+from datetime import timedelta
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.versioned.v1.utils.checkpoint import load_checkpoint, save_checkpoint
+from api.versioned.v1.utils.concept_canonicalizer import ConceptCanonicalizer
+from api.versioned.v1.utils.knowledge_writer import KnowledgeWriter
+from api.versioned.v1.utils.pagination import KeysetPagination
+from api.versioned.v1.utils.vector_index import VectorIndex
+from article.models import Article, ArticleConcept, ArticleEntity
+from concept.models import Concept, ConceptAlias, ConceptRelationship
+from concept.utils import name_key
+from entity.models import Entity
+
+
+class VectorIndexTests(SimpleTestCase):
+    """IVF 벡터 인덱스의 빌드, 델타 추가, 메인/델타 중복 제거 (api.versioned.v1.utils.vector_index)"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.index = VectorIndex('concept', directory.name, nprobe=4)
+
+        rng = np.random.default_rng(0)
+        matrix = rng.normal(size=(200, 16)).astype(np.float32)
+        self.matrix = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.ids = np.arange(1, 201)
+
+    def build(self, on_load=None):
+        def load_vectors():
+            if on_load:
+                on_load()
+            return self.ids, self.matrix
+        return self.index.build(load_vectors, nlist=4)
+
+    def test_build_then_search_finds_each_vector(self):
+        meta = self.build()
+
+        self.assertEqual((meta['count'], meta['nlist']), (200, 4))
+        for row in (0, 57, 199):
+            best_id, score = self.index.search(self.matrix[row], k=3)[0]
+            self.assertEqual(best_id, self.ids[row])
+            self.assertAlmostEqual(score, 1.0, places=2)
+
+    def test_delta_vector_replaces_main_entry_for_same_id(self):
+        self.build()
+        replacement = self.matrix[100]  # id 6의 새 벡터 (id 101과 같은 방향)
+        self.index.insert([6, 500], [replacement, self.matrix[5]])
+
+        results = self.index.search(replacement, k=10)
+        ids = [result_id for result_id, _ in results]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(set(ids[:2]), {6, 101})
+
+        # 예전 벡터로 찾으면 id 6은 메인의 예전 점수가 아니라 델타의 점수로 한 번만 나옴
+        results = dict(self.index.search(self.matrix[5], k=200))
+        self.assertEqual(self.index.search(self.matrix[5], k=1)[0][0], 500)
+        self.assertAlmostEqual(results[6], float(self.matrix[100] @ self.matrix[5]), places=2)
+        self.assertEqual(self.index.stats()['delta'], 2)
+
+    def test_insert_during_build_is_kept_in_new_delta(self):
+        self.build()
+        self.index.insert([300], [self.matrix[0]])
+        self.build(on_load=lambda: self.index.insert([301], [self.matrix[1]]))
+
+        # 빌드 시작 전 델타(300)는 버려지고, 로드 이후 추가된 301만 새 델타로 옮겨짐
+        self.assertEqual(self.index.stats()['delta'], 1)
+        ids = [result_id for result_id, _ in self.index.search(self.matrix[1], k=2)]
+        self.assertEqual(set(ids), {2, 301})
+
+    def test_empty_build_lets_first_insert_set_dimension(self):
+        meta = self.index.build(lambda: (np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32)))
+        self.assertIsNone(meta['dim'])
+        self.assertEqual(self.index.search(self.matrix[0]), [])
+
+        self.index.insert([1, 2], self.matrix[:2])
+        self.assertEqual(self.index.stats()['dim'], 16)
+        self.assertEqual(self.index.search(self.matrix[1], k=1)[0][0], 2)
+
+        # 다시 빈 빌드를 해도 정해진 차원은 유지되어 이후 추가가 실패하지 않음
+        meta = self.index.build(lambda: (np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32)))
+        self.assertEqual(meta['dim'], 16)
+        self.index.insert([3], self.matrix[2:3])
+        self.assertEqual(self.index.search(self.matrix[2], k=1)[0][0], 3)
+
+
+class KeysetPaginationTests(TestCase):
+    """키셋 페이지네이션 커서 왕복 (api.versioned.v1.utils.pagination.KeysetPagination)"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.concepts = [Concept.objects.create(name=f'개념{i:02d}') for i in range(7)]
+        # 정렬 키가 같은 행이 페이지 경계에 걸치도록 created_at을 둘씩 같게 맞춤
+        now = timezone.now()
+        for i, concept in enumerate(self.concepts):
+            Concept.objects.filter(id=concept.id).update(created_at=now - timedelta(seconds=i // 2))
+
+    def paginate(self, link=None, limit=3):
+        query = {'limit': limit}
+        if link:
+            query['cursor'] = parse_qs(urlsplit(link).query)['cursor'][0]
+        paginator = KeysetPagination()
+        rows = paginator.paginate_queryset(Concept.objects.all(), Request(self.factory.get('/concepts/', query)))
+        return [row.id for row in rows], paginator.get_next_link(), paginator.get_previous_link()
+
+    def test_next_and_previous_links_round_trip(self):
+        expected = list(Concept.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+        pages = []
+        ids, next_link, previous_link = self.paginate()
+        self.assertIsNone(previous_link)
+        pages.append(ids)
+        while next_link:
+            ids, next_link, previous_link = self.paginate(next_link)
+            self.assertIsNotNone(previous_link)
+            pages.append(ids)
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+        # 마지막 페이지에서 previous 링크를 따라가면 같은 페이지들을 거꾸로 다시 받음
+        backward = [pages[-1]]
+        while previous_link:
+            ids, _, previous_link = self.paginate(previous_link)
+            backward.append(ids)
+        self.assertEqual(backward[::-1], pages)
+
+    def test_rows_inserted_before_cursor_do_not_shift_pages(self):
+        first, next_link, _ = self.paginate()
+        Concept.objects.create(name='새 개념')
+
+        second, _, _ = self.paginate(next_link)
+        expected = list(Concept.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(second, expected[expected.index(first[-1]) + 1:][:3])
+
+    def test_invalid_cursor_is_not_found(self):
+        request = Request(self.factory.get('/concepts/', {'cursor': 'not-a-cursor'}))
+        with self.assertRaises(NotFound):
+            KeysetPagination().paginate_queryset(Concept.objects.all(), request)
+
+
+class CheckpointTests(SimpleTestCase):
+    """배치 명령의 재개 지점 파일 (api.versioned.v1.utils.checkpoint)"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'nested', 'checkpoint.json')
+
+    def test_round_trip_creates_directory(self):
+        self.assertEqual(load_checkpoint(self.path), {})
+        save_checkpoint(self.path, {'concepts': 42})
+        self.assertEqual(load_checkpoint(self.path), {'concepts': 42})
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+    def test_unreadable_file_starts_over(self):
+        save_checkpoint(self.path, {})
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{')
+        self.assertEqual(load_checkpoint(self.path), {})
+
+
+class ConceptCanonicalizerTests(TestCase):
+    """개념 이름의 대표 개념 매핑과 새 개념 생성 보고 (api.versioned.v1.utils.concept_canonicalizer)"""
+
+    def setUp(self):
+        self.canonicalizer = ConceptCanonicalizer(similarity_threshold=0)
+
+    def test_resolve_reports_only_new_concepts(self):
+        existing = Concept.objects.create(name='강화학습')
+
+        rows, created = self.canonicalizer.resolve([{'name': '강화 학습'}, {'name': '딥러닝'}])
+
+        self.assertEqual(rows['강화 학습'].id, existing.id)
+        self.assertEqual(created, ['딥러닝'])
+        self.assertEqual(
+            dict(ConceptAlias.objects.values_list('normalized_alias', 'method')),
+            {name_key('강화 학습'): ConceptAlias.METHOD_NORMALIZED, name_key('딥러닝'): ConceptAlias.METHOD_CREATED}
+        )
+
+    def test_row_inserted_by_another_worker_is_not_reported_as_created(self):
+        # 이름 조회 이후 다른 작업자가 같은 이름을 먼저 넣은 상황: 삽입은 충돌로 건너뛰어짐
+        other = Concept.objects.create(name='강화학습')
+        data_by_key = {name_key(name): {'name': name} for name in ('강화학습', '딥러닝')}
+        resolved = {}
+
+        created = self.canonicalizer._create(list(data_by_key), data_by_key, {}, resolved)
+
+        self.assertEqual(created, [name_key('딥러닝')])
+        self.assertEqual(resolved[name_key('강화학습')].id, other.id)
+        self.assertEqual(Concept.objects.filter(name='강화학습').count(), 1)
+
+
+class KnowledgeWriterTests(TestCase):
+    """분석 결과 일괄 저장 (api.versioned.v1.utils.knowledge_writer.KnowledgeWriter)"""
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username='writer')
+        self.article = Article.objects.create(user=user, title='t', url='https://example.com/1', content='c')
+        self.writer = KnowledgeWriter(self.article)
+        self.writer.canonicalizer.similarity_threshold = 0  # 이름 기준으로만 매핑
+
+    def entities(self, count):
+        return [{'name': f'엔티티{i}', 'entity_type': '조직'} for i in range(count)]
+
+    def test_query_count_does_not_grow_with_items(self):
+        with CaptureQueriesContext(connection) as few:
+            self.writer.write_entities(self.entities(2))
+        Entity.objects.all().delete()
+        with self.assertNumQueries(len(few)):
+            self.writer.write_entities(self.entities(20))
+        self.assertEqual(ArticleEntity.objects.filter(article=self.article).count(), 20)
+
+    def test_rows_inserted_by_another_worker_converge(self):
+        real_bulk_create = Entity.objects.bulk_create
+        winners = {}
+
+        def bulk_create_after_other_worker(objs, **kwargs):
+            # 이 워커가 조회한 직후 다른 워커가 같은 이름을 먼저 넣은 상황
+            winners['엔티티1'] = Entity.objects.create(name='엔티티1', entity_type='조직', description='다른 워커')
+            return real_bulk_create(objs, **kwargs)
+
+        with mock.patch.object(Entity.objects, 'bulk_create', side_effect=bulk_create_after_other_worker):
+            entities = self.writer.write_entities(self.entities(3))
+
+        self.assertEqual(entities[('엔티티1', '조직')].id, winners['엔티티1'].id)
+        self.assertEqual(Entity.objects.filter(name='엔티티1').count(), 1)
+        self.assertEqual(
+            set(ArticleEntity.objects.filter(article=self.article).values_list('entity__name', flat=True)),
+            {'엔티티0', '엔티티1', '엔티티2'}
+        )
+
+    def test_concepts_and_relationships_are_written_once(self):
+        Concept.objects.create(name='인공지능')
+        concepts = self.writer.write_concepts([{'name': '인공지능'}, {'name': '인공 지능'}, {'name': '강화학습'}])
+        self.writer.write_concept_relationships([
+            {'source': '강화학습', 'target': '인공 지능', 'relationship_type': 'PART_OF'},
+            {'source': '강화학습', 'target': '인공지능', 'relationship_type': 'PART_OF'},  # 같은 대표 개념
+            {'source': '인공지능', 'target': '인공 지능'},  # 자기 자신과의 관계
+        ])
+
+        self.assertEqual(concepts['인공지능'].id, concepts['인공 지능'].id)
+        self.assertEqual(Concept.objects.count(), 2)
+        self.assertEqual(ArticleConcept.objects.filter(article=self.article).count(), 2)
+        self.assertEqual(
+            list(ConceptRelationship.objects.values_list('source_concept__name', 'target_concept__name', 'relationship_type')),
+            [('강화학습', '인공지능', 'PART_OF')]
+        )
@@ -0,0 +1,316 @@
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from filelock import FileLock
+
+from api.versioned.v1.utils.embeddings import EMBEDDING_DTYPE
+
+logger = logging.getLogger(__name__)
+
+META_FILE = 'meta.json'
+DELTA_FILE = 'delta.bin'
+ASSIGN_BATCH_SIZE = 8192
+
+
+def _normalize(matrix):
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+def _assign(matrix, centroids):
+    """각 벡터를 내적이 가장 큰 중심점에 배정 (메모리 사용을 제한하기 위해 배치 단위로 계산)"""
+    assignments = np.empty(len(matrix), dtype=np.int32)
+    for start in range(0, len(matrix), ASSIGN_BATCH_SIZE):
+        batch = np.asarray(matrix[start:start + ASSIGN_BATCH_SIZE], dtype=np.float32)
+        assignments[start:start + len(batch)] = np.argmax(batch @ centroids.T, axis=1)
+    return assignments
+
+
+def train_centroids(matrix, nlist, iterations, sample_size, seed=0):
+    """구면 k-평균으로 IVF 중심점 학습 (표본만 사용)"""
+    rng = np.random.default_rng(seed)
+    if len(matrix) > sample_size:
+        sample = np.asarray(matrix[np.sort(rng.choice(len(matrix), sample_size, replace=False))], dtype=np.float32)
+    else:
+        sample = np.asarray(matrix, dtype=np.float32)
+
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = _assign(sample, centroids)
+        counts = np.bincount(assignments, minlength=nlist)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        nonempty = counts > 0
+
+        sums = np.empty_like(centroids)
+        sums[nonempty] = np.add.reduceat(sample[np.argsort(assignments, kind='stable')], starts[nonempty], axis=0)
+        # 빈 클러스터는 임의의 표본으로 다시 초기화
+        sums[~nonempty] = sample[rng.choice(len(sample), int((~nonempty).sum()))]
+        centroids = _normalize(sums).astype(np.float32)
+
+    return centroids
+
+
+class VectorIndex:
+    """
+    디스크 기반 IVF 근사 최근접 이웃 인덱스
+
+    build()는 벡터를 k-평균 클러스터(리스트)별로 정렬해 .npy 파일로 저장하고,
+    검색은 쿼리와 가까운 nprobe개 리스트만 내적으로 비교합니다.
+    파일은 메모리 매핑으로 읽으므로 같은 서버의 워커들이 OS 페이지 캐시의 한 복사본을 공유합니다.
+    빌드 이후 추가되는 벡터는 델타 세그먼트(고정 크기 레코드 파일)에 덧붙여 다음 빌드 전까지 전수 비교합니다.
+    벡터는 정규화되어 있다고 가정하므로 점수는 코사인 유사도입니다.
+    """
+
+    def __init__(self, name, directory, nprobe):
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self.nprobe = nprobe
+        os.makedirs(directory, exist_ok=True)
+        self._file_lock = FileLock(os.path.join(directory, f'{name}.lock'))
+        self._lock = threading.Lock()
+        self._main_key = None
+        self._main = None
+        self._delta_size = -1
+        self._delta = None
+
+    # 파일 구성
+
+    def _file(self, filename, path=None):
+        return os.path.join(path or self.path, filename)
+
+    def _read_meta(self, path=None):
+        try:
+            with open(self._file(META_FILE, path), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, meta, path=None):
+        tmp_path = self._file(f'{META_FILE}.tmp', path)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._file(META_FILE, path))
+
+    @staticmethod
+    def _record_dtype(dim):
+        return np.dtype([('id', '<i8'), ('vector', EMBEDDING_DTYPE, (dim,))])
+
+    def _delta_bytes(self):
+        try:
+            return os.path.getsize(self._file(DELTA_FILE))
+        except OSError:
+            return 0
+
+    # 로드
+
+    def _state(self):
+        """메인 세그먼트와 델타 세그먼트 반환 (파일이 바뀐 경우에만 다시 매핑)"""
+        with self._lock:
+            try:
+                stat = os.stat(self._file(META_FILE))
+                main_key = (stat.st_ino, stat.st_mtime_ns)
+            except OSError:
+                main_key = None
+
+            if main_key != self._main_key:
+                self._main = self._load_main() if main_key else None
+                self._main_key = main_key
+                self._delta_size = -1
+
+            if self._main is None:
+                return None, None
+
+            # 빈 빌드 뒤 아직 차원이 정해지지 않았으면 델타도 없음
+            delta_size = self._delta_bytes() if self._main['dim'] else 0
+            if delta_size != self._delta_size:
+                self._delta = None
+                if delta_size:
+                    record_dtype = self._record_dtype(self._main['dim'])
+                    count = delta_size // record_dtype.itemsize
+                    if count:
+                        records = np.memmap(self._file(DELTA_FILE), dtype=record_dtype, mode='r', shape=(count,))
+                        self._delta = (records['id'], records['vector'])
+                self._delta_size = delta_size
+
+            return self._main, self._delta
+
+    def _load_main(self):
+        meta = self._read_meta()
+        if meta is None:
+            return None
+
+        main = {'dim': meta['dim'], 'nlist': meta['nlist'], 'meta': meta}
+        if meta['nlist']:
+            main['centroids'] = np.load(self._file('centroids.npy'))
+            main['offsets'] = np.load(self._file('offsets.npy'))
+            main['vectors'] = np.load(self._file('vectors.npy'), mmap_mode='r')
+            main['ids'] = np.load(self._file('ids.npy'), mmap_mode='r')
+        return main
+
+    # 쓰기
+
+    def insert(self, ids, vectors):
+        """벡터를 델타 세그먼트에 추가 (다음 빌드 전까지 전수 비교 대상)"""
+        vectors = np.asarray(vectors, dtype=EMBEDDING_DTYPE)
+        if not len(vectors):
+            return
+
+        with self._file_lock:
+            meta = self._read_meta()
+            if meta is None:
+                # 빌드 전이면 델타만 있는 빈 인덱스 생성
+                os.makedirs(self.path, exist_ok=True)
+                meta = {'dim': vectors.shape[1], 'nlist': 0, 'count': 0, 'built_at': None}
+                self._write_meta(meta)
+            elif meta['dim'] is None:
+                # 빈 인덱스로 빌드된 뒤의 첫 추가
+                meta['dim'] = vectors.shape[1]
+                self._write_meta(meta)
+            if vectors.shape[1] != meta['dim']:
+                raise ValueError(f"벡터 차원이 인덱스와 다릅니다: {vectors.shape[1]} != {meta['dim']}")
+
+            records = np.empty(len(vectors), dtype=self._record_dtype(meta['dim']))
+            records['id'] = ids
+            records['vector'] = vectors
+            with open(self._file(DELTA_FILE), 'ab') as f:
+                f.write(records.tobytes())
+
+    def build(self, load_vectors, nlist=0, iterations=10, sample_size=100000):
+        """
+        IVF 인덱스 재구성
+
+        load_vectors()는 (id 배열, 정규화된 행렬)을 반환해야 합니다.
+        로드 시작 이후 델타에 추가된 벡터는 새 인덱스의 델타로 옮기므로, 빌드 중 추가도 유실되지 않습니다.
+        반환값: 인덱스 메타데이터
+        """
+        with self._file_lock:
+            delta_start = self._delta_bytes()
+            old_meta = self._read_meta()
+
+        ids, matrix = load_vectors()
+        # 벡터가 없으면 이전 차원을 유지하고, 처음이면 첫 insert()가 차원을 정함
+        count, dim = matrix.shape if matrix.size else (0, old_meta['dim'] if old_meta else None)
+        if not nlist:
+            nlist = max(1, int(4 * math.sqrt(count)))
+        nlist = min(nlist, count)
+
+        build_path = f"{self.path}.build-{os.getpid()}"
+        shutil.rmtree(build_path, ignore_errors=True)
+        os.makedirs(build_path)
+
+        if nlist:
+            centroids = train_centroids(matrix, nlist, iterations, sample_size)
+            assignments = _assign(matrix, centroids)
+            order = np.argsort(assignments, kind='stable')
+            offsets = np.zeros(nlist + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum(np.bincount(assignments, minlength=nlist))
+
+            np.save(self._file('centroids.npy', build_path), centroids)
+            np.save(self._file('offsets.npy', build_path), offsets)
+            np.save(self._file('vectors.npy', build_path), np.asarray(matrix[order], dtype=EMBEDDING_DTYPE))
+            np.save(self._file('ids.npy', build_path), np.asarray(ids, dtype=np.int64)[order])
+
+        meta = {'dim': None if dim is None else int(dim), 'nlist': int(nlist), 'count': int(count),
+                'built_at': time.time()}
+
+        with self._file_lock:
+            # 빌드 중 추가된 델타 레코드 이전 (차원이 같을 때만, 빈 빌드면 그동안 insert()가 정한 차원 사용)
+            old_delta = self._file(DELTA_FILE)
+            current_meta = self._read_meta()
+            if meta['dim'] is None and current_meta:
+                meta['dim'] = dim = current_meta['dim']
+            if current_meta and current_meta['dim'] == dim and self._delta_bytes() > delta_start:
+                with open(old_delta, 'rb') as src, open(self._file(DELTA_FILE, build_path), 'wb') as dst:
+                    src.seek(delta_start)
+                    shutil.copyfileobj(src, dst)
+            self._write_meta(meta, build_path)
+
+            old_path = f"{self.path}.old-{os.getpid()}"
+            if os.path.exists(self.path):
+                os.rename(self.path, old_path)
+            os.rename(build_path, self.path)
+            shutil.rmtree(old_path, ignore_errors=True)
+
+        return meta
+
+    # 검색
+
+    def search(self, vector, k=10, exclude=(), allow=None):
+        """
+        쿼리 벡터와 코사인 유사도가 높은 상위 k개 (id, 점수) 목록
+
+        같은 id가 메인과 델타에 모두 있으면 델타(최신) 벡터의 점수를 사용합니다.
+        allow를 주면 그 id만 후보로 남긴 뒤 상위 k개를 고르므로, 다른 id가 상위를 채워도 결과가 줄지 않습니다.
+        """
+        main, delta = self._state()
+        if main is None:
+            return []
+
+        query = _normalize(np.asarray(vector, dtype=np.float32))
+        candidate_ids = []
+        candidate_scores = []
+
+        if main['nlist']:
+            nprobe = min(self.nprobe, main['nlist'])
+            probes = np.argpartition(-(main['centroids'] @ query), nprobe - 1)[:nprobe]
+            offsets = main['offsets']
+            for probe in probes:
+                start, end = offsets[probe], offsets[probe + 1]
+                if end > start:
+                    candidate_ids.append(main['ids'][start:end])
+                    candidate_scores.append(np.asarray(main['vectors'][start:end], dtype=np.float32) @ query)
+
+        if delta is not None:
+            candidate_ids.append(delta[0])
+            candidate_scores.append(np.asarray(delta[1], dtype=np.float32) @ query)
+
+        if not candidate_ids:
+            return []
+
+        ids = np.concatenate(candidate_ids)
+        scores = np.concatenate(candidate_scores)
+
+        # 중복 id는 마지막(델타) 항목 유지
+        _, last = np.unique(ids[::-1], return_index=True)
+        keep = len(ids) - 1 - last
+        ids, scores = ids[keep], scores[keep]
+
+        if exclude:
+            mask = ~np.isin(ids, list(exclude))
+            ids, scores = ids[mask], scores[mask]
+        if allow is not None:
+            mask = np.isin(ids, np.fromiter(allow, dtype=np.int64))
+            ids, scores = ids[mask], scores[mask]
+
+        if len(ids) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            ids, scores = ids[top], scores[top]
+        order = np.argsort(-scores, kind='stable')
+        return [(int(ids[i]), float(scores[i])) for i in order]
+
+    def stats(self):
+        """인덱스 메타데이터와 델타 크기"""
+        main, delta = self._state()
+        if main is None:
+            return {'name': self.name, 'built': False, 'count': 0, 'delta': 0}
+        return dict(main['meta'], name=self.name, built=bool(main['nlist']), delta=0 if delta is None else len(delta[0]))
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_vector_index(name):
+    """설정 기반 공용 벡터 인덱스 반환 ('concept' 또는 'article')"""
+    with _indexes_lock:
+        if name not in _indexes:
+            _indexes[name] = VectorIndex(name, settings.VECTOR_INDEX_DIR, settings.VECTOR_INDEX_NPROBE)
+        return _indexes[name]
@@ -0,0 +1,80 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.versioned.v1.utils.checkpoint import load_checkpoint, save_checkpoint
+from api.versioned.v1.utils.embeddings import embed_articles, embed_concepts
+from article.models import Article
+from concept.models import Concept
+
+# 대상별 (모델, 임베딩 필드, 인코딩 함수, 읽을 필드)
+TARGETS = {
+    'concept': (Concept, 'embedding', embed_concepts, ('id', 'name', 'description')),
+    'article': (Article, 'summary_embedding', embed_articles, ('id', 'title', 'summary')),
+}
+
+
+class Command(BaseCommand):
+    """기존 개념/기사 요약의 임베딩 일괄 생성 (중단 후 이어서 실행 가능)"""
+    help = "임베딩이 없는 개념과 기사 요약을 배치 단위로 인코딩하고 처리량을 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', choices=['concept', 'article', 'all'], default='all')
+        parser.add_argument('--batch-size', type=int, default=1000, help="한 번에 읽어 인코딩하는 행 수")
+        parser.add_argument('--all', action='store_true', help="이미 임베딩이 있는 행도 다시 생성")
+        parser.add_argument('--reset', action='store_true', help="저장된 커서를 무시하고 처음부터 실행")
+        parser.add_argument(
+            '--checkpoint',
+            default=str(settings.BASE_DIR / '.cache' / 'backfill_embeddings.json'),
+            help="진행 커서(마지막 처리 id) 저장 파일"
+        )
+
+    def handle(self, *args, **options):
+        self.checkpoint_path = options['checkpoint']
+        checkpoint = {} if options['reset'] else load_checkpoint(self.checkpoint_path)
+        targets = list(TARGETS) if options['target'] == 'all' else [options['target']]
+
+        for target in targets:
+            self._backfill(target, checkpoint, options['batch_size'], options['all'])
+
+    def _backfill(self, target, checkpoint, batch_size, recompute):
+        model, field, embed, fields = TARGETS[target]
+        cursor = checkpoint.get(target, 0)
+
+        queryset = model.objects.only(*fields).order_by('id')
+        if not recompute:
+            queryset = queryset.filter(**{f'{field}__isnull': True})
+        total = queryset.filter(id__gt=cursor).count()
+        if cursor:
+            self.stdout.write(f"{target}: 커서 {cursor} 이후부터 이어서 실행")
+
+        processed = embedded = 0
+        started = time.perf_counter()
+        while True:
+            rows = list(queryset.filter(id__gt=cursor)[:batch_size])
+            if not rows:
+                break
+
+            batch_started = time.perf_counter()
+            embedded += embed(rows)
+            processed += len(rows)
+            cursor = rows[-1].id
+            checkpoint[target] = cursor
+            save_checkpoint(self.checkpoint_path, checkpoint)
+
+            batch_seconds = time.perf_counter() - batch_started
+            self.stdout.write(
+                f"{target}: {processed}/{total} rows, cursor={cursor}, "
+                f"{len(rows) / batch_seconds if batch_seconds else 0:.1f} rows/s"
+            )
+
+        # 끝까지 처리했으면 커서 제거 (다음 실행은 새로 생긴 행만 대상)
+        checkpoint.pop(target, None)
+        save_checkpoint(self.checkpoint_path, checkpoint)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"{target}: {embedded} embedded / {processed} rows in {elapsed:.1f}s "
+            f"({processed / elapsed if elapsed else 0:.1f} rows/s)"
+        ))
@@ -0,0 +1,85 @@
+import json
+import statistics
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.versioned.v1.utils.extractor import extract_page
+
+
+class Command(BaseCommand):
+    """저장된 HTML 코퍼스로 본문 추출 속도와 성공률 측정"""
+    help = "benchmarks/extraction 코퍼스의 페이지별 파싱 시간과 추출 성공률을 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--corpus',
+            default=str(settings.BASE_DIR / 'benchmarks' / 'extraction'),
+            help="manifest.json과 HTML 페이지가 있는 디렉터리"
+        )
+        parser.add_argument('--repeat', type=int, default=5, help="페이지당 반복 횟수 (중앙값 사용)")
+
+    def handle(self, *args, **options):
+        corpus = Path(options['corpus'])
+        manifest_path = corpus / 'manifest.json'
+        if not manifest_path.exists():
+            raise CommandError(f"코퍼스 매니페스트가 없습니다: {manifest_path}")
+
+        cases = json.loads(manifest_path.read_text(encoding='utf-8'))
+        repeat = max(1, options['repeat'])
+        timings = []
+        succeeded = 0
+
+        for case in cases:
+            html = (corpus / case['file']).read_text(encoding='utf-8')
+
+            elapsed = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                page, method = extract_page(html, case.get('url'))
+                elapsed.append(time.perf_counter() - started)
+            median_ms = statistics.median(elapsed) * 1000
+            timings.append(median_ms)
+
+            failures = self._check(case, page)
+            if not failures:
+                succeeded += 1
+
+            self.stdout.write(
+                f"{'OK  ' if not failures else 'FAIL'} {case['file']:<40} {median_ms:8.2f}ms "
+                f"{len(html) // 1024:5d}KB method={method or '-'} chars={len(page['content'])}"
+                + (f" ({', '.join(failures)})" if failures else '')
+            )
+
+        if not cases:
+            self.stdout.write("코퍼스에 페이지가 없습니다.")
+            return
+
+        total_seconds = sum(timings) / 1000
+        p95 = sorted(timings)[max(0, int(len(timings) * 0.95 + 0.5) - 1)]
+        self.stdout.write(
+            f"pages={len(cases)} success={succeeded}/{len(cases)} ({succeeded / len(cases):.1%}) "
+            f"mean={statistics.mean(timings):.2f}ms p95={p95:.2f}ms "
+            f"throughput={len(cases) / total_seconds if total_seconds else 0:.1f} pages/s"
+        )
+
+    def _check(self, case, page):
+        """매니페스트의 기대값과 추출 결과 비교 (실패 사유 목록)"""
+        failures = []
+        if case.get('title') and case['title'] not in page['title']:
+            failures.append('title')
+        if not page['content']:
+            failures.append('empty content')
+        for text in case.get('content_contains', []):
+            if text not in page['content']:
+                failures.append(f"missing {text[:15]!r}")
+        for text in case.get('content_excludes', []):
+            if text in page['content']:
+                failures.append(f"boilerplate {text[:15]!r}")
+        if case.get('published_date') and str(page['published_date']) != case['published_date']:
+            failures.append(f"date {page['published_date']}")
+        if case.get('source') and page['source'] != case['source']:
+            failures.append(f"source {page['source']!r}")
+        return failures
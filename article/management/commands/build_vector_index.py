@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.versioned.v1.utils.embeddings import load_matrix
+from api.versioned.v1.utils.vector_index import get_vector_index
+from article.models import Article
+from concept.models import Concept
+
+# 대상별 (모델, 임베딩 필드)
+TARGETS = {
+    'concept': (Concept, 'embedding'),
+    'article': (Article, 'summary_embedding'),
+}
+
+
+class Command(BaseCommand):
+    """개념/기사 요약 임베딩으로 IVF 벡터 인덱스 재구성"""
+    help = "임베딩 전체를 읽어 벡터 인덱스를 다시 만들고 델타 세그먼트를 비웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', choices=['concept', 'article', 'all'], default='all')
+        parser.add_argument('--nlist', type=int, default=0, help="클러스터 수 (0이면 4*sqrt(N))")
+        parser.add_argument('--iterations', type=int, default=10, help="k-평균 반복 횟수")
+        parser.add_argument('--sample-size', type=int, default=100000, help="중심점 학습에 쓰는 표본 수")
+
+    def handle(self, *args, **options):
+        targets = list(TARGETS) if options['target'] == 'all' else [options['target']]
+
+        for target in targets:
+            model, field = TARGETS[target]
+            started = time.perf_counter()
+            meta = get_vector_index(target).build(
+                lambda: load_matrix(model.objects.all(), field, dtype=None),
+                nlist=options['nlist'],
+                iterations=options['iterations'],
+                sample_size=options['sample_size']
+            )
+            elapsed = time.perf_counter() - started
+            self.stdout.write(self.style.SUCCESS(
+                f"{target}: {meta['count']} vectors, dim={meta['dim']}, nlist={meta['nlist']}, {elapsed:.1f}s"
+            ))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.versioned.v1.utils.llm_cache import get_llm_cache
+
+
+class Command(BaseCommand):
+    """LLM 응답 캐시 통계 조회 및 초기화"""
+    help = "LLM 응답 캐시의 hit/miss 통계를 출력하거나 캐시를 비웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clear', action='store_true', help="캐시 항목과 카운터 삭제")
+
+    def handle(self, *args, **options):
+        cache = get_llm_cache()
+        if cache is None:
+            raise CommandError("LLM_CACHE_PATH가 설정되지 않아 LLM 캐시를 사용하지 않습니다.")
+
+        if options['clear']:
+            cache.clear()
+            self.stdout.write("LLM 캐시를 비웠습니다.")
+            return
+
+        stats = cache.stats()
+        self.stdout.write(
+            f"entries={stats['entries']} bytes={stats['bytes']}/{stats['max_bytes']} "
+            f"hits={stats['hits']} misses={stats['misses']} evictions={stats['evictions']} "
+            f"hit_rate={stats['hit_rate']:.1%}"
+        )
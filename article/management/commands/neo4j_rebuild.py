@@ -0,0 +1,155 @@
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from api.versioned.v1.utils.checkpoint import load_checkpoint, save_checkpoint
+from api.versioned.v1.utils.neo4j_client import (
+    GraphBatch, article_node, concept_node, entity_node, event_node, get_neo4j_client
+)
+from article.models import Article, ArticleConcept, ArticleEntity, ArticleEvent, ArticleRelationship
+from concept.models import Concept, ConceptRelationship
+from entity.models import Entity
+from event.models import Event
+
+# 단계별 (모델, 읽을 필드, 배치에 추가하는 함수) - 관계는 양 끝 노드가 모두 적재된 뒤 처리
+STAGES = {
+    'article': (Article, ('id', 'title', 'url', 'created_at', 'source'),
+                lambda batch, row: batch.add_node('Article', article_node(row))),
+    'concept': (Concept, ('id', 'name', 'description', 'confidence'),
+                lambda batch, row: batch.add_node('Concept', concept_node(row))),
+    'entity': (Entity, ('id', 'name', 'entity_type', 'description'),
+               lambda batch, row: batch.add_node('Entity', entity_node(row))),
+    'event': (Event, ('id', 'name', 'description', 'event_date', 'event_type'),
+              lambda batch, row: batch.add_node('Event', event_node(row))),
+    'article_concept': (ArticleConcept, ('id', 'article_id', 'concept_id', 'confidence', 'is_key_concept'),
+                        GraphBatch.add_article_concept),
+    'article_entity': (ArticleEntity, ('id', 'article_id', 'entity_id', 'confidence', 'mention_count'),
+                       GraphBatch.add_article_entity),
+    'article_event': (ArticleEvent, ('id', 'article_id', 'event_id', 'relationship_type', 'confidence'),
+                      GraphBatch.add_article_event),
+    'article_relationship': (ArticleRelationship,
+                             ('id', 'source_article_id', 'target_article_id', 'relationship_type', 'similarity_score'),
+                             GraphBatch.add_article_relationship),
+    'concept_relationship': (ConceptRelationship,
+                             ('id', 'source_concept_id', 'target_concept_id', 'relationship_type', 'weight'),
+                             GraphBatch.add_concept_relationship),
+}
+
+# 노드 단계별 레이블과 관계 단계별로 먼저 적재돼 있어야 하는 노드 단계
+NODE_LABELS = {'article': 'Article', 'concept': 'Concept', 'entity': 'Entity', 'event': 'Event'}
+ENDPOINT_STAGES = {
+    'article_concept': ('article', 'concept'),
+    'article_entity': ('article', 'entity'),
+    'article_event': ('article', 'event'),
+    'article_relationship': ('article',),
+    'concept_relationship': ('concept',),
+}
+
+
+class Command(BaseCommand):
+    """Django DB 전체를 Neo4j로 다시 적재 (중단 후 이어서 실행 가능)"""
+    help = "그래프 제약 조건/인덱스를 만들고 노드와 관계 테이블을 배치 UNWIND로 적재하며 처리량을 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help="한 트랜잭션으로 적재하는 행 수")
+        parser.add_argument('--stage', choices=list(STAGES), action='append',
+                            help="적재할 단계 (여러 번 지정 가능, 기본은 전체)")
+        parser.add_argument('--schema-only', action='store_true', help="제약 조건과 인덱스만 생성")
+        parser.add_argument('--reset', action='store_true', help="저장된 커서를 무시하고 처음부터 실행")
+        parser.add_argument(
+            '--checkpoint',
+            default=str(settings.BASE_DIR / '.cache' / 'neo4j_rebuild.json'),
+            help="진행 커서(단계별 마지막 처리 id) 저장 파일"
+        )
+
+    def handle(self, *args, **options):
+        self.client = get_neo4j_client()
+        if self.client.graph is None:
+            raise CommandError("Neo4j에 연결할 수 없습니다.")
+
+        count = self.client.ensure_schema()
+        self.stdout.write(f"schema: {count} constraints/indexes ensured")
+        if options['schema_only']:
+            return
+
+        self.checkpoint_path = options['checkpoint']
+        checkpoint = {} if options['reset'] else load_checkpoint(self.checkpoint_path)
+        # 지정 순서와 관계없이 노드 단계를 관계 단계보다 먼저 실행
+        stages = [stage for stage in STAGES if stage in (options['stage'] or STAGES)]
+        self._check_endpoints(stages)
+
+        started = time.perf_counter()
+        total = 0
+        for stage in stages:
+            total += self._load(stage, checkpoint, options['batch_size'])
+
+        # 끝까지 적재했으면 커서 제거 (다음 실행은 처음부터)
+        for stage in stages:
+            checkpoint.pop(stage, None)
+        save_checkpoint(self.checkpoint_path, checkpoint)
+
+        # 기본 조회(중요도 상위 노드)에 쓰는 노드 연결 수와 중요도 기록
+        call_command('update_graph_rank', batch_size=options['batch_size'], stdout=self.stdout)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"total: {total} rows in {elapsed:.1f}s ({total / elapsed if elapsed else 0:.1f} rows/s)"
+        ))
+
+    def _check_endpoints(self, stages):
+        """
+        관계 단계의 양 끝 노드가 이번 실행이나 이전 적재로 준비돼 있는지 확인
+
+        관계는 MATCH로 양 끝 노드를 찾으므로 노드가 없으면 아무것도 만들지 않고 조용히 넘어갑니다.
+        """
+        missing = sorted({
+            endpoint
+            for stage in stages for endpoint in ENDPOINT_STAGES.get(stage, ())
+            if endpoint not in stages and not self.client.run(
+                f"MATCH (n:{NODE_LABELS[endpoint]}) RETURN n.id LIMIT 1"
+            )
+        })
+        if missing:
+            raise CommandError(
+                f"관계의 끝 노드가 Neo4j에 없습니다. --stage {' --stage '.join(missing)} 도 함께 지정하세요."
+            )
+
+    def _load(self, stage, checkpoint, batch_size):
+        """단계 하나를 id 순 키셋 페이지로 읽어 배치마다 한 트랜잭션으로 적재"""
+        model, fields, add = STAGES[stage]
+        cursor = checkpoint.get(stage, 0)
+        queryset = model.objects.only(*fields).order_by('id')
+        if cursor:
+            self.stdout.write(f"{stage}: 커서 {cursor} 이후부터 이어서 실행")
+
+        processed = 0
+        started = time.perf_counter()
+        while True:
+            rows = list(queryset.filter(id__gt=cursor)[:batch_size])
+            if not rows:
+                break
+
+            batch_started = time.perf_counter()
+            batch = GraphBatch()
+            for row in rows:
+                add(batch, row)
+            self.client.write_batch(batch)
+
+            processed += len(rows)
+            cursor = rows[-1].id
+            checkpoint[stage] = cursor
+            save_checkpoint(self.checkpoint_path, checkpoint)
+
+            batch_seconds = time.perf_counter() - batch_started
+            self.stdout.write(
+                f"{stage}: {processed} rows, cursor={cursor}, "
+                f"{len(rows) / batch_seconds if batch_seconds else 0:.1f} rows/s"
+            )
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"{stage}: {processed} rows in {elapsed:.1f}s ({processed / elapsed if elapsed else 0:.1f} rows/s)"
+        ))
+        return processed
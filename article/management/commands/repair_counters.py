@@ -0,0 +1,29 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.versioned.v1.utils.link_counters import recount_entity_mentions, recount_link_counters
+
+
+class Command(BaseCommand):
+    """연결 수 카운터(article_count, concept_count, entity_count)와 엔티티 언급 수 집계 재계산"""
+    help = "연결 테이블에서 기사/개념/엔티티/이벤트의 연결 수와 엔티티 언급 수 집계를 일괄 재계산하고 틀린 행만 고칩니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="고치지 않고 틀린 행 수만 출력")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        with transaction.atomic():
+            results = recount_link_counters(apps, dry_run=options['dry_run'])
+            results += recount_entity_mentions(apps, dry_run=options['dry_run'])
+
+        for name, count in results:
+            self.stdout.write(f"{name}: {count} rows {'stale' if options['dry_run'] else 'repaired'}")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"total: {sum(count for _, count in results)} rows in {elapsed:.1f}s"
+        ))
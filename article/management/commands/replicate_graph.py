@@ -0,0 +1,134 @@
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from api.versioned.v1.utils.graph_cache import bump_graph_versions
+from api.versioned.v1.utils.neo4j_client import build_article_batch, get_neo4j_client
+from article.models import ArticleProgress, GraphSyncOutbox
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    그래프 동기화 복제기
+
+    GraphSyncOutbox 대기열을 배치 단위로 읽어 기사들의 노드/관계를 Neo4j 트랜잭션 하나로 MERGE합니다.
+    MERGE는 멱등이므로 같은 요청이 다시 복제되어도 그래프가 중복되지 않습니다.
+    SIGINT/SIGTERM을 받으면 진행 중인 배치를 마친 뒤 종료합니다.
+    """
+    help = "그래프 동기화 아웃박스를 Neo4j로 복제하고 복제 지연을 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.GRAPH_SYNC_BATCH_SIZE,
+                            help="한 트랜잭션으로 복제할 요청 수")
+        parser.add_argument('--visibility-timeout', type=int, default=settings.GRAPH_SYNC_VISIBILITY_TIMEOUT,
+                            help="선점한 요청이 다른 복제기에게 다시 보이기까지의 시간(초)")
+        parser.add_argument('--retry-delay', type=int, default=settings.GRAPH_SYNC_RETRY_DELAY,
+                            help="실패한 요청의 재시도 지연 시간(초), 시도 횟수에 비례해 증가")
+        parser.add_argument('--poll-interval', type=float, default=settings.GRAPH_SYNC_POLL_INTERVAL,
+                            help="대기열이 비었을 때 다시 확인하기까지의 시간(초)")
+        parser.add_argument('--burst', action='store_true', help="대기열이 비면 종료")
+        parser.add_argument('--stats', action='store_true', help="복제 지연만 출력하고 종료")
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self._report()
+            return
+
+        self.options = options
+        self.stop_event = threading.Event()
+        self.client = get_neo4j_client()
+        self.worker_id = worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        signal.signal(signal.SIGINT, self._request_shutdown)
+        signal.signal(signal.SIGTERM, self._request_shutdown)
+
+        self.stdout.write(f"그래프 복제기 시작: batch_size={options['batch_size']}")
+        try:
+            while not self.stop_event.is_set():
+                close_old_connections()
+
+                # Neo4j를 쓸 수 없으면 시도 횟수를 소모하지 않고 회로가 닫힐 때까지 대기
+                if self.client.graph is None:
+                    if options['burst']:
+                        self.stderr.write("Neo4j를 사용할 수 없어 종료합니다.")
+                        break
+                    self.stop_event.wait(max(options['poll_interval'], self.client.health()['retry_in']))
+                    continue
+
+                entries = GraphSyncOutbox.objects.claim_batch(
+                    worker_id, options['batch_size'], options['visibility_timeout']
+                )
+                if not entries:
+                    if options['burst']:
+                        break
+                    self.stop_event.wait(options['poll_interval'])
+                    continue
+
+                self._replicate(entries)
+                self._report()
+        finally:
+            connection.close()
+
+        self.stdout.write("그래프 복제기 종료")
+
+    def _request_shutdown(self, signum, frame):
+        """종료 요청 처리 (진행 중인 배치는 마무리)"""
+        if not self.stop_event.is_set():
+            self.stdout.write("종료 요청 수신: 진행 중인 배치를 마친 뒤 종료합니다.")
+        self.stop_event.set()
+
+    def _replicate(self, entries):
+        """요청 배치를 한 트랜잭션으로 복제 (실패하면 잘못된 요청을 가려내기 위해 기사별로 다시 시도)"""
+        started = time.perf_counter()
+        try:
+            self._write(entries)
+        except Exception as e:
+            if len(entries) == 1 or self.client.is_open():
+                self._fail(entries, str(e))
+                return
+            logger.warning(f"그래프 배치 복제 실패, 기사별로 다시 시도합니다: {str(e)}")
+            for entry in entries:
+                try:
+                    self._write([entry])
+                except Exception as entry_error:
+                    self._fail([entry], str(entry_error))
+            return
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"그래프 복제 완료: {len(entries)}건, {elapsed:.2f}s")
+
+    def _write(self, entries):
+        """요청들의 기사 그래프를 MERGE하고 완료 처리 (Neo4j 기준 그래프 응답 캐시도 무효화)"""
+        article_ids = {entry.article_id for entry in entries}
+        batch = build_article_batch(article_ids)
+        self.client.write_batch(batch)
+        GraphSyncOutbox.objects.mark_synced(entries)
+        ArticleProgress.objects.record_for_ids(article_ids, ArticleProgress.STAGE_GRAPH_SYNCED)
+        bump_graph_versions(article_ids)
+
+    def _fail(self, entries, error):
+        for entry in entries:
+            if not entry.mark_failed(self.worker_id, error, retry_delay=self.options['retry_delay']):
+                continue
+            if entry.status == GraphSyncOutbox.STATUS_PENDING:
+                logger.warning(f"그래프 복제 실패, 재시도 예정: article_id={entry.article_id}, "
+                               f"attempts={entry.attempts}, error={error}")
+            else:
+                logger.error(f"그래프 복제 최종 실패: article_id={entry.article_id}, "
+                             f"attempts={entry.attempts}, error={error}")
+                ArticleProgress.objects.record_for_ids(
+                    [entry.article_id], ArticleProgress.STAGE_GRAPH_SYNC_FAILED, error=error
+                )
+
+    def _report(self):
+        lag = GraphSyncOutbox.objects.lag()
+        self.stdout.write(f"graph sync: pending={lag['pending']}, lag={lag['lag_seconds']}s, failed={lag['failed']}")
@@ -0,0 +1,126 @@
+import logging
+import os
+import signal
+import socket
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from api.versioned.v1.utils.article_processor import ArticleProcessor
+from article.models import AnalysisJob, Article, ArticleProgress
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    기사 분석 워커
+
+    AnalysisJob 대기열을 소비하며 기사 분석을 수행합니다.
+    SIGINT/SIGTERM을 받으면 진행 중인 작업을 마친 뒤 종료합니다.
+    """
+    help = "DB 기반 분석 작업 대기열을 처리하는 워커를 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=settings.ANALYSIS_WORKER_CONCURRENCY,
+                            help="동시에 처리할 작업 수 (스레드 수)")
+        parser.add_argument('--visibility-timeout', type=int, default=settings.ANALYSIS_JOB_VISIBILITY_TIMEOUT,
+                            help="선점한 작업이 다른 워커에게 다시 보이기까지의 시간(초)")
+        parser.add_argument('--retry-delay', type=int, default=settings.ANALYSIS_JOB_RETRY_DELAY,
+                            help="실패한 작업의 재시도 지연 시간(초), 시도 횟수에 비례해 증가")
+        parser.add_argument('--poll-interval', type=float, default=settings.ANALYSIS_WORKER_POLL_INTERVAL,
+                            help="대기열이 비었을 때 다시 확인하기까지의 시간(초)")
+        parser.add_argument('--burst', action='store_true',
+                            help="대기열이 비면 종료")
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.stop_event = threading.Event()
+        self.processor = ArticleProcessor()
+        worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+        signal.signal(signal.SIGINT, self._request_shutdown)
+        signal.signal(signal.SIGTERM, self._request_shutdown)
+
+        threads = [
+            threading.Thread(target=self._work_loop, args=(f"{worker_prefix}:{i}",), daemon=True)
+            for i in range(max(1, options['concurrency']))
+        ]
+        for thread in threads:
+            thread.start()
+
+        self.stdout.write(f"분석 워커 시작: concurrency={len(threads)}, "
+                          f"visibility_timeout={options['visibility_timeout']}s")
+
+        # 메인 스레드는 시그널을 받을 수 있도록 짧은 간격으로 대기
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=0.5)
+
+        self.stdout.write("분석 워커 종료")
+
+    def _request_shutdown(self, signum, frame):
+        """종료 요청 처리 (진행 중인 작업은 마무리)"""
+        if not self.stop_event.is_set():
+            self.stdout.write("종료 요청 수신: 진행 중인 작업을 마친 뒤 종료합니다.")
+        self.stop_event.set()
+
+    def _work_loop(self, worker_id):
+        """작업 선점 및 처리 루프"""
+        try:
+            while not self.stop_event.is_set():
+                close_old_connections()
+                job = AnalysisJob.objects.claim(worker_id, self.options['visibility_timeout'])
+
+                if job is None:
+                    if self.options['burst']:
+                        break
+                    self.stop_event.wait(self.options['poll_interval'])
+                    continue
+
+                self._run_job(job, worker_id)
+        finally:
+            connection.close()
+
+    def _run_job(self, job, worker_id):
+        """작업 하나 실행"""
+        article = job.article
+
+        if job.is_exhausted:
+            # 처리 중 워커가 비정상 종료되어 가시성 타임아웃으로 재선점된 경우
+            if not job.mark_failed(worker_id, "재시도 횟수를 초과했습니다."):
+                return
+            Article.objects.filter(id=article.id).update(
+                processing_status='failed',
+                error_message="재시도 횟수를 초과했습니다."
+            )
+            ArticleProgress.objects.record_for_ids([article.id], ArticleProgress.STAGE_FAILED,
+                                                   error="재시도 횟수를 초과했습니다.")
+            return
+
+        try:
+            Article.objects.filter(id=article.id).update(processing_status='processing')
+            article.processing_status = 'processing'
+
+            if self.processor.analyze_and_process_article(article):
+                if job.mark_done(worker_id):
+                    logger.info(f"기사 분석 완료: article_id={article.id}, attempts={job.attempts}")
+                return
+
+            error = article.error_message or "기사 분석에 실패했습니다."
+        except Exception as e:
+            error = str(e)
+
+        if not job.mark_failed(worker_id, error, retry_delay=self.options['retry_delay']):
+            return
+        if job.status == AnalysisJob.STATUS_QUEUED:
+            # 재시도 대기 중에는 처리 대기 상태로 표시
+            Article.objects.filter(id=article.id).update(processing_status='pending')
+            ArticleProgress.objects.record_for_ids([article.id], ArticleProgress.STAGE_RETRYING,
+                                                   error=error, attempts=job.attempts)
+            logger.warning(f"기사 분석 실패, 재시도 예정: article_id={article.id}, attempts={job.attempts}, error={error}")
+        else:
+            ArticleProgress.objects.record_for_ids([article.id], ArticleProgress.STAGE_FAILED, error=error)
+            logger.error(f"기사 분석 최종 실패: article_id={article.id}, attempts={job.attempts}, error={error}")
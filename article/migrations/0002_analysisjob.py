@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-17 22:30
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalysisJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='queued', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('max_attempts', models.IntegerField(default=3)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_by', models.CharField(blank=True, max_length=100)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='analysis_jobs', to='article.article')),
+            ],
+            options={
+                'verbose_name': '분석 작업',
+                'verbose_name_plural': '분석 작업 목록',
+                'indexes': [models.Index(fields=['status', 'available_at'], name='article_ana_status_e3f919_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.2 on 2026-10-17 22:32
+
+import hashlib
+import re
+import unicodedata
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.conf import settings
+from django.db import migrations, models
+
+# 마이그레이션 작성 시점의 URL 키/본문 지문 규칙 (이후 앱 코드가 바뀌어도 이 마이그레이션 결과는 고정)
+TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'mc_cid', 'mc_eid', 'ref', 'ref_src'}
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def url_key(url):
+    """정규화된 URL의 sha256 키"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and str(parts.port) != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ))
+    return hashlib.sha256(urlunsplit((scheme, host, path, query, '')).encode('utf-8')).hexdigest()
+
+
+def content_fingerprint(text):
+    """본문 지문 (유니코드 정규화, 공백 정리 후 sha256)"""
+    normalized = WHITESPACE_RE.sub(' ', unicodedata.normalize('NFC', text or '')).strip()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def backfill_fingerprints(apps, schema_editor):
+    """기존 기사의 URL 키와 본문 지문 채우기"""
+    Article = apps.get_model('article', 'Article')
+    batch = []
+    for article in Article.objects.only('id', 'url', 'content').iterator(chunk_size=500):
+        article.url_key = url_key(article.url)
+        article.content_hash = content_fingerprint(article.content)
+        batch.append(article)
+        if len(batch) >= 500:
+            Article.objects.bulk_update(batch, ['url_key', 'content_hash'])
+            batch = []
+    if batch:
+        Article.objects.bulk_update(batch, ['url_key', 'content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0002_analysisjob'),
+        ('concept', '0001_initial'),
+        ('entity', '0001_initial'),
+        ('event', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='url_key',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['user', 'url_key'], name='article_art_user_id_733d94_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['content_hash', 'processing_status'], name='article_art_content_cf6900_idx'),
+        ),
+        migrations.RunPython(backfill_fingerprints, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-17 22:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0003_article_url_key_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleProgress',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.CharField(choices=[('fetched', '페이지 수집'), ('extracted', '본문 추출'), ('analyzing', '분석 시작'), ('summary_saved', '요약 저장'), ('concepts_saved', '개념 저장'), ('entities_saved', '엔티티 저장'), ('graph_synced', '그래프 동기화'), ('completed', '처리 완료'), ('failed', '처리 실패')], max_length=30)),
+                ('detail', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progress_events', to='article.article')),
+            ],
+            options={
+                'verbose_name': '기사 처리 진행',
+                'verbose_name_plural': '기사 처리 진행 목록',
+                'indexes': [models.Index(fields=['article', 'id'], name='article_art_article_cd6629_idx')],
+            },
+        ),
+    ]
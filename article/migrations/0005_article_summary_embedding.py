@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 22:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0004_articleprogress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='summary_embedding',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
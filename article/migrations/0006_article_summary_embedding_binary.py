@@ -0,0 +1,56 @@
+# Generated by Django 5.2 on 2026-10-17 23:05
+
+import numpy as np
+from django.db import migrations, models
+
+
+def json_to_binary(apps, schema_editor):
+    """JSON 리스트 요약 임베딩을 float16 바이트로 변환"""
+    Article = apps.get_model('article', 'Article')
+    batch = []
+    for article in Article.objects.filter(summary_embedding__isnull=False).only('id', 'summary_embedding').iterator(chunk_size=2000):
+        article.summary_embedding_binary = np.asarray(article.summary_embedding, dtype=np.float16).tobytes()
+        batch.append(article)
+        if len(batch) >= 2000:
+            Article.objects.bulk_update(batch, ['summary_embedding_binary'])
+            batch = []
+    if batch:
+        Article.objects.bulk_update(batch, ['summary_embedding_binary'])
+
+
+def binary_to_json(apps, schema_editor):
+    Article = apps.get_model('article', 'Article')
+    batch = []
+    for article in Article.objects.filter(summary_embedding_binary__isnull=False).only('id', 'summary_embedding_binary').iterator(chunk_size=2000):
+        article.summary_embedding = np.frombuffer(article.summary_embedding_binary, dtype=np.float16).astype(float).tolist()
+        batch.append(article)
+        if len(batch) >= 2000:
+            Article.objects.bulk_update(batch, ['summary_embedding'])
+            batch = []
+    if batch:
+        Article.objects.bulk_update(batch, ['summary_embedding'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0005_article_summary_embedding'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='summary_embedding_binary',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.RunPython(json_to_binary, binary_to_json),
+        migrations.RemoveField(
+            model_name='article',
+            name='summary_embedding',
+        ),
+        migrations.RenameField(
+            model_name='article',
+            old_name='summary_embedding_binary',
+            new_name='summary_embedding',
+        ),
+    ]
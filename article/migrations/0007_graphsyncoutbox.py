@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-17 22:54
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0006_article_summary_embedding_binary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GraphSyncOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('max_attempts', models.IntegerField(default=10)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_by', models.CharField(blank=True, max_length=100)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('synced_at', models.DateTimeField(blank=True, null=True)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='graph_sync_entries', to='article.article')),
+            ],
+            options={
+                'verbose_name': '그래프 동기화 요청',
+                'verbose_name_plural': '그래프 동기화 요청 목록',
+                'indexes': [models.Index(fields=['status', 'available_at'], name='article_gra_status_1417b1_idx')],
+            },
+        ),
+    ]
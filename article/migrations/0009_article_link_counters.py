@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-17 23:04
+
+from django.db import migrations, models
+
+from api.versioned.v1.utils.link_counters import recount_link_counters
+
+
+def backfill_link_counters(apps, schema_editor):
+    """기존 기사/개념/엔티티/이벤트의 연결 수 채우기"""
+    recount_link_counters(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0008_article_graph_version'),
+        ('concept', '0006_concept_article_count'),
+        ('entity', '0002_entity_article_count'),
+        ('event', '0002_event_article_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='concept_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='entity_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_link_counters, migrations.RunPython.noop),
+    ]
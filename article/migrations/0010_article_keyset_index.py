@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-17 23:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0009_article_link_counters'),
+        ('concept', '0007_concept_keyset_index'),
+        ('entity', '0003_entity_keyset_index'),
+        ('event', '0003_event_keyset_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='article_art_user_id_68fba4_idx',
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='article_art_user_id_72eb81_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0010_article_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='articleprogress',
+            name='stage',
+            field=models.CharField(choices=[('fetched', '페이지 수집'), ('extracted', '본문 추출'), ('analyzing', '분석 시작'), ('summary_saved', '요약 저장'), ('concepts_saved', '개념 저장'), ('entities_saved', '엔티티 저장'), ('completed', '처리 완료'), ('graph_synced', '그래프 동기화'), ('graph_sync_failed', '그래프 동기화 실패'), ('failed', '처리 실패')], max_length=30),
+        ),
+    ]
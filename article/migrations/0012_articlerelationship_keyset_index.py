@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-17 23:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0011_articleprogress_graph_sync_failed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='articlerelationship',
+            index=models.Index(fields=['source_article', '-similarity_score', '-id'], name='article_art_source__a486cc_idx'),
+        ),
+    ]
@@ -1,10 +1,19 @@
-from django.db import models
+import logging
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 from concept.models import Concept, ConceptDomain
-from entity.models import Entity
+from entity.models import Entity, EntityMentionRollup
 from event.models import Event
 
+logger = logging.getLogger(__name__)
+
 User = get_user_model()
 
 class Article(models.Model):
@@ -14,6 +23,11 @@ class Article(models.Model):
     url = models.URLField()
     content = models.TextField()
     summary = models.TextField(blank=True)
+    summary_embedding = models.BinaryField(null=True, blank=True)  # 요약 벡터 임베딩 (float16 바이트)
+    
+    # 중복 판별 키
+    url_key = models.CharField(max_length=64, blank=True)  # 정규화된 URL의 sha256
+    content_hash = models.CharField(max_length=64, blank=True)  # 추출 본문의 sha256
     
     # 메타데이터
     source = models.CharField(max_length=100, blank=True)  # 언론사
@@ -38,23 +52,163 @@ class Article(models.Model):
     events = models.ManyToManyField(Event, through='ArticleEvent', related_name='articles')
     domains = models.ManyToManyField(ConceptDomain, related_name='articles')
     
+    # 연결 수 (ArticleLinkQuerySet과 article.signals가 F() 식으로 유지, repair_counters로 재계산)
+    concept_count = models.IntegerField(default=0)
+    entity_count = models.IntegerField(default=0)
+    
+    graph_version = models.PositiveIntegerField(default=0)  # 지식 그래프 응답 캐시 버전 (분석/그래프 복제 때 증가)
+    graph_updated_at = models.DateTimeField(null=True, blank=True)  # 그래프가 마지막으로 바뀐 시각 (Last-Modified)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # F() 식 UPDATE로만 바뀌는 컬럼 (인스턴스 save()가 읽어 둔 오래된 값으로 덮어쓰지 않도록 제외)
+    MAINTAINED_FIELDS = ('concept_count', 'entity_count', 'graph_version', 'graph_updated_at')
+    
     def __str__(self):
         return self.title
     
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.MAINTAINED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+    
+    @property
+    def summary_embedding_vector(self):
+        """요약 임베딩의 NumPy 뷰 (복사 없음, 읽기 전용)"""
+        from api.versioned.v1.utils.embeddings import bytes_to_vector
+        
+        return bytes_to_vector(self.summary_embedding)
+    
     class Meta:
         verbose_name = '기사'
         verbose_name_plural = '기사 목록'
         indexes = [
-            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', '-created_at', '-id']),  # 사용자별 목록 키셋 페이지네이션
             models.Index(fields=['processing_status']),
+            models.Index(fields=['user', 'url_key']),
+            models.Index(fields=['content_hash', 'processing_status']),
         ]
 
 
-class ArticleConcept(models.Model):
+def adjust_link_counters(model, rows, sign):
+    """
+    연결 행 추가(sign=1)/삭제(sign=-1)에 따른 양쪽 연결 수 갱신
+    
+    rows는 (기사 id, 대상 id, ...) 목록입니다. 증감량이 같은 행끼리 묶어
+    F() 식 UPDATE 한 번으로 처리하므로 쿼리 수가 행 수와 무관합니다.
+    """
+    for position, (field_name, counter) in enumerate(model.COUNTERS):
+        if not counter:
+            continue
+        related_model = model._meta.get_field(field_name).related_model
+        ids_by_delta = defaultdict(list)
+        for pk, count in Counter(row[position] for row in rows).items():
+            ids_by_delta[count * sign].append(pk)
+        for delta, ids in ids_by_delta.items():
+            related_model.objects.filter(id__in=ids).update(**{counter: F(counter) + delta})
+
+
+class ArticleLinkQuerySet(models.QuerySet):
+    """
+    기사 연결 테이블(ArticleConcept/ArticleEntity/ArticleEvent) 쿼리셋
+    
+    bulk_create와 delete는 save()/시그널을 거치지 않으므로 여기서 양쪽 연결 수와 집계를 함께 갱신합니다.
+    ignore_conflicts로 건너뛴 행은 세지 않도록 기존 연결을 먼저 조회합니다.
+    """
+    
+    def _pair_fields(self):
+        return [f"{field_name}_id" for field_name, _ in self.model.COUNTERS]
+    
+    def rows(self):
+        """(기사 id, 대상 id, *ROLLUP_FIELDS) 목록"""
+        return list(self.values_list(*self._pair_fields(), *self.model.ROLLUP_FIELDS))
+    
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        if not objs:
+            return objs
+        
+        article_field, target_field = self._pair_fields()
+        with transaction.atomic(using=self.db):
+            existing = set()
+            if kwargs.get('ignore_conflicts') or kwargs.get('update_conflicts'):
+                existing = set(self.filter(**{
+                    f"{article_field}__in": {getattr(obj, article_field) for obj in objs},
+                    f"{target_field}__in": {getattr(obj, target_field) for obj in objs},
+                }).values_list(article_field, target_field))
+            
+            created = super().bulk_create(objs, *args, **kwargs)
+            
+            # 같은 연결이 여러 번 들어 있으면 실제로 저장되는 첫 행만 반영
+            rows = {}
+            for obj in objs:
+                pair = (getattr(obj, article_field), getattr(obj, target_field))
+                if pair not in existing and pair not in rows:
+                    rows[pair] = obj.link_row()
+            self.model.links_changed(list(rows.values()), 1)
+        return created
+    
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            rows = self.rows()
+            result = super().delete()
+            self.model.links_changed(rows, -1)
+        return result
+    
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class ArticleLink(models.Model):
+    """
+    기사 연결 테이블 공통 부모
+    
+    COUNTERS는 (외래 키 필드, 상대 모델의 연결 수 필드) 두 쌍이며 순서는 (기사, 대상)입니다.
+    ROLLUP_FIELDS는 links_changed에서 집계에 쓰는 추가 필드입니다.
+    단건 save()/delete()도 같은 방식으로 연결 수를 갱신합니다.
+    """
+    COUNTERS = ()
+    ROLLUP_FIELDS = ()
+    
+    objects = ArticleLinkQuerySet.as_manager()
+    
+    class Meta:
+        abstract = True
+    
+    @classmethod
+    def links_changed(cls, rows, sign):
+        """연결 행 추가(sign=1)/삭제(sign=-1) 반영"""
+        adjust_link_counters(cls, rows, sign)
+    
+    def link_row(self):
+        return (
+            *(getattr(self, f"{field_name}_id") for field_name, _ in self.COUNTERS),
+            *(getattr(self, field_name) for field_name in self.ROLLUP_FIELDS),
+        )
+    
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                type(self).links_changed([self.link_row()], 1)
+    
+    def delete(self, *args, **kwargs):
+        row = self.link_row()
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            type(self).links_changed([row], -1)
+        return result
+
+
+class ArticleConcept(ArticleLink):
     """기사와 개념 간의 관계"""
+    COUNTERS = (('article', 'concept_count'), ('concept', 'article_count'))
+    
     article = models.ForeignKey(Article, on_delete=models.CASCADE)
     concept = models.ForeignKey(Concept, on_delete=models.CASCADE)
     confidence = models.FloatField(default=0.0)  # 이 기사에서 해당 개념의 관련성 점수
@@ -69,8 +223,11 @@ class ArticleConcept(models.Model):
 
 
 
-class ArticleEntity(models.Model):
+class ArticleEntity(ArticleLink):
     """기사와 엔티티 간의 관계"""
+    COUNTERS = (('article', 'entity_count'), ('entity', 'article_count'))
+    ROLLUP_FIELDS = ('mention_count',)
+    
     article = models.ForeignKey(Article, on_delete=models.CASCADE)
     entity = models.ForeignKey(Entity, on_delete=models.CASCADE)
     confidence = models.FloatField(default=0.0)
@@ -80,12 +237,23 @@ class ArticleEntity(models.Model):
     def __str__(self):
         return f"{self.article.title} - {self.entity.name}"
     
+    @classmethod
+    def links_changed(cls, rows, sign):
+        """연결 수와 함께 엔티티별 언급 수 집계(EntityMentionRollup) 갱신"""
+        super().links_changed(rows, sign)
+        mentions = Counter()
+        for _, entity_id, mention_count in rows:
+            mentions[entity_id] += mention_count * sign
+        EntityMentionRollup.objects.add_mentions(mentions)
+    
     class Meta:
         unique_together = ('article', 'entity')
 
 
-class ArticleEvent(models.Model):
+class ArticleEvent(ArticleLink):
     """기사와 이벤트 간의 관계"""
+    COUNTERS = (('article', None), ('event', 'article_count'))
+    
     article = models.ForeignKey(Article, on_delete=models.CASCADE)
     event = models.ForeignKey(Event, on_delete=models.CASCADE)
     relationship_type = models.CharField(max_length=50, default='PART_OF')  # PART_OF, MENTIONS, etc.
@@ -111,3 +279,315 @@ class ArticleRelationship(models.Model):
     
     class Meta:
         unique_together = ('source_article', 'target_article', 'relationship_type')
+        indexes = [
+            models.Index(fields=['source_article', '-similarity_score', '-id']),  # 관련 기사 키셋 페이지네이션
+        ]
+
+
+class ArticleProgressManager(models.Manager):
+    """기사 처리 진행 단계 매니저"""
+    
+    def record(self, article, stage, **detail):
+        """진행 단계 기록"""
+        return self.create(article=article, stage=stage, detail=detail)
+    
+    def record_many(self, articles, stages):
+        """여러 기사의 진행 단계를 한 번에 기록"""
+        return self.bulk_create([
+            self.model(article=article, stage=stage, detail={})
+            for article in articles for stage in stages
+        ])
+    
+    def record_for_ids(self, article_ids, stage, **detail):
+        """기사 id 목록의 진행 단계를 한 번에 기록 (기사 행을 읽지 않음)"""
+        return self.bulk_create([
+            self.model(article_id=article_id, stage=stage, detail=detail)
+            for article_id in article_ids
+        ])
+
+
+class ArticleProgress(models.Model):
+    """기사 처리 진행 단계 (진행 상황 스트림용)"""
+    STAGE_FETCHED = 'fetched'
+    STAGE_EXTRACTED = 'extracted'
+    STAGE_ANALYZING = 'analyzing'
+    STAGE_SUMMARY_SAVED = 'summary_saved'
+    STAGE_CONCEPTS_SAVED = 'concepts_saved'
+    STAGE_ENTITIES_SAVED = 'entities_saved'
+    STAGE_COMPLETED = 'completed'
+    STAGE_GRAPH_SYNCED = 'graph_synced'
+    STAGE_GRAPH_SYNC_FAILED = 'graph_sync_failed'
+    STAGE_RETRYING = 'retrying'
+    STAGE_FAILED = 'failed'
+    # 분석 완료(completed) 뒤에 replicate_graph가 그래프 복제 결과를 기록하므로 그 단계까지가 끝
+    # 재시도가 남은 분석 실패는 retrying으로 기록되어 스트림이 다음 시도까지 이어짐 (failed는 최종 실패)
+    TERMINAL_STAGES = (STAGE_GRAPH_SYNCED, STAGE_GRAPH_SYNC_FAILED, STAGE_FAILED)
+    
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='progress_events')
+    stage = models.CharField(
+        max_length=30,
+        choices=[
+            (STAGE_FETCHED, '페이지 수집'),
+            (STAGE_EXTRACTED, '본문 추출'),
+            (STAGE_ANALYZING, '분석 시작'),
+            (STAGE_SUMMARY_SAVED, '요약 저장'),
+            (STAGE_CONCEPTS_SAVED, '개념 저장'),
+            (STAGE_ENTITIES_SAVED, '엔티티 저장'),
+            (STAGE_COMPLETED, '처리 완료'),
+            (STAGE_GRAPH_SYNCED, '그래프 동기화'),
+            (STAGE_GRAPH_SYNC_FAILED, '그래프 동기화 실패'),
+            (STAGE_RETRYING, '재시도 대기'),
+            (STAGE_FAILED, '처리 실패')
+        ]
+    )
+    detail = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    objects = ArticleProgressManager()
+    
+    def __str__(self):
+        return f"{self.article_id} - {self.stage}"
+    
+    class Meta:
+        verbose_name = '기사 처리 진행'
+        verbose_name_plural = '기사 처리 진행 목록'
+        indexes = [
+            models.Index(fields=['article', 'id']),
+        ]
+
+
+class AnalysisJobManager(models.Manager):
+    """분석 작업 큐 매니저"""
+    
+    def enqueue(self, article):
+        """기사 분석 작업 등록"""
+        return self.create(article=article, max_attempts=settings.ANALYSIS_JOB_MAX_ATTEMPTS)
+    
+    def enqueue_many(self, articles):
+        """여러 기사의 분석 작업을 한 번에 등록"""
+        return self.bulk_create([
+            self.model(article=article, max_attempts=settings.ANALYSIS_JOB_MAX_ATTEMPTS)
+            for article in articles
+        ])
+    
+    def claim(self, worker_id, visibility_timeout):
+        """
+        실행 가능한 작업 하나를 선점
+        
+        대기 중이거나 가시성 타임아웃이 지난 실행 중 작업을 조건부 UPDATE로 선점하므로
+        여러 워커가 동시에 호출해도 같은 작업을 중복으로 가져가지 않습니다.
+        """
+        now = timezone.now()
+        candidates = self.filter(
+            status__in=[AnalysisJob.STATUS_QUEUED, AnalysisJob.STATUS_RUNNING],
+            available_at__lte=now
+        ).order_by('available_at', 'id').values_list('id', 'status', 'available_at')[:10]
+        
+        for job_id, job_status, available_at in candidates:
+            claimed = self.filter(id=job_id, status=job_status, available_at=available_at).update(
+                status=AnalysisJob.STATUS_RUNNING,
+                locked_by=worker_id,
+                available_at=now + timedelta(seconds=visibility_timeout),
+                attempts=F('attempts') + 1,
+                updated_at=now
+            )
+            if claimed:
+                return self.select_related('article').get(id=job_id)
+        
+        return None
+
+
+class AnalysisJob(models.Model):
+    """기사 분석 작업 (DB 기반 작업 큐)"""
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='analysis_jobs')
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            (STATUS_QUEUED, '대기'),
+            (STATUS_RUNNING, '실행 중'),
+            (STATUS_DONE, '완료'),
+            (STATUS_FAILED, '실패')
+        ],
+        default=STATUS_QUEUED
+    )
+    attempts = models.IntegerField(default=0)  # 선점(실행) 횟수
+    max_attempts = models.IntegerField(default=3)
+    available_at = models.DateTimeField(default=timezone.now)  # 다음 선점 가능 시각 (재시도 지연, 가시성 타임아웃)
+    locked_by = models.CharField(max_length=100, blank=True)  # 작업을 선점한 워커 ID
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    objects = AnalysisJobManager()
+    
+    def __str__(self):
+        return f"{self.article_id} ({self.status}, {self.attempts}/{self.max_attempts})"
+    
+    @property
+    def is_exhausted(self):
+        """재시도 횟수 초과 여부"""
+        return self.attempts > self.max_attempts
+    
+    def _finish(self, worker_id, **values):
+        """
+        선점이 유지된 경우에만 작업 상태 갱신 (갱신 여부 반환)
+        
+        가시성 타임아웃이 지나 다른 워커(또는 같은 워커의 다음 선점)가 작업을 가져갔다면
+        locked_by/attempts가 달라져 0행이 갱신되고, 이 워커의 결과는 버립니다.
+        """
+        values['updated_at'] = timezone.now()
+        updated = AnalysisJob.objects.filter(
+            pk=self.pk, locked_by=worker_id, attempts=self.attempts
+        ).update(locked_by='', **values)
+        if not updated:
+            logger.warning(f"분석 작업 선점이 만료되어 결과를 기록하지 않습니다: job_id={self.pk}, worker={worker_id}")
+            return False
+        
+        for field, value in values.items():
+            setattr(self, field, value)
+        self.locked_by = ''
+        return True
+    
+    def mark_done(self, worker_id):
+        """작업 완료 처리 (선점이 만료됐으면 False)"""
+        return self._finish(worker_id, status=self.STATUS_DONE)
+    
+    def mark_failed(self, worker_id, error, retry_delay=0):
+        """
+        작업 실패 처리 (선점이 만료됐으면 False)
+        
+        재시도 횟수가 남아 있으면 retry_delay * attempts 초 뒤에 다시 선점되도록 대기열로 돌려보냅니다.
+        """
+        if self.attempts < self.max_attempts:
+            return self._finish(
+                worker_id,
+                status=self.STATUS_QUEUED,
+                available_at=timezone.now() + timedelta(seconds=retry_delay * self.attempts),
+                last_error=error
+            )
+        return self._finish(worker_id, status=self.STATUS_FAILED, last_error=error)
+    
+    class Meta:
+        verbose_name = '분석 작업'
+        verbose_name_plural = '분석 작업 목록'
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+        ]
+
+
+class GraphSyncOutboxManager(models.Manager):
+    """그래프(Neo4j) 동기화 아웃박스 매니저"""
+    
+    def enqueue(self, article):
+        """
+        기사 그래프 동기화 요청 등록
+        
+        분석 결과를 저장하는 DB 트랜잭션 안에서 호출하므로, 결과가 커밋될 때만 함께 커밋됩니다.
+        """
+        return self.create(article=article, max_attempts=settings.GRAPH_SYNC_MAX_ATTEMPTS)
+    
+    def claim_batch(self, worker_id, limit, visibility_timeout):
+        """
+        동기화할 요청을 최대 limit개 선점
+        
+        조건부 UPDATE로 선점하므로 복제기를 여러 개 실행해도 같은 요청을 동시에 가져가지 않습니다.
+        """
+        now = timezone.now()
+        lease = now + timedelta(seconds=visibility_timeout)
+        ids = list(self.filter(
+            status=GraphSyncOutbox.STATUS_PENDING,
+            available_at__lte=now
+        ).order_by('id').values_list('id', flat=True)[:limit])
+        if not ids:
+            return []
+        
+        self.filter(id__in=ids, status=GraphSyncOutbox.STATUS_PENDING, available_at__lte=now).update(
+            locked_by=worker_id,
+            available_at=lease,
+            attempts=F('attempts') + 1
+        )
+        return list(self.filter(id__in=ids, locked_by=worker_id, available_at=lease).order_by('id'))
+    
+    def mark_synced(self, entries):
+        """동기화 완료 처리"""
+        self.filter(id__in=[entry.id for entry in entries]).update(
+            status=GraphSyncOutbox.STATUS_DONE,
+            locked_by='',
+            synced_at=timezone.now()
+        )
+    
+    def lag(self):
+        """복제 지연 지표: 대기 중 요청 수, 가장 오래된 대기 요청의 경과 시간(초), 최종 실패 수"""
+        pending = self.filter(status=GraphSyncOutbox.STATUS_PENDING)
+        oldest = pending.order_by('id').values_list('created_at', flat=True).first()
+        return {
+            'pending': pending.count(),
+            'lag_seconds': round((timezone.now() - oldest).total_seconds(), 1) if oldest else 0.0,
+            'failed': self.filter(status=GraphSyncOutbox.STATUS_FAILED).count()
+        }
+
+
+class GraphSyncOutbox(models.Model):
+    """기사 그래프 동기화 아웃박스 (replicate_graph 명령이 Neo4j로 복제)"""
+    STATUS_PENDING = 'pending'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='graph_sync_entries')
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            (STATUS_PENDING, '대기'),
+            (STATUS_DONE, '완료'),
+            (STATUS_FAILED, '실패')
+        ],
+        default=STATUS_PENDING
+    )
+    attempts = models.IntegerField(default=0)  # 복제 시도 횟수
+    max_attempts = models.IntegerField(default=10)
+    available_at = models.DateTimeField(default=timezone.now)  # 다음 선점 가능 시각 (재시도 지연, 가시성 타임아웃)
+    locked_by = models.CharField(max_length=100, blank=True)  # 요청을 선점한 복제기 ID
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    synced_at = models.DateTimeField(null=True, blank=True)
+    
+    objects = GraphSyncOutboxManager()
+    
+    def __str__(self):
+        return f"{self.article_id} ({self.status}, {self.attempts}/{self.max_attempts})"
+    
+    def mark_failed(self, worker_id, error, retry_delay=0):
+        """
+        복제 실패 처리 (선점이 만료돼 다른 복제기가 가져갔으면 False)
+        
+        재시도 횟수가 남아 있으면 retry_delay * attempts 초 뒤에 다시 선점되도록 대기열로 돌려보냅니다.
+        """
+        values = {'last_error': error}
+        if self.attempts < self.max_attempts:
+            values['available_at'] = timezone.now() + timedelta(seconds=retry_delay * self.attempts)
+        else:
+            values['status'] = self.STATUS_FAILED
+        
+        updated = GraphSyncOutbox.objects.filter(
+            pk=self.pk, locked_by=worker_id, attempts=self.attempts
+        ).update(locked_by='', **values)
+        if not updated:
+            logger.warning(f"그래프 동기화 요청 선점이 만료되어 실패를 기록하지 않습니다: entry_id={self.pk}, worker={worker_id}")
+            return False
+        
+        for field, value in values.items():
+            setattr(self, field, value)
+        self.locked_by = ''
+        return True
+    
+    class Meta:
+        verbose_name = '그래프 동기화 요청'
+        verbose_name_plural = '그래프 동기화 요청 목록'
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+        ]
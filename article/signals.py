@@ -0,0 +1,21 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from article.models import Article, ArticleConcept, ArticleEntity, ArticleEvent
+from concept.models import Concept
+from entity.models import Entity
+from event.models import Event
+
+LINK_MODELS = (ArticleConcept, ArticleEntity, ArticleEvent)
+
+
+@receiver(pre_delete, sender=Article)
+@receiver(pre_delete, sender=Concept)
+@receiver(pre_delete, sender=Entity)
+@receiver(pre_delete, sender=Event)
+def release_link_counters(sender, instance, **kwargs):
+    """기사/개념/엔티티/이벤트 삭제 시 CASCADE로 지워질 연결 행만큼 상대쪽 연결 수와 집계 감소"""
+    for model in LINK_MODELS:
+        for field_name, _ in model.COUNTERS:
+            if model._meta.get_field(field_name).related_model is sender:
+                model.links_changed(model.objects.filter(**{field_name: instance}).rows(), -1)
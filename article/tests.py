@@ -1,3 +1,347 @@
-from django.test import TestCase
+import os
+import re
+import tempfile
+import threading
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from api.versioned.v1.utils.article_processor import ArticleProcessor
+from api.versioned.v1.utils.graph_engine import LABELS, GraphEngine, GraphEngineLoading
+from article.management.commands.run_analysis_worker import Command as AnalysisWorker
+from article.models import (
+    AnalysisJob, Article, ArticleConcept, ArticleEntity, ArticleEvent, ArticleProgress, ArticleRelationship
+)
+from concept.models import Concept, ConceptRelationship
+from entity.models import Entity, EntityMentionRollup
+from event.models import Event
+
+
+class AnalysisJobClaimTests(TestCase):
+    """분석 작업 큐 선점 (AnalysisJob.objects.claim)"""
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username='worker-test')
+        self.article = Article.objects.create(user=user, title='t', url='https://example.com/a', content='c')
+        self.job = AnalysisJob.objects.enqueue(self.article)
+
+    def test_claimed_job_is_not_handed_to_another_worker(self):
+        claimed = AnalysisJob.objects.claim('w1', visibility_timeout=60)
+
+        self.assertEqual(claimed.id, self.job.id)
+        self.assertEqual(claimed.locked_by, 'w1')
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNone(AnalysisJob.objects.claim('w2', visibility_timeout=60))
+
+    def test_candidate_taken_by_another_worker_is_skipped(self):
+        # w2가 후보를 읽은 직후 w1이 먼저 선점한 상황: w2의 조건부 UPDATE는 0행이어야 함
+        candidates = list(AnalysisJob.objects.order_by('id').values_list('id', 'status', 'available_at'))
+        AnalysisJob.objects.claim('w1', visibility_timeout=60)
+
+        real_filter = AnalysisJob.objects.filter
+
+        def filter_with_stale_candidates(*args, **kwargs):
+            if 'status__in' in kwargs:
+                stale = mock.MagicMock()
+                stale.order_by.return_value.values_list.return_value.__getitem__.return_value = candidates
+                return stale
+            return real_filter(*args, **kwargs)
+
+        with mock.patch.object(AnalysisJob.objects, 'filter', side_effect=filter_with_stale_candidates):
+            self.assertIsNone(AnalysisJob.objects.claim('w2', visibility_timeout=60))
+
+        job = AnalysisJob.objects.get(id=self.job.id)
+        self.assertEqual((job.locked_by, job.attempts), ('w1', 1))
+
+    def test_expired_lease_is_reclaimed(self):
+        stale = AnalysisJob.objects.claim('w1', visibility_timeout=0)
+        reclaimed = AnalysisJob.objects.claim('w2', visibility_timeout=60)
+
+        self.assertEqual(reclaimed.id, self.job.id)
+        self.assertEqual(reclaimed.locked_by, 'w2')
+        self.assertEqual(reclaimed.attempts, 2)
+
+        # 선점을 잃은 워커의 결과는 기록되지 않음
+        self.assertFalse(stale.mark_done('w1'))
+        self.assertEqual(AnalysisJob.objects.get(id=self.job.id).status, AnalysisJob.STATUS_RUNNING)
+
+        self.assertTrue(reclaimed.mark_done('w2'))
+        job = AnalysisJob.objects.get(id=self.job.id)
+        self.assertEqual((job.status, job.locked_by), (AnalysisJob.STATUS_DONE, ''))
+
+    def test_failed_job_is_requeued_until_attempts_run_out(self):
+        AnalysisJob.objects.filter(id=self.job.id).update(max_attempts=2)
+
+        job = AnalysisJob.objects.claim('w1', visibility_timeout=60)
+        self.assertTrue(job.mark_failed('w1', 'first'))
+        self.assertEqual(AnalysisJob.objects.get(id=self.job.id).status, AnalysisJob.STATUS_QUEUED)
+
+        job = AnalysisJob.objects.claim('w1', visibility_timeout=60)
+        self.assertTrue(job.mark_failed('w1', 'second'))
+        job = AnalysisJob.objects.get(id=self.job.id)
+        self.assertEqual((job.status, job.last_error), (AnalysisJob.STATUS_FAILED, 'second'))
+
+    def test_retried_failure_is_not_a_terminal_progress_stage(self):
+        AnalysisJob.objects.filter(id=self.job.id).update(max_attempts=2)
+        worker = AnalysisWorker()
+        worker.options = {'retry_delay': 0}
+        worker.processor = mock.Mock()
+        worker.processor.analyze_and_process_article.return_value = False
+
+        def stages():
+            return list(ArticleProgress.objects.filter(article=self.article).order_by('id').values_list('stage', flat=True))
+
+        worker._run_job(AnalysisJob.objects.claim('w1', visibility_timeout=60), 'w1')
+        self.assertEqual(stages(), [ArticleProgress.STAGE_RETRYING])
+        self.assertNotIn(ArticleProgress.STAGE_RETRYING, ArticleProgress.TERMINAL_STAGES)
+        self.assertEqual(Article.objects.get(id=self.article.id).processing_status, 'pending')
+
+        worker._run_job(AnalysisJob.objects.claim('w1', visibility_timeout=60), 'w1')
+        self.assertEqual(stages(), [ArticleProgress.STAGE_RETRYING, ArticleProgress.STAGE_FAILED])
+        self.assertIn(ArticleProgress.STAGE_FAILED, ArticleProgress.TERMINAL_STAGES)
+
+
+class ArticleLinkCounterTests(TestCase):
+    """연결 행 일괄 생성/삭제 시 연결 수 카운터와 언급 수 집계 유지 (ArticleLinkQuerySet)"""
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username='counter-test')
+        self.articles = [
+            Article.objects.create(user=user, title=f't{i}', url=f'https://example.com/{i}', content='c')
+            for i in range(2)
+        ]
+        self.concepts = [Concept.objects.create(name=f'개념{i}') for i in range(2)]
+        self.entity = Entity.objects.create(name='SKT', entity_type='조직')
+
+    def assertStaleRows(self, expected):
+        """repair_counters --dry-run이 보고하는 틀린 행 수"""
+        out = StringIO()
+        call_command('repair_counters', '--dry-run', stdout=out)
+        self.assertEqual(int(re.search(r'total: (\d+) rows', out.getvalue()).group(1)), expected, out.getvalue())
+
+    def refresh(self, *objs):
+        for obj in objs:
+            obj.refresh_from_db()
+
+    def test_bulk_create_counts_only_inserted_links(self):
+        a0, a1 = self.articles
+        c0, c1 = self.concepts
+        ArticleConcept.objects.bulk_create([ArticleConcept(article=a0, concept=c0)])
+        ArticleConcept.objects.bulk_create([
+            ArticleConcept(article=a0, concept=c0),  # 이미 있는 연결
+            ArticleConcept(article=a0, concept=c1),
+            ArticleConcept(article=a1, concept=c0),
+            ArticleConcept(article=a1, concept=c0),  # 같은 배치 안의 중복
+        ], ignore_conflicts=True)
+        ArticleEntity.objects.bulk_create([
+            ArticleEntity(article=a0, entity=self.entity, mention_count=3),
+            ArticleEntity(article=a1, entity=self.entity, mention_count=2),
+        ], ignore_conflicts=True)
+
+        self.refresh(a0, a1, c0, c1, self.entity)
+        self.assertEqual((a0.concept_count, a1.concept_count), (2, 1))
+        self.assertEqual((c0.article_count, c1.article_count), (2, 1))
+        self.assertEqual((a0.entity_count, self.entity.article_count), (1, 2))
+        self.assertEqual(EntityMentionRollup.objects.get(entity=self.entity).mention_count, 5)
+        self.assertStaleRows(0)
+
+    def test_delete_and_cascade_decrement_counters(self):
+        a0, a1 = self.articles
+        c0, c1 = self.concepts
+        ArticleConcept.objects.bulk_create([
+            ArticleConcept(article=article, concept=concept) for article in self.articles for concept in self.concepts
+        ])
+        ArticleEntity.objects.bulk_create([
+            ArticleEntity(article=article, entity=self.entity, mention_count=2) for article in self.articles
+        ])
+
+        ArticleConcept.objects.filter(concept=c1).delete()
+        ArticleEntity.objects.filter(article=a0).delete()
+        self.refresh(a0, a1, c0, c1, self.entity)
+        self.assertEqual((a0.concept_count, a1.concept_count, c0.article_count, c1.article_count), (1, 1, 2, 0))
+        self.assertEqual((a0.entity_count, a1.entity_count, self.entity.article_count), (0, 1, 1))
+        self.assertEqual(EntityMentionRollup.objects.get(entity=self.entity).mention_count, 2)
+        self.assertStaleRows(0)
+
+        # 부모 삭제로 연결 행이 CASCADE 삭제돼도 상대편 카운터가 줄어듦
+        c0.delete()
+        a1.delete()
+        self.refresh(a0, self.entity)
+        self.assertEqual((a0.concept_count, self.entity.article_count), (0, 0))
+        self.assertStaleRows(0)
+
+    def test_instance_save_keeps_maintained_counters(self):
+        event = Event.objects.create(name='사건')
+        # 연결 전에 읽어 둔 인스턴스 (카운터가 0인 오래된 값)
+        stale = [Article.objects.get(id=self.articles[0].id), Concept.objects.get(id=self.concepts[0].id),
+                 Entity.objects.get(id=self.entity.id), Event.objects.get(id=event.id)]
+
+        ArticleConcept.objects.bulk_create([ArticleConcept(article=self.articles[0], concept=self.concepts[0])])
+        ArticleEntity.objects.bulk_create([ArticleEntity(article=self.articles[0], entity=self.entity, mention_count=1)])
+        ArticleEvent.objects.bulk_create([ArticleEvent(article=self.articles[0], event=event)])
+
+        article, concept, entity, event = stale
+        article.summary = '수정'
+        for obj in (concept, entity, event):
+            obj.description = '수정'
+        for obj in stale:
+            obj.save()
+
+        self.refresh(article, concept, entity, event)
+        self.assertEqual((article.concept_count, article.entity_count), (1, 1))
+        self.assertEqual((concept.article_count, entity.article_count, event.article_count), (1, 1, 1))
+        self.assertEqual((article.summary, entity.description, event.description), ('수정', '수정', '수정'))
+        self.assertStaleRows(0)
+
+    def test_dry_run_reports_drifted_counters(self):
+        ArticleConcept.objects.bulk_create([ArticleConcept(article=self.articles[0], concept=self.concepts[0])])
+        Concept.objects.filter(id=self.concepts[0].id).update(article_count=5)
+
+        self.assertStaleRows(1)
+        call_command('repair_counters', stdout=StringIO())
+        self.assertStaleRows(0)
+        self.assertEqual(Concept.objects.get(id=self.concepts[0].id).article_count, 1)
+
+
+class RelatedArticleLinkTests(TestCase):
+    """공유 개념/이벤트 기반 관련 기사 연결 (ArticleProcessor.find_and_link_related_articles)"""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='related-test')
+        self.concepts = [Concept.objects.create(name=f'개념{i}') for i in range(3)]
+        self.event = Event.objects.create(name='사건')
+        self.article = self.add_article('source', self.concepts, event=True)
+
+    def add_article(self, name, concepts, event=False):
+        article = Article.objects.create(user=self.user, title=name, url=f'https://example.com/{name}', content='c')
+        ArticleConcept.objects.bulk_create([ArticleConcept(article=article, concept=concept) for concept in concepts])
+        if event:
+            ArticleEvent.objects.create(article=article, event=self.event)
+        return article
+
+    def links(self):
+        return list(ArticleRelationship.objects.filter(source_article=self.article).order_by('-similarity_score', 'id')
+                    .values_list('target_article__title', 'relationship_type', 'similarity_score'))
+
+    def test_scores_shared_events_and_concepts_in_one_query(self):
+        self.add_article('same-event', [], event=True)
+        self.add_article('three-concepts', self.concepts)
+        self.add_article('one-concept', self.concepts[:1])
+        self.add_article('unrelated', [Concept.objects.create(name='기타')])
+
+        # 후보 점수 계산 1회 + 관계 일괄 저장 1회 (후보 수와 무관)
+        with self.assertNumQueries(2):
+            self.assertTrue(ArticleProcessor().find_and_link_related_articles(self.article))
+
+        self.assertEqual(self.links(), [
+            ('same-event', 'RELATED_TO', 0.8),
+            ('three-concepts', 'RELATED_BY_CONCEPT', 0.8),
+            ('one-concept', 'RELATED_BY_CONCEPT', 0.6),
+        ])
+
+    @override_settings(RELATED_ARTICLE_TOP_K=1, RELATED_ARTICLE_MIN_SCORE=0.7)
+    def test_keeps_top_k_above_min_score(self):
+        self.add_article('one-concept', self.concepts[:1])
+        self.add_article('two-concepts', self.concepts[:2])
+        self.add_article('three-concepts', self.concepts)
+
+        ArticleProcessor().find_and_link_related_articles(self.article)
+        self.assertEqual(self.links(), [('three-concepts', 'RELATED_BY_CONCEPT', 0.8)])
+
+
+class GraphEngineRefreshTests(TestCase):
+    """그래프 엔진 증분 반영이 전체 재적재와 같은 그래프를 만드는지 (api.versioned.v1.utils.graph_engine)"""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='graph-test')
+        self.concepts = [Concept.objects.create(name=f'개념{i}') for i in range(4)]
+        self.event = Event.objects.create(name='사건')
+        self.articles = [self.add_article(i, self.concepts[i:i + 2]) for i in range(2)]
+        ConceptRelationship.objects.create(
+            source_concept=self.concepts[0], target_concept=self.concepts[1], relationship_type='RELATED_TO', weight=0.5
+        )
+
+    def add_article(self, number, concepts):
+        article = Article.objects.create(user=self.user, title=f't{number}', url=f'https://example.com/{number}',
+                                         content='c')
+        ArticleConcept.objects.bulk_create([ArticleConcept(article=article, concept=c, confidence=0.9) for c in concepts])
+        ArticleEvent.objects.create(article=article, event=self.event, confidence=0.8)
+        return article
+
+    def engine(self):
+        return GraphEngine(refresh_interval=0, rebuild_interval=3600, snapshot_path='')
+
+    def graph_of(self, engine):
+        """노드 인덱스에 의존하지 않는 비교용 그래프 (노드별 연결 수, 조회 결과)"""
+        labels, ids, degrees, _ = engine.ranks()
+        nodes = {(LABELS[label], int(node_id)): int(degree) for label, node_id, degree in zip(labels, ids, degrees)}
+        article_graphs = []
+        for article in self.articles:
+            graph = engine.get_article_knowledge_graph(article.id)
+            keys = {node['id']: (node['labels'][0], node['properties']['id']) for node in graph['nodes']}
+            article_graphs.append(sorted((keys[edge['from']], keys[edge['to']], edge['type']) for edge in graph['edges']))
+        return {
+            'nodes': nodes,
+            'related': [engine.find_related_concepts(concept.id) for concept in self.concepts],
+            'similar': [engine.find_similar_articles(article.id) for article in self.articles],
+            'article_graphs': article_graphs,
+        }
+
+    def add_rows(self):
+        self.articles.append(self.add_article(2, self.concepts[2:]))
+        ConceptRelationship.objects.create(
+            source_concept=self.concepts[3], target_concept=self.concepts[0], relationship_type='PART_OF', weight=0.7
+        )
+
+    def test_incremental_refresh_matches_full_rebuild(self):
+        engine = self.engine()
+        engine.rebuild()
+        self.add_rows()
+        engine.refresh()
+
+        self.assertGreater(engine.stats()['delta_edges'], 0)
+        rebuilt = self.engine()
+        rebuilt.rebuild()
+        self.assertEqual(self.graph_of(engine), self.graph_of(rebuilt))
+        self.assertEqual(rebuilt.stats()['delta_edges'], 0)
+
+    def test_snapshot_load_then_refresh_matches_full_rebuild(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'graph.npz')
+
+        built = self.engine()
+        built.rebuild()
+        built.save_snapshot(path)
+        self.add_rows()
+
+        rebuilt = self.engine()
+        rebuilt.rebuild()
+        expected = self.graph_of(rebuilt)
+
+        # 첫 조회는 전체 스캔 없이 스냅샷을 읽고 저장 이후의 행만 증분 반영
+        loaded = GraphEngine(refresh_interval=0, rebuild_interval=3600, snapshot_path=path)
+        with mock.patch.object(GraphEngine, 'rebuild', side_effect=AssertionError("전체 재적재가 호출됨")):
+            self.assertEqual(self.graph_of(loaded), expected)
+        self.assertEqual(loaded.stats()['edges'], rebuilt.stats()['edges'])
+
+    def test_cold_start_without_snapshot_rebuilds_off_the_request_thread(self):
+        engine = self.engine()
+        threads = []
+        with mock.patch.object(GraphEngine, 'rebuild', autospec=True,
+                               side_effect=lambda engine: threads.append(threading.current_thread())):
+            with self.assertRaises(GraphEngineLoading):
+                engine.find_similar_articles(self.articles[0].id)
+            engine._rebuild_thread.join()
+
+            # 적재되지 않은 채 스레드가 끝났으면 다음 조회가 백그라운드 적재를 다시 시작
+            with self.assertRaises(GraphEngineLoading):
+                engine.find_related_concepts(self.concepts[0].id)
+            engine._rebuild_thread.join()
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertFalse(engine.stats()['loaded'])
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ConceptConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "concept"
+
+    def ready(self):
+        from concept import signals  # noqa: F401
@@ -0,0 +1,71 @@
+# Generated by Django 5.2 on 2026-10-17 22:38
+
+from django.db import migrations, models
+
+
+def merge_duplicate_concepts(apps, schema_editor):
+    """domain 없는 같은 이름의 개념을 가장 먼저 만들어진 개념으로 병합"""
+    Concept = apps.get_model('concept', 'Concept')
+    ConceptRelationship = apps.get_model('concept', 'ConceptRelationship')
+    ArticleConcept = apps.get_model('article', 'ArticleConcept')
+
+    duplicates = (
+        Concept.objects.filter(domain__isnull=True)
+        .values('name')
+        .annotate(count=models.Count('id'), keep_id=models.Min('id'))
+        .filter(count__gt=1)
+    )
+
+    for row in duplicates:
+        keep_id = row['keep_id']
+        other_ids = list(
+            Concept.objects.filter(domain__isnull=True, name=row['name'])
+            .exclude(id=keep_id)
+            .values_list('id', flat=True)
+        )
+
+        # 기사 연결 이전 (이미 연결된 기사는 병합 대상 개념 삭제 시 함께 삭제)
+        linked = set(ArticleConcept.objects.filter(concept_id=keep_id).values_list('article_id', flat=True))
+        for article_concept in ArticleConcept.objects.filter(concept_id__in=other_ids).order_by('id'):
+            if article_concept.article_id not in linked:
+                article_concept.concept_id = keep_id
+                article_concept.save(update_fields=['concept'])
+                linked.add(article_concept.article_id)
+
+        # 개념 관계 이전 (중복 관계와 자기 자신으로의 관계는 제외)
+        existing = set(
+            ConceptRelationship.objects.filter(
+                models.Q(source_concept_id=keep_id) | models.Q(target_concept_id=keep_id)
+            ).values_list('source_concept_id', 'target_concept_id', 'relationship_type')
+        )
+        relationships = ConceptRelationship.objects.filter(
+            models.Q(source_concept_id__in=other_ids) | models.Q(target_concept_id__in=other_ids)
+        ).order_by('id')
+        for relationship in relationships:
+            source_id = keep_id if relationship.source_concept_id in other_ids else relationship.source_concept_id
+            target_id = keep_id if relationship.target_concept_id in other_ids else relationship.target_concept_id
+            key = (source_id, target_id, relationship.relationship_type)
+            if source_id == target_id or key in existing:
+                continue
+            relationship.source_concept_id = source_id
+            relationship.target_concept_id = target_id
+            relationship.save(update_fields=['source_concept', 'target_concept'])
+            existing.add(key)
+
+        Concept.objects.filter(id__in=other_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('concept', '0001_initial'),
+        ('article', '0004_articleprogress'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_concepts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='concept',
+            constraint=models.UniqueConstraint(condition=models.Q(('domain__isnull', True)), fields=('name',), name='unique_concept_name_without_domain'),
+        ),
+    ]
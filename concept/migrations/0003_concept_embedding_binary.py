@@ -0,0 +1,56 @@
+# Generated by Django 5.2 on 2026-10-17 23:05
+
+import numpy as np
+from django.db import migrations, models
+
+
+def json_to_binary(apps, schema_editor):
+    """JSON 리스트 임베딩을 float16 바이트로 변환"""
+    Concept = apps.get_model('concept', 'Concept')
+    batch = []
+    for concept in Concept.objects.filter(embedding__isnull=False).only('id', 'embedding').iterator(chunk_size=2000):
+        concept.embedding_binary = np.asarray(concept.embedding, dtype=np.float16).tobytes()
+        batch.append(concept)
+        if len(batch) >= 2000:
+            Concept.objects.bulk_update(batch, ['embedding_binary'])
+            batch = []
+    if batch:
+        Concept.objects.bulk_update(batch, ['embedding_binary'])
+
+
+def binary_to_json(apps, schema_editor):
+    Concept = apps.get_model('concept', 'Concept')
+    batch = []
+    for concept in Concept.objects.filter(embedding_binary__isnull=False).only('id', 'embedding_binary').iterator(chunk_size=2000):
+        concept.embedding = np.frombuffer(concept.embedding_binary, dtype=np.float16).astype(float).tolist()
+        batch.append(concept)
+        if len(batch) >= 2000:
+            Concept.objects.bulk_update(batch, ['embedding'])
+            batch = []
+    if batch:
+        Concept.objects.bulk_update(batch, ['embedding'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('concept', '0002_unique_concept_name_without_domain'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='concept',
+            name='embedding_binary',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.RunPython(json_to_binary, binary_to_json),
+        migrations.RemoveField(
+            model_name='concept',
+            name='embedding',
+        ),
+        migrations.RenameField(
+            model_name='concept',
+            old_name='embedding_binary',
+            new_name='embedding',
+        ),
+    ]
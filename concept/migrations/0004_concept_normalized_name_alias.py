@@ -0,0 +1,61 @@
+# Generated by Django 5.2 on 2026-10-17 22:49
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 마이그레이션 작성 시점의 이름 정규화 규칙 (이후 앱 코드가 바뀌어도 이 마이그레이션 결과는 고정)
+NAME_SEPARATOR_RE = re.compile(r'[\s\-_·‧.,/]+')
+
+
+def name_key(name):
+    """이름 비교 키 (유니코드 정규화, 대소문자·공백·구분 기호 무시)"""
+    return NAME_SEPARATOR_RE.sub('', unicodedata.normalize('NFKC', str(name or '')).casefold())
+
+
+def backfill_normalized_names(apps, schema_editor):
+    """기존 개념의 정규화 이름 채우기"""
+    Concept = apps.get_model('concept', 'Concept')
+    batch = []
+    for concept in Concept.objects.only('id', 'name').iterator(chunk_size=2000):
+        concept.normalized_name = name_key(concept.name)
+        batch.append(concept)
+        if len(batch) >= 2000:
+            Concept.objects.bulk_update(batch, ['normalized_name'])
+            batch = []
+    if batch:
+        Concept.objects.bulk_update(batch, ['normalized_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('concept', '0003_concept_embedding_binary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='concept',
+            name='normalized_name',
+            field=models.CharField(blank=True, db_index=True, max_length=255),
+        ),
+        migrations.RunPython(backfill_normalized_names, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='ConceptAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=255)),
+                ('normalized_alias', models.CharField(max_length=255, unique=True)),
+                ('method', models.CharField(choices=[('created', '새 개념'), ('normalized', '정규화 이름 일치'), ('embedding', '임베딩 유사도'), ('manual', '수동 지정')], default='normalized', max_length=20)),
+                ('similarity', models.FloatField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('concept', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='concept.concept')),
+            ],
+            options={
+                'verbose_name': '개념 별칭',
+                'verbose_name_plural': '개념 별칭 목록',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-17 23:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('concept', '0004_concept_normalized_name_alias'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='concept',
+            name='graph_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='concept',
+            name='graph_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
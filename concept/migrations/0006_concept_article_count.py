@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 23:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('concept', '0005_concept_graph_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='concept',
+            name='article_count',
+            field=models.IntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-17 23:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('concept', '0006_concept_article_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='concept',
+            index=models.Index(fields=['-created_at', '-id'], name='concept_con_created_b10493_idx'),
+        ),
+    ]
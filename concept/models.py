@@ -2,6 +2,8 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
+from concept.utils import name_key
+
 User = get_user_model()
 
 class ConceptDomain(models.Model):
@@ -22,13 +24,20 @@ class ConceptDomain(models.Model):
 class Concept(models.Model):
     """기사에서 추출된 핵심 아이디어나 주제"""
     name = models.CharField(max_length=255)
+    normalized_name = models.CharField(max_length=255, blank=True, db_index=True)  # 이름 비교 키 (대소문자·공백 무시)
     description = models.TextField(blank=True)
     confidence = models.FloatField(default=0.0)  # 개념 추출 확신도
     domain = models.ForeignKey(ConceptDomain, null=True, blank=True, on_delete=models.SET_NULL, related_name='concepts')
-    embedding = models.JSONField(null=True, blank=True)  # 벡터 임베딩 저장
+    embedding = models.BinaryField(null=True, blank=True)  # 벡터 임베딩 (float16 바이트)
+    article_count = models.IntegerField(default=0)  # 연결된 기사 수 (ArticleLinkQuerySet/article.signals가 유지)
+    graph_version = models.PositiveIntegerField(default=0)  # 관련 개념/그래프 응답 캐시 버전 (캡처가 이 개념을 건드리면 증가)
+    graph_updated_at = models.DateTimeField(null=True, blank=True)  # 그래프가 마지막으로 바뀐 시각 (Last-Modified)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # F() 식 UPDATE로만 바뀌는 컬럼 (인스턴스 save()가 읽어 둔 오래된 값으로 덮어쓰지 않도록 제외)
+    MAINTAINED_FIELDS = ('article_count', 'graph_version', 'graph_updated_at')
+    
     def __str__(self):
         return self.name
     
@@ -36,12 +45,71 @@ class Concept(models.Model):
         verbose_name = '개념'
         verbose_name_plural = '개념 목록'
         unique_together = ('name', 'domain')
+        indexes = [
+            models.Index(fields=['-created_at', '-id']),  # 목록 키셋 페이지네이션
+        ]
+        constraints = [
+            # domain이 NULL이면 unique_together가 적용되지 않으므로 이름 중복을 별도로 막음
+            models.UniqueConstraint(
+                fields=['name'],
+                condition=models.Q(domain__isnull=True),
+                name='unique_concept_name_without_domain'
+            ),
+        ]
+    
+    def save(self, *args, **kwargs):
+        self.normalized_name = name_key(self.name)
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.MAINTAINED_FIELDS
+            ]
+        super().save(*args, **kwargs)
     
     def generate_embedding(self):
-        """개념에 대한 벡터 임베딩 생성"""
-        # 임베딩 생성 로직 구현
-        # TODO: 실제 임베딩 생성 로직 구현
-        pass
+        """개념에 대한 벡터 임베딩 생성 (여러 개념은 embed_concepts로 한 번에 생성)"""
+        from api.versioned.v1.utils.embeddings import embed_concepts
+        
+        embed_concepts([self])
+        return self.embedding_vector
+    
+    @property
+    def embedding_vector(self):
+        """임베딩의 NumPy 뷰 (복사 없음, 읽기 전용)"""
+        from api.versioned.v1.utils.embeddings import bytes_to_vector
+        
+        return bytes_to_vector(self.embedding)
+
+
+class ConceptAlias(models.Model):
+    """개념 별칭 (정규화된 이름 → 대표 개념)"""
+    METHOD_CREATED = 'created'
+    METHOD_NORMALIZED = 'normalized'
+    METHOD_EMBEDDING = 'embedding'
+    METHOD_MANUAL = 'manual'
+    
+    alias = models.CharField(max_length=255)  # 처음 관측된 원래 이름
+    normalized_alias = models.CharField(max_length=255, unique=True)
+    concept = models.ForeignKey(Concept, on_delete=models.CASCADE, related_name='aliases')
+    method = models.CharField(
+        max_length=20,
+        choices=[
+            (METHOD_CREATED, '새 개념'),
+            (METHOD_NORMALIZED, '정규화 이름 일치'),
+            (METHOD_EMBEDDING, '임베딩 유사도'),
+            (METHOD_MANUAL, '수동 지정'),
+        ],
+        default=METHOD_NORMALIZED
+    )
+    similarity = models.FloatField(null=True, blank=True)  # 임베딩 매핑 시 코사인 유사도
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"{self.alias} -> {self.concept.name}"
+    
+    class Meta:
+        verbose_name = '개념 별칭'
+        verbose_name_plural = '개념 별칭 목록'
 
 
 class ConceptRelationship(models.Model):
@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.versioned.v1.utils.catalog_context import get_catalog_snapshot
+from concept.models import Concept, ConceptDomain
+
+
+@receiver(post_save, sender=ConceptDomain)
+def update_catalog_on_domain_save(sender, instance, created, **kwargs):
+    """도메인 생성/수정 시 카탈로그 스냅샷 갱신"""
+    if created:
+        get_catalog_snapshot().domain_created(instance)
+    else:
+        get_catalog_snapshot().invalidate()
+
+
+@receiver(post_save, sender=Concept)
+def update_catalog_on_concept_save(sender, instance, created, **kwargs):
+    """개념 생성/수정 시 카탈로그 스냅샷 갱신"""
+    if created:
+        get_catalog_snapshot().concepts_created([instance.name])
+    else:
+        get_catalog_snapshot().invalidate()
+
+
+@receiver(post_delete, sender=ConceptDomain)
+@receiver(post_delete, sender=Concept)
+def invalidate_catalog_on_delete(sender, instance, **kwargs):
+    """도메인/개념 삭제 시 카탈로그 스냅샷 무효화"""
+    get_catalog_snapshot().invalidate()
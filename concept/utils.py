@@ -0,0 +1,9 @@
+import re
+import unicodedata
+
+NAME_SEPARATOR_RE = re.compile(r'[\s\-_·‧.,/]+')
+
+
+def name_key(name):
+    """이름 비교 키 (유니코드 정규화, 대소문자·공백·구분 기호 무시)"""
+    return NAME_SEPARATOR_RE.sub('', unicodedata.normalize('NFKC', str(name or '')).casefold())
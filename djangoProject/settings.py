@@ -132,7 +132,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
+    "DEFAULT_PAGINATION_CLASS": "api.versioned.v1.utils.pagination.KeysetPagination",
     "PAGE_SIZE": 100,
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
     "DEFAULT_AUTHENTICATION_CLASSES": [
@@ -147,6 +147,9 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
 }
 
+# 목록 API 키셋 페이지네이션 (?limit=의 서버 상한)
+PAGINATION_MAX_PAGE_SIZE = int(os.environ.get('PAGINATION_MAX_PAGE_SIZE', 500))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Django Boilerplate",
     "DESCRIPTION": "Django Boilerplate API documentation generated by drf-specatular",
@@ -167,6 +170,94 @@ SPECTACULAR_SETTINGS = {
 NEO4J_URI = os.environ.get('NEO4J_URI', 'bolt://localhost:7687')
 NEO4J_USER = os.environ.get('NEO4J_USER', 'neo4j')
 NEO4J_PASSWORD = os.environ.get('NEO4J_PASSWORD', '#PASSWORD')
+NEO4J_POOL_SIZE = int(os.environ.get('NEO4J_POOL_SIZE', 10))  # 프로세스당 최대 연결 수
+NEO4J_POOL_MAX_AGE = int(os.environ.get('NEO4J_POOL_MAX_AGE', 3600))  # 초, 오래된 연결은 다시 맺음
+NEO4J_FAILURE_THRESHOLD = int(os.environ.get('NEO4J_FAILURE_THRESHOLD', 3))  # 연속 오류 수, 넘으면 회로 차단
+NEO4J_COOLDOWN = float(os.environ.get('NEO4J_COOLDOWN', 30))  # 초, 회로 차단 후 호출을 건너뛰는 시간
+
+# 그래프 동기화 아웃박스 복제 설정 (replicate_graph)
+GRAPH_SYNC_BATCH_SIZE = int(os.environ.get('GRAPH_SYNC_BATCH_SIZE', 100))  # 한 트랜잭션으로 보내는 요청 수
+GRAPH_SYNC_MAX_ATTEMPTS = int(os.environ.get('GRAPH_SYNC_MAX_ATTEMPTS', 10))
+GRAPH_SYNC_RETRY_DELAY = int(os.environ.get('GRAPH_SYNC_RETRY_DELAY', 30))  # 초, 시도 횟수에 비례해 증가
+GRAPH_SYNC_VISIBILITY_TIMEOUT = int(os.environ.get('GRAPH_SYNC_VISIBILITY_TIMEOUT', 300))  # 초
+GRAPH_SYNC_POLL_INTERVAL = float(os.environ.get('GRAPH_SYNC_POLL_INTERVAL', 2.0))  # 초
+
+# 프로세스 내 그래프 엔진 설정 (Neo4j를 쓸 수 없을 때의 그래프 조회 대체 경로)
+GRAPH_ENGINE_REFRESH_INTERVAL = float(os.environ.get('GRAPH_ENGINE_REFRESH_INTERVAL', 5))  # 초, 새 행 증분 반영 주기
+GRAPH_ENGINE_REBUILD_INTERVAL = float(os.environ.get('GRAPH_ENGINE_REBUILD_INTERVAL', 900))  # 초, 삭제 반영을 위한 전체 재적재 주기
+GRAPH_ENGINE_SNAPSHOT_PATH = os.environ.get('GRAPH_ENGINE_SNAPSHOT_PATH', str(BASE_DIR / '.cache' / 'graph_engine.npz'))  # build_graph_snapshot이 저장하는 첫 적재용 파일
+
+# 지식 그래프 조회 크기 (ConceptViewSet.knowledge_graph)
+KNOWLEDGE_GRAPH_DEFAULT_LIMIT = int(os.environ.get('KNOWLEDGE_GRAPH_DEFAULT_LIMIT', 100))
+KNOWLEDGE_GRAPH_MAX_LIMIT = int(os.environ.get('KNOWLEDGE_GRAPH_MAX_LIMIT', 500))  # 요청 limit의 서버 상한
+
+# 캐시 설정 ('graph'는 기사/개념 그래프 응답 캐시, 키에 그래프 버전이 포함되어 갱신 시 자동으로 무효화)
+GRAPH_CACHE_BACKEND = os.environ.get('GRAPH_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+GRAPH_CACHE_LOCATION = os.environ.get('GRAPH_CACHE_LOCATION', 'graph')  # 예: redis://localhost:6379/1
+GRAPH_CACHE_TIMEOUT = int(os.environ.get('GRAPH_CACHE_TIMEOUT', 3600))  # 초
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'graph': {
+        'BACKEND': GRAPH_CACHE_BACKEND,
+        'LOCATION': GRAPH_CACHE_LOCATION,
+        'TIMEOUT': GRAPH_CACHE_TIMEOUT,
+    },
+}
 
 # OpenAI API 키
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '#PASSWORD')
+
+# 기사 분석 작업 큐 설정 (run_analysis_worker)
+ANALYSIS_WORKER_CONCURRENCY = int(os.environ.get('ANALYSIS_WORKER_CONCURRENCY', 2))
+ANALYSIS_JOB_VISIBILITY_TIMEOUT = int(os.environ.get('ANALYSIS_JOB_VISIBILITY_TIMEOUT', 600))  # 초
+ANALYSIS_JOB_MAX_ATTEMPTS = int(os.environ.get('ANALYSIS_JOB_MAX_ATTEMPTS', 3))
+ANALYSIS_JOB_RETRY_DELAY = int(os.environ.get('ANALYSIS_JOB_RETRY_DELAY', 30))  # 초, 시도 횟수에 비례해 증가
+ANALYSIS_WORKER_POLL_INTERVAL = float(os.environ.get('ANALYSIS_WORKER_POLL_INTERVAL', 2.0))  # 초
+
+# 웹 페이지 수집 설정
+CAPTURE_FETCH_POOL_SIZE = int(os.environ.get('CAPTURE_FETCH_POOL_SIZE', 32))  # 호스트별 keep-alive 연결 수
+CAPTURE_FETCH_CONNECT_TIMEOUT = float(os.environ.get('CAPTURE_FETCH_CONNECT_TIMEOUT', 5))  # 초
+CAPTURE_FETCH_READ_TIMEOUT = float(os.environ.get('CAPTURE_FETCH_READ_TIMEOUT', 15))  # 초, 소켓 읽기 간격 기준
+CAPTURE_FETCH_TOTAL_TIMEOUT = float(os.environ.get('CAPTURE_FETCH_TOTAL_TIMEOUT', 30))  # 초, 본문 수신 전체 시간
+CAPTURE_FETCH_MAX_BYTES = int(os.environ.get('CAPTURE_FETCH_MAX_BYTES', 5 * 1024 * 1024))
+CAPTURE_FETCH_CACHE_DIR = os.environ.get('CAPTURE_FETCH_CACHE_DIR', str(BASE_DIR / '.cache' / 'http'))  # 빈 값이면 캐시 사용 안 함
+CAPTURE_EXTRACT_MIN_LENGTH = int(os.environ.get('CAPTURE_EXTRACT_MIN_LENGTH', 200))  # 이보다 짧은 본문은 다음 추출 방법으로 재시도
+CAPTURE_BATCH_CONCURRENCY = int(os.environ.get('CAPTURE_BATCH_CONCURRENCY', 16))  # 일괄 캡처 동시 수집 수
+CAPTURE_BATCH_MAX_URLS = int(os.environ.get('CAPTURE_BATCH_MAX_URLS', 500))
+
+# LLM 응답 캐시 (본문 해시, 모델, 프롬프트 버전 기준, 빈 값이면 사용 안 함)
+LLM_CACHE_PATH = os.environ.get('LLM_CACHE_PATH', str(BASE_DIR / '.cache' / 'llm_cache.sqlite3'))
+LLM_CACHE_MAX_BYTES = int(os.environ.get('LLM_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+# 분석 프롬프트용 카탈로그 스냅샷 유효 시간 (초, 다른 프로세스의 변경 반영 주기)
+CATALOG_SNAPSHOT_TTL = float(os.environ.get('CATALOG_SNAPSHOT_TTL', 300))
+
+# 긴 기사 청크 분석 설정
+ANALYSIS_CHUNK_MAX_TOKENS = int(os.environ.get('ANALYSIS_CHUNK_MAX_TOKENS', 6000))  # 청크당 본문 토큰 수 (근사치)
+ANALYSIS_CHUNK_CONCURRENCY = int(os.environ.get('ANALYSIS_CHUNK_CONCURRENCY', 4))
+
+# 관련 기사 연결 설정 (점수 상위 K개만 저장)
+RELATED_ARTICLE_TOP_K = int(os.environ.get('RELATED_ARTICLE_TOP_K', 20))
+RELATED_ARTICLE_MIN_SCORE = float(os.environ.get('RELATED_ARTICLE_MIN_SCORE', 0.6))
+
+# 캡처 진행 상황 스트림(SSE) 설정
+CAPTURE_PROGRESS_POLL_INTERVAL = float(os.environ.get('CAPTURE_PROGRESS_POLL_INTERVAL', 0.5))  # 초
+CAPTURE_PROGRESS_STREAM_WINDOW = float(os.environ.get('CAPTURE_PROGRESS_STREAM_WINDOW', 20))  # 한 응답을 열어 두는 시간(초), 이후 클라이언트가 재연결
+CAPTURE_PROGRESS_RETRY_INTERVAL = float(os.environ.get('CAPTURE_PROGRESS_RETRY_INTERVAL', 1))  # 재연결 간격(초)
+CAPTURE_PROGRESS_STREAM_TIMEOUT = float(os.environ.get('CAPTURE_PROGRESS_STREAM_TIMEOUT', 300))  # 마지막 단계 이후 새 단계가 없으면 timeout 이벤트를 보내는 시간(초)
+
+# 임베딩 설정 (로컬 sentence-transformers 모델, 개념/기사 요약 의미 검색용)
+EMBEDDING_MODEL = os.environ.get('EMBEDDING_MODEL', 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2')
+EMBEDDING_DEVICE = os.environ.get('EMBEDDING_DEVICE', 'cpu')
+EMBEDDING_BATCH_SIZE = int(os.environ.get('EMBEDDING_BATCH_SIZE', 64))  # 순전파 1회당 텍스트 수
+EMBEDDING_ON_ANALYSIS = os.environ.get('EMBEDDING_ON_ANALYSIS', 'true').lower() == 'true'  # 분석 완료 시 새 개념/요약 임베딩
+
+# 벡터 인덱스 설정 (IVF, build_vector_index로 재구성)
+VECTOR_INDEX_DIR = os.environ.get('VECTOR_INDEX_DIR', str(BASE_DIR / '.cache' / 'vector_index'))
+VECTOR_INDEX_NPROBE = int(os.environ.get('VECTOR_INDEX_NPROBE', 8))  # 검색 시 비교하는 클러스터 수
+
+# 개념 대표화: 새 개념 이름의 임베딩이 기존 개념과 이 값 이상으로 유사하면 같은 개념으로 매핑 (0이면 사용 안 함)
+CONCEPT_CANONICAL_SIMILARITY = float(os.environ.get('CONCEPT_CANONICAL_SIMILARITY', 0.9))
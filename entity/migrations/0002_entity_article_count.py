@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 23:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entity', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entity',
+            name='article_count',
+            field=models.IntegerField(default=0),
+        ),
+    ]
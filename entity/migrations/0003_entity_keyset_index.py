@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-17 23:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entity', '0002_entity_article_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='entity',
+            index=models.Index(fields=['-created_at', '-id'], name='entity_enti_created_3b78cd_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-17 23:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from api.versioned.v1.utils.link_counters import recount_entity_mentions
+
+
+def backfill_entity_mentions(apps, schema_editor):
+    """기존 ArticleEntity 행으로 엔티티 언급 수 집계 채우기"""
+    recount_entity_mentions(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('article', '0010_article_keyset_index'),
+        ('entity', '0003_entity_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntityMentionRollup',
+            fields=[
+                ('entity', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='mention_rollup', serialize=False, to='entity.entity')),
+                ('entity_type', models.CharField(max_length=50)),
+                ('mention_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': '엔티티 언급 집계',
+                'verbose_name_plural': '엔티티 언급 집계 목록',
+                'indexes': [models.Index(fields=['-mention_count', '-entity'], name='entity_enti_mention_14edab_idx'), models.Index(fields=['entity_type', '-mention_count', '-entity'], name='entity_enti_entity__62e233_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_entity_mentions, migrations.RunPython.noop),
+    ]
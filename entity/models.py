@@ -1,4 +1,7 @@
+from collections import defaultdict
+
 from django.db import models
+from django.db.models import F
 
 # Create your models here.
 class Entity(models.Model):
@@ -6,13 +9,76 @@ class Entity(models.Model):
     name = models.CharField(max_length=255)
     entity_type = models.CharField(max_length=50)  # 조직, 인물, 제품, 기술 등
     description = models.TextField(blank=True)
+    article_count = models.IntegerField(default=0)  # 연결된 기사 수 (ArticleLinkQuerySet/article.signals가 유지)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # F() 식 UPDATE로만 바뀌는 컬럼 (인스턴스 save()가 읽어 둔 오래된 값으로 덮어쓰지 않도록 제외)
+    MAINTAINED_FIELDS = ('article_count',)
+    
     def __str__(self):
         return f"{self.name} ({self.entity_type})"
     
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.MAINTAINED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+    
     class Meta:
         verbose_name = '엔티티'
         verbose_name_plural = '엔티티 목록'
-        unique_together = ('name', 'entity_type')
\ No newline at end of file
+        unique_together = ('name', 'entity_type')
+        indexes = [
+            models.Index(fields=['-created_at', '-id']),  # 목록 키셋 페이지네이션
+        ]
+
+
+class EntityMentionRollupManager(models.Manager):
+    def add_mentions(self, deltas):
+        """
+        엔티티별 언급 수 증감 반영 ({엔티티 id: 증감량})
+        
+        집계 행이 없으면 먼저 만들고, 증감량이 같은 엔티티끼리 묶어 F() 식 UPDATE 한 번으로 처리합니다.
+        """
+        deltas = {entity_id: delta for entity_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        
+        self.bulk_create([
+            EntityMentionRollup(entity_id=entity_id, entity_type=entity_type)
+            for entity_id, entity_type in Entity.objects.filter(id__in=deltas).values_list('id', 'entity_type')
+        ], ignore_conflicts=True)
+        
+        ids_by_delta = defaultdict(list)
+        for entity_id, delta in deltas.items():
+            ids_by_delta[delta].append(entity_id)
+        for delta, ids in ids_by_delta.items():
+            self.filter(entity_id__in=ids).update(mention_count=F('mention_count') + delta)
+
+
+class EntityMentionRollup(models.Model):
+    """
+    엔티티별 언급 수 집계 (많이 언급된 엔티티 상위 N 조회용)
+    
+    ArticleEntity 행이 추가/삭제될 때 증분으로 갱신되며, repair_counters로 다시 계산할 수 있습니다.
+    entity_type은 유형별 상위 N 조회를 인덱스로 처리하기 위해 복사해 둔 값입니다.
+    """
+    entity = models.OneToOneField(Entity, on_delete=models.CASCADE, primary_key=True, related_name='mention_rollup')
+    entity_type = models.CharField(max_length=50)
+    mention_count = models.IntegerField(default=0)  # 모든 기사에서의 언급 횟수 합계
+    
+    objects = EntityMentionRollupManager()
+    
+    def __str__(self):
+        return f"{self.entity_id}: {self.mention_count}"
+    
+    class Meta:
+        verbose_name = '엔티티 언급 집계'
+        verbose_name_plural = '엔티티 언급 집계 목록'
+        indexes = [
+            models.Index(fields=['-mention_count', '-entity']),
+            models.Index(fields=['entity_type', '-mention_count', '-entity']),
+        ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 23:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('concept', '0007_concept_keyset_index'),
+        ('event', '0002_event_article_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['-created_at', '-id'], name='event_event_created_cdd8bd_idx'),
+        ),
+    ]
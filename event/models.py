@@ -12,14 +12,29 @@ class Event(models.Model):
     event_date = models.DateField(null=True, blank=True)
     event_type = models.CharField(max_length=100, blank=True)
     domain = models.ForeignKey(ConceptDomain, null=True, blank=True, on_delete=models.SET_NULL, related_name='events')
+    article_count = models.IntegerField(default=0)  # 연결된 기사 수 (ArticleLinkQuerySet/article.signals가 유지)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # F() 식 UPDATE로만 바뀌는 컬럼 (인스턴스 save()가 읽어 둔 오래된 값으로 덮어쓰지 않도록 제외)
+    MAINTAINED_FIELDS = ('article_count',)
+    
     def __str__(self):
         return self.name
     
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.MAINTAINED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+    
     class Meta:
         verbose_name = '이벤트'
         verbose_name_plural = '이벤트 목록'
+        indexes = [
+            models.Index(fields=['-created_at', '-id']),  # 목록 키셋 페이지네이션
+        ]
 
 
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.versioned.v1.utils.catalog_context import get_catalog_snapshot
+from event.models import Event
+
+
+@receiver(post_save, sender=Event)
+def update_catalog_on_event_save(sender, instance, created, **kwargs):
+    """이벤트 생성/수정 시 카탈로그 스냅샷 갱신"""
+    if created:
+        get_catalog_snapshot().event_created(instance)
+    else:
+        get_catalog_snapshot().invalidate()
+
+
+@receiver(post_delete, sender=Event)
+def invalidate_catalog_on_event_delete(sender, instance, **kwargs):
+    """이벤트 삭제 시 카탈로그 스냅샷 무효화"""
+    get_catalog_snapshot().invalidate()